@@ -0,0 +1,53 @@
+"""
+Wall-clock startup time of the CLI for commands that only touch portfolio files.
+
+    python benchmarks/startup.py [runs]
+
+Each run starts a fresh interpreter, so the numbers include Python's own
+startup as well as importing the CLI and the command that gets invoked.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+COMMANDS = [
+    ["--help"],
+    ["list-portfolios"],
+    ["update-risk", "--help"],
+    ["describe", "--help"],
+]
+
+
+def time_command(args, runs, env):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", "from invest_assist.__main__ import main; main()", *args],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as portfolio_home:
+        env = dict(os.environ, PORTFOLIO_HOME=portfolio_home)
+        for args in COMMANDS:
+            timings = time_command(args, runs, env)
+            print(
+                f"stock {' '.join(args):<24} median {statistics.median(timings):6.1f} ms"
+                f"  min {min(timings):6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
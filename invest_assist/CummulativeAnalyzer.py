@@ -1,36 +1,61 @@
-from typing import List
+from typing import Dict, List
+import numpy as np
 
 from invest_assist.models import CumulativeAnalysisResult, HighLowTradesAnalysisResult
+from invest_assist.statistics import STATISTICS
+
+
+RESULT_FIELDS = list(HighLowTradesAnalysisResult.model_fields.keys())
 
 
 class CumulativeAnalyzer:
-    def __init__(self, tradeAnalysisResults: List[HighLowTradesAnalysisResult], type: str) -> None:
+    """
+    Averages the per-symbol results of one high/low pair over the symbols
+    with at least 20 trades. Results can be given as models or as one array
+    per HighLowTradesAnalysisResult field, e.g. from SweepStore.result_columns.
+
+    The distribution statistics are the median over those symbols instead:
+    the mean of per-symbol percentiles isn't a percentile of anything, and
+    one symbol without losses, whose ratios are capped at MAX_RATIO, would
+    swamp the mean expectancy and profit factor.
+    """
+
+    def __init__(
+        self,
+        tradeAnalysisResults: List[HighLowTradesAnalysisResult] | Dict[str, np.ndarray],
+        type: str,
+    ) -> None:
+        if isinstance(tradeAnalysisResults, list):
+            tradeAnalysisResults = {
+                field: np.array(
+                    [getattr(result, field) for result in tradeAnalysisResults],
+                    dtype=np.float64,
+                )
+                for field in RESULT_FIELDS
+            }
         self.tradeAnalysisResults = tradeAnalysisResults
         self.type = type
 
     def analyse(self) -> CumulativeAnalysisResult:
-        valid_trades = [trade for trade in self.tradeAnalysisResults if trade.total_trades >= 20]
+        valid = self.tradeAnalysisResults["total_trades"] >= 20
+        total_analysis = np.count_nonzero(valid)
 
-        if len(valid_trades) == 0:
+        if total_analysis == 0:
             return CumulativeAnalysisResult(type= self.type)
-        total_analysis = len(valid_trades) 
-        total_trades = sum([trade.total_trades for trade in valid_trades])
-        profitable_trades = sum([trade.profitable_trades for trade in valid_trades])
-        days = sum([trade.days for trade in valid_trades])
-        returns = sum([trade.returns for trade in valid_trades])
-        returns_on_risk = sum([trade.returns_on_risk for trade in valid_trades])
-        risk_on_investment = sum([trade.risk_on_investment for trade in valid_trades])
+
+        averages = {
+            field: round(
+                np.median(values[valid]).item()
+                if field in STATISTICS
+                else values[valid].sum().item() / total_analysis,
+                2,
+            )
+            for field, values in self.tradeAnalysisResults.items()
+            if field != "total_trades"
+        }
 
         return CumulativeAnalysisResult(
             type= self.type,
-            total_trades=total_trades,
-            profitable_trades=round(profitable_trades / total_analysis, 2),
-            days=round(days / total_analysis, 2),
-            returns=round(returns / total_analysis, 2),
-            returns_on_risk=round(returns_on_risk / total_analysis, 2),
-            risk_on_investment=round(risk_on_investment / total_analysis, 2),
+            total_trades=int(self.tradeAnalysisResults["total_trades"][valid].sum()),
+            **averages,
         )
-        
-
-        
-
@@ -1,9 +1,14 @@
 from typing import List
+import numpy as np
 from invest_assist.models import HighLowTrade, HighLowTradesAnalysisResult
+from invest_assist.statistics import trade_statistics
+from invest_assist.trade_ledger import TradeLedger
 
 
 class HighLowAnalyzer:
-    def __init__(self, data: List[HighLowTrade]):
+    def __init__(self, data: List[HighLowTrade] | TradeLedger):
+        if not isinstance(data, TradeLedger):
+            data = TradeLedger.from_high_low_trades(data)
         self.data = data
 
     def analyze(self) -> HighLowTradesAnalysisResult:
@@ -12,26 +17,17 @@ class HighLowAnalyzer:
         if total_trades == 0:
             return HighLowTradesAnalysisResult()
 
-        profitable_trades = 0
-        total_returns = 0
-        total_returns_on_risk = 0
-        total_risk_on_investment = 0
-        total_days = 0
-
-
-        for trade in self.data:
-            profitable_trades += 1 if trade.returns() > 0 else 0
-            total_returns += trade.returns()
-            total_returns_on_risk += trade.returns_on_risk()
-            total_risk_on_investment += trade.risk_on_investment()
-            total_days += trade.days()
-
+        returns = self.data.returns()
+        risk = self.data.risk()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns_on_risk = np.where(risk == 0, 0.0, returns / risk)
 
         return HighLowTradesAnalysisResult(
             total_trades=total_trades,
-            profitable_trades=round(profitable_trades / total_trades, 2),
-            days=round(total_days / total_trades, 2),
-            returns=round(total_returns / total_trades, 2),
-            returns_on_risk=round(total_returns_on_risk / total_trades, 2),
-            risk_on_investment=round(total_risk_on_investment / total_trades, 2),
+            profitable_trades=round(np.count_nonzero(returns > 0) / total_trades, 2),
+            days=round(self.data.days().sum().item() / total_trades, 2),
+            returns=round(returns.sum().item() / total_trades, 2),
+            returns_on_risk=round(returns_on_risk.sum().item() / total_trades, 2),
+            risk_on_investment=round(risk.sum().item() / total_trades, 2),
+            **trade_statistics(returns, compounded=True),
         )
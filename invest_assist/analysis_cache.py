@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_ANALYSIS_CACHE = os.path.join(Path.home(), ".invest_assist", "analysis.sqlite")
+
+
+class AnalysisCache:
+    """
+    SQLite table of analysis results keyed by a digest of their inputs.
+
+    Entries remember when they were last read and the least recently used
+    ones are evicted once there are more than `max_entries`. The database is
+    only opened on first use so holding a cache costs nothing to commands
+    that never analyse.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 5000) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+        return self._connection
+
+    @staticmethod
+    def digest(*key: Any) -> str:
+        return hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        connection = self.connection()
+        row = connection.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        with connection:
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return row[0]
+
+    def put(self, key: str, value: str):
+        connection = self.connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            connection.execute(
+                """
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        return self.connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
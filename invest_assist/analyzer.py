@@ -1,12 +1,18 @@
+import numpy as np
 import pandas as pd
 import math
-from typing import Callable, List, Type
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Tuple, Type
 from invest_assist.trade import Trade
+from invest_assist.trade_ledger import TradeLedger
+from invest_assist.analysis_cache import AnalysisCache
 from datetime import timedelta, date
 from invest_assist.trade_analysis import TradeAnalysis
 from functools import reduce
 from invest_assist.models import Portfolio, HistoricalAnalysisResult
-from invest_assist.strategies import Strategy
+from invest_assist.statistics import trade_statistics
+from pydantic import ValidationError
+from invest_assist.strategies import DonchianBreakout, Strategy
 
 
 class Analyzer:
@@ -17,12 +23,14 @@ class Analyzer:
         strategy: Type[Strategy],
         days: int,
         stock_data: Callable[[str, date, date, str], pd.DataFrame],
+        cache: AnalysisCache | None = None,
     ) -> None:
         self.symbol = symbol
         self.portfolio = portfolio
         self.strategy = strategy
         self.days = days
         self.stock_data = stock_data
+        self.cache = cache
 
     def get_historical_data(self) -> pd.DataFrame:
         today = date.today()
@@ -34,9 +42,20 @@ class Analyzer:
         df = df.drop_duplicates()
         return df
 
-    def get_trades(self):
-        historical_data = self.get_historical_data()
-        return self.strategy(historical_data).execute()
+    def get_trades(self, historical_data: pd.DataFrame | None = None):
+        if historical_data is None:
+            historical_data = self.get_historical_data()
+
+        strategy = self.strategy(historical_data)
+        if hasattr(strategy, "ledger"):
+            return strategy.ledger()
+        return strategy.execute()
+
+    def get_ledger(self, historical_data: pd.DataFrame | None = None) -> TradeLedger:
+        trades = self.get_trades(historical_data)
+        if isinstance(trades, TradeLedger):
+            return trades
+        return TradeLedger.from_trades(trades)
 
     def risk(self) -> float:
         return self.portfolio.capital * self.portfolio.risk_percent
@@ -101,20 +120,197 @@ class Analyzer:
     ) -> List[TradeAnalysis]:
         return [trade for trade in trade_analysis if trade.return_on_risk >= 0]
 
-    def analyse(self) -> HistoricalAnalysisResult:
-        trades = self.get_trades()
-        trade_analysis = [self.get_trade_analysis(trade) for trade in trades]
+    def get_units_column(self, ledger: TradeLedger) -> np.ndarray:
+        risk_per_unit = ledger.buy_price - ledger.initial_stop_loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            units_as_per_risk = np.floor(self.risk() / risk_per_unit)
+        total_investment = units_as_per_risk * ledger.buy_price
+
+        return np.where(
+            total_investment < self.portfolio.capital,
+            units_as_per_risk,
+            np.floor(self.portfolio.capital / ledger.buy_price),
+        )
+
+    def get_ledger_analysis(self, ledger: TradeLedger) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return on risk and days of every trade in the ledger, the columns
+        get_trade_analysis would give trade by trade.
+        """
+
+        units = self.get_units_column(ledger)
+        risk = units * (ledger.buy_price - ledger.initial_stop_loss)
+        overall_returns = np.round(
+            (units * ledger.selling_price) - (units * ledger.buy_price), 2
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return_on_risk = np.round(overall_returns / risk, 2)
+
+        no_risk = risk == 0
+        return (
+            np.where(no_risk, 0.0, return_on_risk),
+            np.where(no_risk, 0, ledger.days()),
+        )
+
+    def cache_key(self, historical_data: pd.DataFrame) -> str:
+        """
+        Digest of everything an analysis depends on. The last bar's date
+        stands in for the data, so results are recomputed once a new bar
+        arrives.
+        """
+
+        return AnalysisCache.digest(
+            self.symbol,
+            f"{self.strategy.__module__}.{self.strategy.__qualname__}",
+            getattr(self.strategy, "parameters", None),
+            self.days,
+            historical_data["DATE"].max(),
+            len(historical_data),
+            self.portfolio.capital,
+            self.portfolio.risk_percent,
+            list(HistoricalAnalysisResult.model_fields),
+        )
+
+    def analyse(
+        self, historical_data: pd.DataFrame | None = None
+    ) -> HistoricalAnalysisResult:
+        if self.cache is None:
+            return self.analyse_data(historical_data)
+
+        if historical_data is None:
+            historical_data = self.get_historical_data()
+        if len(historical_data) == 0:
+            return self.analyse_data(historical_data)
+
+        key = self.cache_key(historical_data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            try:
+                return HistoricalAnalysisResult.model_validate_json(cached)
+            except ValidationError:
+                # Written by an older schema or unreadable; recompute and overwrite it.
+                pass
+
+        result = self.analyse_data(historical_data)
+        self.cache.put(key, result.model_dump_json())
+        return result
+
+    def analyse_data(
+        self, historical_data: pd.DataFrame | None = None
+    ) -> HistoricalAnalysisResult:
+        return self.analyse_ledger(self.get_ledger(historical_data))
 
-        avg_rate_of_return = self.avg_return(trade_analysis)
-        avg_days = self.avg_days(trade_analysis)
+    def analyse_ledger(self, ledger: TradeLedger) -> HistoricalAnalysisResult:
+        return_on_risk, days = self.get_ledger_analysis(ledger)
+        total_trades = len(ledger)
 
-        profitable_trades = self.profitable_trades(trade_analysis)
-        profit_percent = round(len(profitable_trades) / len(trade_analysis), 2)
+        if total_trades == 0:
+            return HistoricalAnalysisResult(
+                symbol=self.symbol,
+                returns=0.0,
+                days_per_return=0,
+                winning_percentage=0.0,
+                total_trades=0,
+            )
+
+        profitable_trades = np.count_nonzero(return_on_risk >= 0)
 
         return HistoricalAnalysisResult(
             symbol=self.symbol,
-            returns=avg_rate_of_return,
-            days_per_return=avg_days,
-            winning_percentage=profit_percent,
-            total_trades=len(trade_analysis),
+            returns=round(return_on_risk.sum().item() / total_trades, 2),
+            days_per_return=math.ceil(days.sum().item() / total_trades),
+            winning_percentage=round(profitable_trades / total_trades, 2),
+            total_trades=total_trades,
+            **trade_statistics(return_on_risk, compounded=False),
         )
+
+    @staticmethod
+    def backtest(
+        symbols: List[str],
+        portfolio: Portfolio,
+        strategies: Dict[str, Type[Strategy]],
+        days: int,
+        stock_data: Callable[[str, date, date, str], pd.DataFrame],
+        max_workers: int | None = None,
+        on_done: Callable[[str], None] | None = None,
+    ) -> Tuple[pd.DataFrame, Dict[Tuple[str, str], Exception]]:
+        """
+        Run every strategy against every symbol on a process pool.
+
+        Each worker fetches one symbol's history once and runs all the
+        strategies on it. Returns one row per symbol and strategy with the
+        HistoricalAnalysisResult fields, in the order of `symbols` and
+        `strategies`, and the errors keyed by (symbol, strategy name).
+        `stock_data` has to be picklable, e.g. HistoryStore.stock_df.
+        """
+
+        results = {}
+        errors = {}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_symbol = {
+                executor.submit(
+                    backtest_symbol, symbol, portfolio, strategies, days, stock_data
+                ): symbol
+                for symbol in symbols
+            }
+
+            for future in as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    results[symbol], symbol_errors = future.result()
+                    errors.update(symbol_errors)
+                except Exception as e:
+                    errors.update({(symbol, name): e for name in strategies})
+
+                if on_done is not None:
+                    on_done(symbol)
+
+        rows = [row for symbol in symbols for row in results.get(symbol, [])]
+        columns = ["symbol", "strategy"] + [
+            field
+            for field in HistoricalAnalysisResult.model_fields
+            if field != "symbol"
+        ]
+        return pd.DataFrame(rows, columns=columns), errors
+
+
+def backtest_symbol(
+    symbol: str,
+    portfolio: Portfolio,
+    strategies: Dict[str, Type[Strategy]],
+    days: int,
+    stock_data: Callable[[str, date, date, str], pd.DataFrame],
+) -> Tuple[List[Dict], Dict[Tuple[str, str], Exception]]:
+    historical_data = Analyzer(
+        symbol, portfolio, None, days, stock_data
+    ).get_historical_data()
+
+    # Channel breakouts share one pass over the history.
+    windows = {
+        name: (strategy.high_days, strategy.low_days)
+        for name, strategy in strategies.items()
+        if issubclass(strategy, DonchianBreakout)
+    }
+    try:
+        ledgers = DonchianBreakout.ledgers(historical_data, set(windows.values()))
+    except Exception:
+        windows, ledgers = {}, {}
+
+    rows = []
+    errors = {}
+    for name, strategy in strategies.items():
+        analyzer = Analyzer(symbol, portfolio, strategy, days, stock_data)
+        try:
+            if name in windows:
+                result = analyzer.analyse_ledger(ledgers[windows[name]])
+            else:
+                result = analyzer.analyse(historical_data)
+        except Exception as e:
+            errors[(symbol, name)] = e
+            continue
+
+        rows.append({**result.model_dump(), "strategy": name})
+
+    return rows, errors
@@ -1,7 +1,8 @@
 import click
 import pandas as pd
 from io import StringIO
-from .utils import get_breakout
+from .market import get_breakout
+from invest_assist.scanner import scan
 from invest_assist.company_list import listings
 
 
@@ -25,7 +26,14 @@ from invest_assist.company_list import listings
     default=50,
     help="Top n companies you want to check for.",
 )
-def breakout(strategy_name: str,all:bool, n:int):
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=16,
+    help="How many symbols to check concurrently.",
+)
+def breakout(strategy_name: str,all:bool, n:int, workers: int):
     """
     Get a list of all the companies that broke out today for a particular strategy.
     """
@@ -36,6 +44,9 @@ def breakout(strategy_name: str,all:bool, n:int):
         n = len(df)
     symbols = df.head(n)["Symbol"].tolist()
 
-    breakouts = [symbol for symbol in symbols if get_breakout(symbol, strategy_name)]
+    results, _ = scan(
+        symbols, lambda symbol: get_breakout(symbol, strategy_name), workers
+    )
+    breakouts = [symbol for symbol in symbols if results.get(symbol)]
 
     click.echo(','.join(breakouts))
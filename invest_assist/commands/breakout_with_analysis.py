@@ -2,18 +2,19 @@ import click
 import pandas as pd
 from io import StringIO
 from datetime import date
-from jugaad_data.nse import stock_df
 from invest_assist.company_list import listings
+from invest_assist.scanner import scan
 from invest_assist.analyzer import Analyzer
 from invest_assist.models import Portfolio
-from .utils import (
+from .market import (
+    analysis_cache,
     get_breakout,
     get_current_price,
     get_stop_loss,
-    read_portfolio,
+    history_store,
     strategy_class,
-    validate_path,
 )
+from .utils import read_portfolio, validate_path
 from .historical_analysis import print_analysis_result
 from .buy import print_buying_result
 
@@ -22,7 +23,7 @@ def get_buying_data(portfolio: Portfolio, symbol: str, strategy_name: str):
     current_price = get_current_price(symbol)
     strategy = strategy_class[strategy_name]["class"]
     historical_analysis_result = Analyzer(
-        symbol, portfolio, strategy, 3650, stock_df
+        symbol, portfolio, strategy, 3650, history_store.stock_df, analysis_cache
     ).analyse()
     stop_loss = get_stop_loss(symbol, strategy_name)
 
@@ -68,8 +69,20 @@ def get_buying_data(portfolio: Portfolio, symbol: str, strategy_name: str):
     required=False,
     help="How much historical data should the analysis be ran on.",
 )
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=16,
+    help="How many symbols to check concurrently.",
+)
 def breakout_with_analysis(
-    strategy_name: str, all: bool, n: int, portfolio: click.types.File, years: int
+    strategy_name: str,
+    all: bool,
+    n: int,
+    portfolio: click.types.File,
+    years: int,
+    workers: int,
 ):
     """
     Get a list of all the companies that broke out today for a particular strategy along with their historical-analysis.
@@ -83,8 +96,14 @@ def breakout_with_analysis(
     symbols = df.head(n)["Symbol"].tolist()
 
     click.secho("Filtering breakouts: ", bold=True)
-    with click.progressbar(symbols) as syms:
-        breakouts = [symbol for symbol in syms if get_breakout(symbol, strategy_name)]
+    with click.progressbar(length=len(symbols)) as bar:
+        results, _ = scan(
+            symbols,
+            lambda symbol: get_breakout(symbol, strategy_name),
+            workers,
+            lambda _: bar.update(1),
+        )
+    breakouts = [symbol for symbol in symbols if results.get(symbol)]
 
     strategy = strategy_class[strategy_name]["class"]
     parsed_pf = read_portfolio(portfolio)
@@ -92,7 +111,14 @@ def breakout_with_analysis(
     click.secho("\n\nRunning Analysis: ", bold=True)
     with click.progressbar(breakouts) as breaks:
         results = [
-            Analyzer(symbol, parsed_pf, strategy, 365 * years, stock_df).analyse()
+            Analyzer(
+                symbol,
+                parsed_pf,
+                strategy,
+                365 * years,
+                history_store.stock_df,
+                analysis_cache,
+            ).analyse()
             for symbol in breaks
         ]
 
@@ -1,13 +1,12 @@
 import click
-from .utils import (
-    validate_path,
+from .market import (
+    analysis_cache,
     get_current_price,
     get_stop_loss,
-    read_portfolio,
-    write_portfolio,
+    history_store,
     strategy_class,
 )
-from jugaad_data.nse import stock_df
+from .utils import validate_path, read_portfolio, write_portfolio
 from datetime import datetime, date
 from invest_assist.models import Holding
 from invest_assist.analyzer import Analyzer
@@ -85,7 +84,9 @@ def buy(
     stop_loss = get_stop_loss(symbol, strategy_name)
     parsed_pf = read_portfolio(portfolio)
 
-    historical_analysis_result = Analyzer(symbol, parsed_pf, strategy, 3650, stock_df).analyse()
+    historical_analysis_result = Analyzer(
+        symbol, parsed_pf, strategy, 3650, history_store.stock_df, analysis_cache
+    ).analyse()
 
     holding = parsed_pf.buy_stock(
         symbol,
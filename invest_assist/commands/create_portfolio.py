@@ -1,6 +1,6 @@
 import click
-from .utils import  validate_path, write_portfolio
-from invest_assist.models import Portfolio
+from .utils import  validate_path, replace_portfolio
+from invest_assist.models.portfolio import Portfolio
 
 @click.command()
 @click.option(
@@ -27,8 +27,13 @@ def create_portfolio(
 ):
     """
     Create a new portfolio.
+
+    An existing portfolio of the same name is replaced. Portfolios are JSON
+    files under PORTFOLIO_HOME unless PORTFOLIO_DB names a SQLite database
+    or PORTFOLIO_JOURNAL a directory of journals, which then replace the
+    JSON files: those are not updated any more.
     """
     portfolio = Portfolio(capital=capital, risk_percent=risk_percent, holdings=[], cash_input= capital)
 
-    write_portfolio(portfolio_name, portfolio)
+    replace_portfolio(portfolio_name, portfolio)
     click.secho(f"Portfolio was created.", bold=True)
@@ -6,9 +6,8 @@ from tabulate import tabulate
 
 from invest_assist.commands.utils import load_options_portfolio, load_watch_list_portfolio
 from invest_assist.models import Option, OptionPortfolio
-from jugaad_data.nse import NSELive
-
-nseLive = NSELive()
+from invest_assist.commands.market import nse_client
+from invest_assist.scanner import scan
 
 def get_option(option:Option):
     return [
@@ -115,15 +114,14 @@ def describe_option(date: datetime, portfolio: bool):
 
     click.secho("UPDATING OPTIONS", bold=True)
 
-    quotes_data = {}
-    with click.progressbar(option_portfolio.options) as options:
-        for option in options:
-            if option.symbol not in quotes_data:
-                try:
-                    quote_data = nseLive.stock_quote_fno(option.symbol)
-                    quotes_data[option.symbol] = quote_data
-                except:
-                    print("Couldn't fetch quote for ", option.symbol)
+    symbols = sorted({option.symbol for option in option_portfolio.active_options()})
+    with click.progressbar(length=len(symbols)) as bar:
+        quotes_data, errors = scan(
+            symbols, nse_client.stock_quote_fno, 8, lambda _: bar.update(1)
+        )
+
+    for symbol, error in errors.items():
+        click.echo(f"Couldn't fetch quote for {symbol}: {error!r}", err=True)
 
     option_portfolio.update(quotes_data)
 
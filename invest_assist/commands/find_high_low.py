@@ -1,69 +1,181 @@
 import json
+import tempfile
+import time
+from typing import List
 import click
 import concurrent.futures
 import pandas as pd
 from io import StringIO
 from invest_assist.CummulativeAnalyzer import CumulativeAnalyzer
 from invest_assist.HighLowAnalyzer import HighLowAnalyzer
+from invest_assist.models import WalkForwardResult
 from invest_assist.company_list import listings
-from invest_assist.strategies import FindHighLow
-from .utils import get_historical_data
+from invest_assist.shared_history import SharedHistory
+from invest_assist.strategies import FindHighLow, HighLowIndex
+from invest_assist.sweep import SweepStore
+from invest_assist.walk_forward import WalkForward
+from .market import get_historical_data
 
+shared_history = None
 
 
-def get_analysis(stock_data, high, low):
-    trades = FindHighLow(stock_data, high, low).execute()
+def get_analysis(stock_data, high, low, index=None):
+    trades = FindHighLow(stock_data, high, low, index).ledger()
     result =  HighLowAnalyzer(trades).analyze()
     return result
 
 
-def analyze_combination(historical_data, high, low):
-    results = {f"{high}-{low}": [], f"{low}-{high}": []}
-    symbols = historical_data.keys()
-    for symbol in symbols:
-        stock_data = historical_data[symbol]
-        result_high_low = get_analysis(stock_data, high, low)
-        result_low_high = get_analysis(stock_data, low, high)
-        results[f"{high}-{low}"].append(result_high_low)
-        results[f"{low}-{high}"].append(result_low_high)
+def analyze_symbol(stock_data, high_low_combinations):
+    index = HighLowIndex(stock_data)
+    results = {}
+    for high, low in high_low_combinations:
+        result_high_low = get_analysis(stock_data, high, low, index)
+        result_low_high = get_analysis(stock_data, low, high, index)
+        results.setdefault(f"{high}-{low}", []).append(result_high_low)
+        results.setdefault(f"{low}-{high}", []).append(result_low_high)
     return results
 
 
-def merge_results(analysis, new_results):
-    for key, value in new_results.items():
-        analysis[key].extend(value)
+def attach_shared_history(history: SharedHistory):
+    global shared_history
+    shared_history = history
 
 
-def run_analysis_multithreaded(
-    historical_data,
-    high_low_combinations
-):
-    analysis = {}
+def analyze_shared_symbol(symbol, high_low_combinations):
+    return analyze_symbol(shared_history[symbol], high_low_combinations)
 
-    # Initialize the dictionary keys
-    for high, low in high_low_combinations:
-        analysis[f"{high}-{low}"] = []
-        analysis[f"{low}-{high}"] = []
-
-    with concurrent.futures.ProcessPoolExecutor(max_workers=100) as executor:
-        future_to_combination = {
-            executor.submit(analyze_combination, historical_data, high, low): (
-                high,
-                low,
-            )
-            for high, low in high_low_combinations
-        }
-
-        for future in concurrent.futures.as_completed(future_to_combination):
-            high, low = future_to_combination[future]
-            try:
-                new_results = future.result()
-                merge_results(analysis, new_results)
-                print(f"Completed analysis for {high}-{low} and {low}-{high}")
-            except Exception as e:
-                print(f"Error analyzing {high}-{low} and {low}-{high}: {e.with_traceback()}")
 
-    return analysis
+def walk_forward_shared_symbol(symbol, pairs, train_days, test_days):
+    index = HighLowIndex(shared_history[symbol])
+    return WalkForward(index, pairs, train_days, test_days).run(symbol)
+
+
+def run_walk_forward(historical_data, pairs, train_days: int, test_days: int):
+    """
+    Walk every symbol forward over the (high, low) pairs on a process pool and
+    return the chosen pair and its in- and out-of-sample results per fold.
+    """
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        history = SharedHistory.pack(historical_data, directory)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=attach_shared_history, initargs=(history,)
+        ) as executor:
+            future_to_symbol = {
+                executor.submit(
+                    walk_forward_shared_symbol, symbol, pairs, train_days, test_days
+                ): symbol
+                for symbol in history.keys()
+            }
+
+            for future in concurrent.futures.as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    results += future.result()
+                    print(f"Completed walk forward for {symbol}")
+                except Exception as e:
+                    print(f"Error walking {symbol} forward: {e}")
+
+    return results
+
+
+def run_batch(executor, store: SweepStore, symbols, cells, deadline):
+    future_to_symbol = {}
+    for symbol in symbols:
+        pending = store.pending_for_symbol(symbol, cells)
+        if len(pending) > 0:
+            future = executor.submit(analyze_shared_symbol, symbol, pending)
+            future_to_symbol[future] = symbol
+
+    for future in concurrent.futures.as_completed(future_to_symbol):
+        symbol = future_to_symbol[future]
+        try:
+            store.save(symbol, future.result())
+            print(f"Completed analysis for {symbol}")
+        except Exception as e:
+            print(f"Error analyzing {symbol}: {e}")
+
+        if deadline is not None and time.monotonic() > deadline:
+            for pending_future in future_to_symbol:
+                pending_future.cancel()
+            return False
+
+    return True
+
+
+def run_sweep(
+    historical_data,
+    store: SweepStore,
+    max_cells: int,
+    minutes: float | None,
+    batch_size: int = 10,
+):
+    """
+    Run pending (high, low) cells in batches until max_cells are done or the
+    time runs out. Results are saved per symbol as they arrive, so an
+    interrupted batch resumes where it stopped on the next run. A cell is
+    pending while any symbol of this run lacks its results, so adding
+    symbols reruns the cells for just those symbols, and cells with a failed
+    symbol are left pending for the next run and skipped in this one.
+    """
+
+    deadline = None if minutes is None else time.monotonic() + minutes * 60
+    completed = []
+    incomplete = set()
+
+    with tempfile.TemporaryDirectory() as directory:
+        history = SharedHistory.pack(historical_data, directory)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=100,
+            initializer=attach_shared_history,
+            initargs=(history,),
+        ) as executor:
+            while len(completed) < max_cells:
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+
+                cells = store.pending_cells(
+                    history.keys(), min(batch_size, max_cells - len(completed)), incomplete
+                )
+                if len(cells) == 0:
+                    break
+
+                finished = run_batch(executor, store, history.keys(), cells, deadline)
+
+                done = store.complete_cells(history.keys(), cells)
+                completed += done
+                incomplete.update(cell for cell in cells if cell not in done)
+
+                if not finished:
+                    break
+
+    return completed
+
+
+def print_walk_forward(results: List[WalkForwardResult]):
+    if len(results) == 0:
+        print("Not enough history for a single walk forward fold.")
+        return
+
+    df = pd.json_normalize([result.model_dump() for result in results])
+    df.to_csv("high_low_walk_forward.csv", index=False)
+
+    df["type"] = df["high"].astype(str) + "-" + df["low"].astype(str)
+    summary = df.groupby("type").agg(
+        folds=("symbol", "size"),
+        in_sample_returns=("in_sample.returns", "mean"),
+        out_of_sample_returns=("out_of_sample.returns", "mean"),
+        out_of_sample_trades=("out_of_sample.total_trades", "sum"),
+    )
+    print(summary.sort_values(by="folds", ascending=False).round(2).to_csv())
+    print(
+        f"Out of sample returns over {len(df)} folds: "
+        f"{round(df['out_of_sample.returns'].mean(), 2)} "
+        f"(in sample {round(df['in_sample.returns'].mean(), 2)})"
+    )
 
 
 @click.command()
@@ -75,7 +187,55 @@ def run_analysis_multithreaded(
     default=50,
     help="Top n companies you want to check for.",
 )
-def find_high_low(n: int, all: bool):
+@click.option(
+    "--cells",
+    type=int,
+    required=False,
+    default=100,
+    help="How many (high, low) combinations to run.",
+)
+@click.option(
+    "--minutes",
+    type=float,
+    required=False,
+    help="Stop starting new work after this many minutes.",
+)
+@click.option(
+    "--results",
+    type=click.Path(),
+    required=False,
+    default="high_low_sweep.db",
+    help="SQLite file the per-symbol results are saved to.",
+)
+@click.option(
+    "--walk-forward",
+    is_flag=True,
+    help="Pick the best pair on rolling train windows and score it out of sample.",
+)
+@click.option(
+    "--train-days",
+    type=int,
+    required=False,
+    default=1000,
+    help="Bars in each walk forward train window.",
+)
+@click.option(
+    "--test-days",
+    type=int,
+    required=False,
+    default=250,
+    help="Bars in each walk forward test window.",
+)
+def find_high_low(
+    n: int,
+    all: bool,
+    cells: int,
+    minutes: float | None,
+    results: str,
+    walk_forward: bool,
+    train_days: int,
+    test_days: int,
+):
     """Find high and low of n companies."""
 
     df = pd.read_csv(StringIO(listings))
@@ -100,36 +260,36 @@ def find_high_low(n: int, all: bool):
 
     with open("high_low_combinations.json", "r") as file:
         all_high_low_combinations = json.load(file)
-        high_low_combinations = all_high_low_combinations[:100]
-
-    with open("high_low_combinations.json", "w") as file:
-        json.dump(all_high_low_combinations[100:], file)
 
+    if walk_forward:
+        pairs = []
+        for high, low in all_high_low_combinations[:cells]:
+            pairs += [(high, low), (low, high)]
+        print_walk_forward(run_walk_forward(historical_data, pairs, train_days, test_days))
+        return
 
+    store = SweepStore(results)
+    store.add_cells([tuple(combination) for combination in all_high_low_combinations])
 
-    analysis = run_analysis_multithreaded(historical_data, high_low_combinations)
+    completed = run_sweep(historical_data, store, cells, minutes)
 
-    # analysis = {}
-    # for high, low in high_low_combinations:
-    #     analysis[f"{high}-{low}"] = []
-    #     analysis[f"{low}-{high}"] = []
-    #     print(f"Running analysis for {high}-{low} and {low}-{high}")
-    #     for symbol in historical_data.keys():
-    #         stock_data = historical_data[symbol]
-    #         result_high_low = get_analysis(stock_data, high, low)
-    #         result_low_high = get_analysis(stock_data, low, high)
-    #         analysis[f"{high}-{low}"].append(result_high_low)
-    #         analysis[f"{low}-{high}"].append(result_low_high)
+    analysis = {}
+    for high, low in completed:
+        analysis[f"{high}-{low}"] = store.result_columns(f"{high}-{low}", symbols)
+        analysis[f"{low}-{high}"] = store.result_columns(f"{low}-{high}", symbols)
 
     print(f"TOTAL ANALYZED - {len(analysis.keys())}")
-    results = []
+    if len(analysis) == 0:
+        return
+
+    cumulative_results = []
     for key in analysis.keys():
         analyzer = CumulativeAnalyzer(analysis[key], key)
-        results.append(analyzer.analyse())
+        cumulative_results.append(analyzer.analyse())
         print(f"Completed analysis for {key}")
 
 
-    result_dicts = [result.model_dump() for result in results]
+    result_dicts = [result.model_dump() for result in cumulative_results]
     df = pd.DataFrame(result_dicts)
 
 
@@ -1,6 +1,9 @@
 import click
-from jugaad_data.nse import stock_df
-from .utils import strategy_class, validate_path, read_portfolio
+import pandas as pd
+from io import StringIO
+from invest_assist.company_list import listings
+from .market import history_store, strategy_class
+from .utils import validate_path, read_portfolio
 from invest_assist.models.portfolio import HistoricalAnalysisResult
 from invest_assist.analyzer import Analyzer
 
@@ -30,10 +33,22 @@ def print_analysis_result(
     click.echo(
         f"Profitable Trades: {round(historical_results.winning_percentage * 100, 2)}%"
     )
+    click.echo(f"Median return on risk: {historical_results.median_returns}")
+    click.echo(f"Expectancy: {historical_results.expectancy}")
+    click.echo(f"Profit factor: {historical_results.profit_factor}")
+    click.echo(f"Max drawdown (in risk): {historical_results.max_drawdown}")
 
 
 @click.command()
-@click.option("--symbols", type=str, required=True, help="Comma separated NSE symbols.")
+@click.option("--symbols", type=str, required=False, help="Comma separated NSE symbols.")
+@click.option("--all", is_flag=True, help="Run the analysis against all stocks")
+@click.option(
+    "-n",
+    type=int,
+    required=False,
+    default=None,
+    help="Top n companies you want to run the analysis against.",
+)
 @click.option(
     "--portfolio",
     type=click.Path(),
@@ -44,7 +59,8 @@ def print_analysis_result(
 @click.option(
     "--strategies",
     type=str,
-    required=True,
+    required=False,
+    default=",".join(strategy_class),
     help="Comma separated strategies you want to execute on the symbols.",
 )
 @click.option(
@@ -54,29 +70,67 @@ def print_analysis_result(
     required=False,
     help="How much historical data should the analysis be ran on.",
 )
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=None,
+    help="How many symbols to analyse in parallel, one process each.",
+)
+@click.option(
+    "--output",
+    type=click.Path(),
+    required=False,
+    help="Write the results to this CSV file instead of printing them.",
+)
 def historical_analysis(
-    symbols: str, portfolio: click.types.File, strategies: str, years: int
+    symbols: str,
+    all: bool,
+    n: int,
+    portfolio: click.types.File,
+    strategies: str,
+    years: int,
+    workers: int,
+    output: str,
 ):
     """
     Run historical analysis based on the given portfolio against multiple symbols and strategies.
     """
 
-    symbols = symbols.split(",")
+    if symbols is not None:
+        symbols = symbols.split(",")
+    elif all or n is not None:
+        listed = pd.read_csv(StringIO(listings))
+        symbols = listed["Symbol"].tolist() if all else listed.head(n)["Symbol"].tolist()
+    else:
+        raise click.UsageError("Pass --symbols, -n or --all.")
 
     parsed_pf = read_portfolio(portfolio)
 
-    parsed_strategies = [
-        strategy_class[name]["class"] for name in strategies.split(",")
-    ]
+    parsed_strategies = {
+        name: strategy_class[name]["class"] for name in strategies.split(",")
+    }
+
+    with click.progressbar(length=len(symbols)) as bar:
+        results, errors = Analyzer.backtest(
+            symbols,
+            parsed_pf,
+            parsed_strategies,
+            365 * years,
+            history_store.stock_df,
+            workers,
+            lambda _: bar.update(1),
+        )
 
-    for symbol in symbols:
+    for (symbol, strategy_name), error in errors.items():
+        click.echo(f"{symbol} with {strategy_name} failed: {error!r}", err=True)
 
-        results = [
-            Analyzer(symbol, parsed_pf, strategy, 365 * years, stock_df).analyse()
-            for strategy in parsed_strategies
-        ]
+    if output is not None:
+        results.to_csv(output, index=False)
+        return
 
-        [
-            print_analysis_result(symbol, strategy_name, result)
-            for result, strategy_name in zip(results, strategies.split(","))
-        ]
+    for row in results.to_dict("records"):
+        strategy_name = row.pop("strategy")
+        print_analysis_result(
+            row["symbol"], strategy_name, HistoricalAnalysisResult(**row)
+        )
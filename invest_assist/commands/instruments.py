@@ -0,0 +1,70 @@
+from datetime import datetime
+import os
+import click
+from tabulate import tabulate
+from invest_assist.instruments import InstrumentMaster
+
+
+def get_instrument(instrument):
+    return [
+        instrument.trading_symbol,
+        instrument.token,
+        instrument.expiry,
+        instrument.option_type,
+        instrument.strike_price,
+        instrument.lot_size,
+    ]
+
+
+@click.command()
+@click.option(
+    "--master",
+    type=click.Path(exists=True, dir_okay=False),
+    default=os.getenv("INSTRUMENTS_PATH"),
+    required=True,
+    help="Instrument master file of the exchange, e.g. BFO_symbols.txt.",
+)
+@click.option("--symbol", type=str, required=True, help="Underlying symbol.")
+@click.option(
+    "--expiry",
+    type=click.DateTime(formats=["%d-%m-%Y"]),
+    required=False,
+    help="Expiry of the contracts, the next one if not given.",
+)
+@click.option(
+    "--option-type",
+    type=click.Choice(["CE", "PE", "XX"]),
+    required=False,
+    help="CE for calls, PE for puts and XX for futures.",
+)
+@click.option(
+    "--strike",
+    type=float,
+    required=False,
+    help="Only show the contracts struck just below and just above this price.",
+)
+def instruments(
+    master: str, symbol: str, expiry: datetime, option_type: str, strike: float
+):
+    """List the derivative contracts of an underlying from an instrument master."""
+
+    instrument_master = InstrumentMaster.load(master)
+    expiry = expiry.date() if expiry else instrument_master.next_expiry(symbol)
+
+    if strike is not None:
+        contracts = [
+            contract
+            for option in ([option_type] if option_type else ["CE", "PE"])
+            for contract in instrument_master.around(symbol, option, strike, expiry)
+            if contract is not None
+        ]
+    else:
+        contracts = instrument_master.contracts(symbol, expiry, option_type)
+
+    if len(contracts) == 0:
+        click.secho(f"No contracts for {symbol} expiring on {expiry}", fg="red")
+        return
+
+    headers = ["Trading Symbol", "Token", "Expiry", "Type", "Strike", "Lot Size"]
+    data = [get_instrument(contract) for contract in contracts]
+    click.echo(tabulate(data, headers, tablefmt="grid", numalign="right"))
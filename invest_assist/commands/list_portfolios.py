@@ -2,8 +2,8 @@ import os
 import click
 from tabulate import tabulate
 
-from invest_assist.models import Portfolio, Holding
-from .utils import read_portfolio
+from invest_assist.models.portfolio import Portfolio, Holding
+from .utils import portfolio_journal_home, portfolio_store, read_portfolio
 from .describe import print_summary
 
 
@@ -15,13 +15,24 @@ def list_portfolios():
     """
 
 
-    portfolio_dir = os.getenv("PORTFOLIO_HOME")
-    files = os.listdir(portfolio_dir)
-
-    for file in files:
-        portfolio_path = os.path.join(portfolio_dir,file)
-        portfolio = read_portfolio(portfolio_path)
-        portfolio_name = file.split(".json")[0]
+    store = portfolio_store()
+    if store is not None:
+        portfolios = ((name, store.read(name)) for name in store.names())
+    elif portfolio_journal_home() is not None:
+        journal_dir = portfolio_journal_home()
+        portfolios = (
+            (name, read_portfolio(name))
+            for name in sorted(os.listdir(journal_dir))
+            if os.path.isdir(os.path.join(journal_dir, name))
+        )
+    else:
+        portfolio_dir = os.getenv("PORTFOLIO_HOME")
+        portfolios = (
+            (file.split(".json")[0], read_portfolio(os.path.join(portfolio_dir, file)))
+            for file in os.listdir(portfolio_dir)
+        )
+
+    for portfolio_name, portfolio in portfolios:
         click.echo("\n")
         click.secho(portfolio_name, bold=True)
         print_summary(portfolio)
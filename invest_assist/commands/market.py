@@ -0,0 +1,101 @@
+import os
+import pandas as pd
+from typing import Dict, Iterable, Tuple
+from datetime import date, timedelta
+from jugaad_data.nse import history as nse_history
+from invest_assist.analysis_cache import DEFAULT_ANALYSIS_CACHE, AnalysisCache
+from invest_assist.history_store import DEFAULT_HISTORY_HOME, HistoryStore
+from invest_assist.nse_client import NSEClient
+from invest_assist.strategies import FortyTwenty, MovingAverage
+from invest_assist.strategies.ThirtyThirtyThree import ThirtyThirtyThree
+from invest_assist.strategies.ThirtyTwentyNine import ThirtyTwentyNine
+
+
+strategy_class: Dict[str, Dict] = {
+    "FortyTwenty": {"class": FortyTwenty, "min_days_required": 100},
+    "ThirtyTwentyNine": {"class": ThirtyTwentyNine, "min_days_required": 100},
+    "ThirtyThirtyThree": {"class": ThirtyThirtyThree, "min_days_required": 100},
+    "MovingAverage": {"class": MovingAverage, "min_days_required": 100},
+}
+
+history_store = HistoryStore(os.getenv("HISTORY_HOME", DEFAULT_HISTORY_HOME))
+analysis_cache = AnalysisCache(os.getenv("ANALYSIS_CACHE", DEFAULT_ANALYSIS_CACHE))
+# Option scans ask for the same chains and F&O quotes more than once.
+nse_client = NSEClient(
+    cache_ttls={"equities_option_chain": 60, "stock_quote_fno": 60}
+)
+# jugaad_data fetches history through a session of its own, a request per
+# month of bars. Share the client's per-host rate limit and retries with it
+# so threaded scans throttle history requests along with the quotes.
+nse_client.share_limits(nse_history.h.s)
+live_states: Dict[Tuple[str, str], Tuple[date, object]] = {}
+
+
+def get_historical_data(symbol: str, days: int) -> pd.DataFrame:
+    today = date.today()
+    ten_years_ago = today - timedelta(days=days)
+    df = history_store.stock_df(
+        symbol=symbol, from_date=ten_years_ago, to_date=today, series="EQ"
+    )
+
+    df = df.drop_duplicates()
+    return df
+
+def get_current_price(symbol:str) -> float:
+    q = nse_client.stock_quote(symbol)
+    return q["priceInfo"]["lastPrice"]
+
+def get_stop_loss(symbol: str, strategy_name: str) -> float:
+    strategy = strategy_class[strategy_name]["class"]
+    days = strategy_class[strategy_name]["min_days_required"]
+
+    stock_data = get_historical_data(symbol, days)
+    return strategy(stock_data).get_stop_loss()
+
+def get_price_and_stop_losses(
+    symbol: str, strategy_names: Iterable[str]
+) -> Tuple[float, Dict[str, float]]:
+    """
+    Current price of a symbol and its stop loss under each of the strategies,
+    fetching the quote and the history once however many strategies hold it.
+    """
+
+    strategy_names = list(strategy_names)
+    days = max(strategy_class[name]["min_days_required"] for name in strategy_names)
+    stock_data = get_historical_data(symbol, days)
+
+    stop_losses = {
+        name: strategy_class[name]["class"](stock_data).get_stop_loss()
+        for name in strategy_names
+    }
+    return get_current_price(symbol), stop_losses
+
+def get_live_state(symbol: str, strategy_name: str):
+    """
+    Indicator state of a symbol for a strategy, built from its history once a
+    day so that repeated breakout checks only need the latest quote.
+    """
+
+    key = (symbol, strategy_name)
+    cached = live_states.get(key)
+    if cached is not None and cached[0] == date.today():
+        return cached[1]
+
+    state = build_live_state(symbol, strategy_name)
+    live_states[key] = (date.today(), state)
+    return state
+
+def build_live_state(symbol: str, strategy_name: str):
+    strategy = strategy_class[strategy_name]["class"]
+    days = strategy_class[strategy_name]["min_days_required"]
+    return strategy(get_historical_data(symbol, days)).live_state()
+
+def get_breakout(symbol: str, strategy_name: str) -> bool:
+    try:
+        today = nse_client.stock_quote(symbol)['priceInfo']
+        state = get_live_state(symbol, strategy_name)
+    except:
+         return False
+
+
+    return state.breakout(today)
@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+import click
+from invest_assist.portfolio_store import PortfolioStore
+
+
+@click.command()
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default=os.getenv("PORTFOLIO_DB"),
+    required=True,
+    help="SQLite database to import the portfolios into, PORTFOLIO_DB by default.",
+)
+@click.option(
+    "--overwrite",
+    is_flag=True,
+    help="Replace portfolios that are already in the database, holdings and all.",
+)
+def migrate_portfolios(db: str, overwrite: bool):
+    """
+    Import the JSON portfolios under PORTFOLIO_HOME into a SQLite database.
+    """
+
+    portfolio_dir = os.getenv("PORTFOLIO_HOME")
+    if portfolio_dir is None:
+        raise click.UsageError("PORTFOLIO_HOME is not set.")
+
+    store = PortfolioStore(db)
+    for path in sorted(Path(portfolio_dir).glob("*.json")):
+        if store.exists(path.stem) and not overwrite:
+            click.echo(f"Skipped {path.stem}, it is already in {db}")
+            continue
+
+        portfolio = store.import_json(path.stem, path, overwrite=overwrite)
+        click.echo(f"Imported {path.stem} with {len(portfolio.holdings)} holdings")
@@ -6,6 +6,8 @@ from typing import Callable, Dict, List
 import click
 from invest_assist.OptionTradesAnalyzer import OptionTradeAnalyzer
 from invest_assist.models import Option, OptionPortfolio, OptionTradeAnalysisResult
+from invest_assist.option_chain import OptionChain
+from invest_assist.quotes import fetch_chains
 from invest_assist.strategies import (
     CallHighBreakoutFinder,
     CallLowBreakoutFinder,
@@ -14,10 +16,8 @@ from invest_assist.strategies import (
     PutHighBreakoutFinder,
     PutLowBreakoutFinder,
 )
-from .utils import get_historical_data, load_options_portfolio
-from jugaad_data.nse import NSELive
-
-nseLive = NSELive()
+from .market import get_historical_data, nse_client
+from .utils import load_options_portfolio
 
 
 @click.command()
@@ -51,7 +51,14 @@ nseLive = NSELive()
     default=20,
     help="Expiry in days",
 )
-def option_analysis(n: int, all: bool, r: int, buy: bool, expiry_in: int):
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=8,
+    help="How many option chains to fetch at once.",
+)
+def option_analysis(n: int, all: bool, r: int, buy: bool, expiry_in: int, workers: int):
     """Find high and low of n companies."""
 
     symbols = """AARTIIND
@@ -245,33 +252,19 @@ ZYDUSLIFE""".split(
     historical_data = {}
 
     with click.progressbar(symbols) as syms:
-        for i, symbol in enumerate(syms):
+        for symbol in syms:
             try:
                 stock_data = get_historical_data(symbol, 4000)
                 historical_data[symbol] = stock_data
-            except:
-                print("couldn't fetch data for ", symbol, " at Index ", i)
-                print("couldn't fetch data for symbol after", symbols[i-1])
-                return False
-
-    def find_high_breakout(stock_data):
-        for i in range(100, 1, -1):
-            if HighBreakoutFinder(stock_data, i).breakout():
-                return i
-        return 0
-
-    def find_low_breakout(stock_data):
-        for i in range(100, 1, -1):
-            if LowBreakoutFinder(stock_data, i).breakout():
-                return i
-        return 0
+            except Exception as e:
+                click.echo(f"Couldn't fetch history of {symbol}: {e!r}", err=True)
 
     high_breakouts = {}
     low_breakouts = {}
     for symbol in historical_data.keys():
         stock_data = historical_data[symbol]
-        high_breakouts[symbol] = find_high_breakout(stock_data)
-        low_breakouts[symbol] = find_low_breakout(stock_data)
+        high_breakouts[symbol] = HighBreakoutFinder.largest_window(stock_data, 100)
+        low_breakouts[symbol] = LowBreakoutFinder.largest_window(stock_data, 100)
 
     call_low_analysis = {}
     call_high_analysis = {}
@@ -309,83 +302,32 @@ ZYDUSLIFE""".split(
             put_high_analysis[symbol] = high_analysis_put
 
     options_symbols = set(list(call_high_analysis.keys()) + list(call_low_analysis.keys()) + list(put_high_analysis.keys()) + list(put_low_analysis.keys()))
-    options_data = {}
-    quotes_data = {}
-
-    with click.progressbar(options_symbols) as syms:
-        for i, symbol in enumerate(syms):
-            try:
-                option_data = nseLive.equities_option_chain(symbol)
-                options_data[symbol] = option_data
-                quote_data = nseLive.stock_quote_fno(symbol)
-                quotes_data[symbol] = quote_data
-            except:
-                print("couldn't fetch data for ", symbol, " at Index ", i)
-                print("couldn't fetch data for symbol after", symbols[i-1])
-                return False
 
-    def find_put_ticks(expected_strike_price, option_data):
-        nearest_expiry = option_data["records"]["expiryDates"][0]
-        current_profitable_diff = 1000000
-        current_losing_diff = -1000000
-        option_ticks = ["", ""]
+    with click.progressbar(length=len(options_symbols)) as bar:
+        chains, errors = fetch_chains(
+            nse_client, list(options_symbols), workers, lambda _: bar.update(1)
+        )
 
-        for option in option_data["records"]["data"]:
-            if "PE" in option.keys() and option["expiryDate"] == nearest_expiry:
-                strike_price = option["strikePrice"]
-                diff = strike_price - expected_strike_price
-                if diff > 0 and diff < current_profitable_diff:
-                    current_profitable_diff = diff
-                    identifier = option["PE"]["identifier"]
-                    option_ticks[0] = identifier
-
-                if diff < 0 and diff > current_losing_diff:
-                    current_losing_diff = diff
-                    option_ticks[1] = option["PE"]["identifier"]
-        return option_ticks
-
-    def find_call_ticks(expected_strike_price, option_data):
-        nearest_expiry = option_data["records"]["expiryDates"][0]
-        current_losing_diff = 1000000
-        current_profitable_diff = -1000000
-        option_ticks = ["", ""]
-
-        for option in option_data["records"]["data"]:
-            if "CE" in option.keys() and option["expiryDate"] == nearest_expiry:
-                strike_price = option["strikePrice"]
-                diff = strike_price - expected_strike_price
-                if diff < 0 and diff > current_profitable_diff:
-                    current_profitable_diff = diff
-                    identifier = option["CE"]["identifier"]
-                    option_ticks[0] = identifier
-
-                if diff > 0 and diff < current_losing_diff:
-                    current_losing_diff = diff
-                    option_ticks[1] = option["CE"]["identifier"]
-
-        return option_ticks
-
-    def find_quote(quote, tick):
-        data = quote["stocks"]
-        for q in data:
-            if q["metadata"]["identifier"] == tick:
-                return q
+    for symbol, error in errors.items():
+        click.echo(f"Couldn't fetch the option chain of {symbol}: {error!r}", err=True)
 
     def find_options(analysis_dict: Dict[str, OptionTradeAnalysisResult], option_type: str, tick_finder: Callable) -> List[Option]:
         options = []
         for symbol in analysis_dict.keys():
-            current_option = options_data[symbol]
-            current_quote = quotes_data[symbol]
+            if symbol not in chains:
+                continue
+
+            current_option, current_quote = chains[symbol]
             analysis = analysis_dict[symbol]
-            underlying_value = current_option["records"]["underlyingValue"]
+            underlying_value = current_option.underlying_value
             expected_strike_price = underlying_value * (1 + analysis.change)
 
-            [tick1, tick2] = tick_finder(expected_strike_price, current_option)
+            [tick1, tick2] = tick_finder(current_option, expected_strike_price)
             if not tick1 or not tick2:
                 continue
 
-            quote1 = find_quote(current_quote, tick1)
-            quote2 = find_quote(current_quote, tick2)
+            quote1 = current_quote[tick1]
+            quote2 = current_quote[tick2]
 
             expiry = datetime.strptime(
                         quote1["metadata"]["expiryDate"], "%d-%b-%Y"
@@ -428,10 +370,10 @@ ZYDUSLIFE""".split(
         return options
 
     options = []
-    options += find_options(put_high_analysis, "PUT", find_put_ticks)
-    options += find_options(put_low_analysis, "PUT", find_put_ticks)
-    options += find_options(call_high_analysis, "CALL", find_call_ticks)
-    options += find_options(call_low_analysis, "CALL", find_call_ticks)
+    options += find_options(put_high_analysis, "PUT", OptionChain.put_ticks)
+    options += find_options(put_low_analysis, "PUT", OptionChain.put_ticks)
+    options += find_options(call_high_analysis, "CALL", OptionChain.call_ticks)
+    options += find_options(call_low_analysis, "CALL", OptionChain.call_ticks)
 
     options = [option for option in options if option.current_price > 0]
     options.sort(key=lambda x: x.expected_change, reverse=True)
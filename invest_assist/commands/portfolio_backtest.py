@@ -0,0 +1,119 @@
+import click
+import pandas as pd
+from io import StringIO
+from invest_assist.company_list import listings
+from .market import history_store, strategy_class
+from .utils import validate_path, read_portfolio
+from invest_assist.portfolio_backtest import PortfolioBacktest, build_ledgers
+
+
+@click.command()
+@click.option(
+    "--portfolio",
+    type=click.Path(),
+    callback=validate_path,
+    required=True,
+    help="Portfolio whose capital and risk the backtest starts with.",
+)
+@click.option(
+    "--strategy-name",
+    type=click.Choice(list(strategy_class)),
+    required=True,
+    help="Strategy whose trades are taken.",
+)
+@click.option("--symbols", type=str, required=False, help="Comma separated NSE symbols.")
+@click.option("--all", is_flag=True, help="Run the backtest against all stocks")
+@click.option(
+    "-n",
+    type=int,
+    required=False,
+    default=None,
+    help="Top n companies you want to run the backtest against.",
+)
+@click.option(
+    "--years",
+    type=int,
+    default=10,
+    required=False,
+    help="How much historical data should the backtest be ran on.",
+)
+@click.option(
+    "--buying-capacity",
+    type=float,
+    default=1.0,
+    required=False,
+    help="Fraction of the remaining capital a single trade may use.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=None,
+    help="How many symbols to run the strategy on in parallel, one process each.",
+)
+@click.option(
+    "--output",
+    type=click.Path(),
+    required=False,
+    help="Write the daily equity curve to this CSV file.",
+)
+def portfolio_backtest(
+    portfolio: click.types.File,
+    strategy_name: str,
+    symbols: str,
+    all: bool,
+    n: int,
+    years: int,
+    buying_capacity: float,
+    workers: int,
+    output: str,
+):
+    """
+    Backtest a strategy over many symbols sharing the portfolio's capital.
+    """
+
+    if symbols is not None:
+        symbols = symbols.split(",")
+    elif all or n is not None:
+        listed = pd.read_csv(StringIO(listings))
+        symbols = listed["Symbol"].tolist() if all else listed.head(n)["Symbol"].tolist()
+    else:
+        raise click.UsageError("Pass --symbols, -n or --all.")
+
+    parsed_pf = read_portfolio(portfolio)
+
+    with click.progressbar(length=len(symbols)) as bar:
+        ledgers, errors = build_ledgers(
+            symbols,
+            strategy_class[strategy_name]["class"],
+            365 * years,
+            history_store.stock_df,
+            workers,
+            lambda _: bar.update(1),
+        )
+
+    for symbol, error in errors.items():
+        click.echo(f"{symbol} failed: {error!r}", err=True)
+
+    backtest = PortfolioBacktest(parsed_pf, ledgers, buying_capacity)
+    result = backtest.run()
+
+    if output is not None:
+        backtest.equity_curve().to_csv(output, index=False)
+
+    is_profitable = result.returns > 0
+    returns = click.style(
+        f" {round(result.returns * 100, 2)}% ",
+        bg="green" if is_profitable else "red",
+        fg="bright_white",
+    )
+
+    click.echo("\n")
+    click.secho(f"{strategy_name} over {len(ledgers)} symbols", bold=True)
+    click.echo(f"Capital: {result.starting_capital} -> {round(result.final_capital, 2)}")
+    click.echo(f"Returns: {returns}")
+    click.echo(f"Worst-case drawdown: {round(result.worst_case_drawdown * 100, 2)}%")
+    click.echo(f"Trades taken: {result.trades_taken}")
+    click.echo(f"Trades skipped: {result.trades_skipped}")
+    click.echo(f"Invalid trades: {result.trades_invalid}")
+    click.echo(f"Most open positions: {result.max_open_positions}")
@@ -1,36 +1,135 @@
+import importlib
 import click
-from .update import update
-from .buy import buy
-from .historical_analysis import historical_analysis
-from .create_portfolio import create_portfolio
-from .sell import sell
-from .describe import describe
-from .add_capital import add_capital
-from .breakout import breakout
-from .breakout_with_analysis import breakout_with_analysis
-from .list_portfolios import list_portfolios
-from .update_risk import update_risk
-from .find_high_low import find_high_low
-from .option_analysis import option_analysis
-from .describe_options import describe_option
-
-
-@click.group()
-def stock():
-    pass
+from click.utils import make_default_short_help
+
+
+# Subcommands by name, as the module and function that define them and their
+# short help. Modules are only imported once their command is looked up so
+# that cheap commands, and `stock --help`, don't pay for pandas, the
+# strategies or the NSE clients at startup.
+subcommands = {
+    "buy": (
+        "buy",
+        "buy",
+        "Buy a stock by giving a symbol, portfolio and strategy.",
+    ),
+    "historical-analysis": (
+        "historical_analysis",
+        "historical_analysis",
+        "Run historical analysis based on the given portfolio against multiple symbols and strategies.",
+    ),
+    "create-portfolio": (
+        "create_portfolio",
+        "create_portfolio",
+        "Create a new portfolio.",
+    ),
+    "update": (
+        "update",
+        "update",
+        "Update the stop loss and current price.",
+    ),
+    "sell": (
+        "sell",
+        "sell",
+        "Sell a stock by either using the symbol or id.",
+    ),
+    "describe": (
+        "describe",
+        "describe",
+        "Show a table describing the value and holdings of a portfolio.",
+    ),
+    "add-capital": (
+        "add_capital",
+        "add_capital",
+        "Add capital to a portfolio.",
+    ),
+    "breakout": (
+        "breakout",
+        "breakout",
+        "Get a list of all the companies that broke out today for a particular strategy.",
+    ),
+    "breakout-with-analysis": (
+        "breakout_with_analysis",
+        "breakout_with_analysis",
+        "Get a list of all the companies that broke out today for a particular strategy along with their historical-analysis.",
+    ),
+    "list-portfolios": (
+        "list_portfolios",
+        "list_portfolios",
+        "Show tables describing the value of the portfolios.",
+    ),
+    "update-risk": (
+        "update_risk",
+        "update_risk",
+        "Update risk of a portfolio as you increase your capital.",
+    ),
+    "find-high-low": (
+        "find_high_low",
+        "find_high_low",
+        "Find high and low of n companies.",
+    ),
+    "option-analysis": (
+        "option_analysis",
+        "option_analysis",
+        "Find high and low of n companies.",
+    ),
+    "describe-option": (
+        "describe_options",
+        "describe_option",
+        "Describe options for a given date.",
+    ),
+    "sync": (
+        "sync",
+        "sync",
+        "Append the bars since the last sync to the local history of the top n companies.",
+    ),
+    "watch": (
+        "watch",
+        "watch",
+        "Keep polling quotes and report companies as they break out for a strategy.",
+    ),
+    "portfolio-backtest": (
+        "portfolio_backtest",
+        "portfolio_backtest",
+        "Backtest a strategy over many symbols sharing the portfolio's capital.",
+    ),
+    "instruments": (
+        "instruments",
+        "instruments",
+        "List the derivative contracts of an underlying from an instrument master.",
+    ),
+    "migrate-portfolios": (
+        "migrate_portfolios",
+        "migrate_portfolios",
+        "Import the JSON portfolios under PORTFOLIO_HOME into a SQLite database.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    def list_commands(self, ctx):
+        return sorted(subcommands)
 
+    def get_command(self, ctx, name):
+        if name not in subcommands:
+            return None
 
-stock.add_command(buy)
-stock.add_command(historical_analysis)
-stock.add_command(create_portfolio)
-stock.add_command(update)
-stock.add_command(sell)
-stock.add_command(describe)
-stock.add_command(add_capital)
-stock.add_command(breakout)
-stock.add_command(breakout_with_analysis)
-stock.add_command(list_portfolios)
-stock.add_command(update_risk)
-stock.add_command(find_high_low)
-stock.add_command(option_analysis)
-stock.add_command(describe_option)
+        module, attr, _ = subcommands[name]
+        return getattr(importlib.import_module(f"{__package__}.{module}"), attr)
+
+    def format_commands(self, ctx, formatter):
+        """List the commands from the table rather than importing each one."""
+
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = [
+            (name, make_default_short_help(subcommands[name][2], limit))
+            for name in names
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
+def stock():
+    pass
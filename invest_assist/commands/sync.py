@@ -0,0 +1,47 @@
+import click
+import pandas as pd
+from io import StringIO
+from invest_assist.company_list import listings
+from .market import history_store
+
+
+@click.command()
+@click.option("--all", is_flag=True, help="Sync history of all stocks")
+@click.option(
+    "-n",
+    type=int,
+    required=False,
+    default=50,
+    help="Top n companies you want to sync.",
+)
+@click.option(
+    "--days",
+    type=int,
+    required=False,
+    default=4000,
+    help="Days of history to fetch for symbols that aren't cached yet.",
+)
+def sync(all: bool, n: int, days: int):
+    """
+    Append the bars since the last sync to the local history of the top n companies.
+    """
+
+    df = pd.read_csv(StringIO(listings))
+
+    if all:
+        n = len(df)
+
+    symbols = df.head(n)["Symbol"].tolist()
+
+    total_bars = 0
+    failed = []
+    with click.progressbar(symbols) as syms:
+        for symbol in syms:
+            try:
+                total_bars += history_store.sync(symbol, days)
+            except Exception:
+                failed.append(symbol)
+
+    click.echo(f"Fetched {total_bars} bars for {len(symbols) - len(failed)} symbols.")
+    if len(failed) > 0:
+        click.secho(f"Couldn't sync {','.join(failed)}", fg="red")
@@ -1,7 +1,9 @@
 import click
 
 from invest_assist.models.portfolio import Holding
-from .utils import validate_path, read_portfolio, get_stop_loss, write_portfolio, get_current_price
+from invest_assist.scanner import scan
+from .market import get_price_and_stop_losses
+from .utils import validate_path, read_portfolio, write_portfolio
 
 
 def print_updated_stop_loss(holding: Holding):
@@ -18,19 +20,47 @@ def print_updated_stop_loss(holding: Holding):
     required=True,
     help="Portfolio for which you want to update the stop loss.",
 )
-def update(portfolio: click.Path):
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=16,
+    help="How many symbols to refresh concurrently.",
+)
+def update(portfolio: click.Path, workers: int):
     """
     Update the stop loss and current price.
     """
 
     parsed_pf = read_portfolio(portfolio)
-    updated_holdings = [holding for holding in parsed_pf.active_stocks() if holding.update_stop_loss(get_stop_loss(holding.symbol, holding.strategy))]
 
+    strategies = {}
     for holding in parsed_pf.active_stocks():
-        holding.update_current_price(get_current_price(holding.symbol))
+        strategies.setdefault(holding.symbol, set()).add(holding.strategy)
+
+    with click.progressbar(length=len(strategies)) as bar:
+        results, errors = scan(
+            list(strategies),
+            lambda symbol: get_price_and_stop_losses(symbol, strategies[symbol]),
+            workers,
+            lambda _: bar.update(1),
+        )
+
+    updated_holdings = []
+    for holding in parsed_pf.active_stocks():
+        if holding.symbol not in results:
+            continue
+
+        current_price, stop_losses = results[holding.symbol]
+        if parsed_pf.update_stop_loss(holding, stop_losses[holding.strategy]):
+            updated_holdings.append(holding)
+        parsed_pf.update_current_price(holding, current_price)
 
     write_portfolio(portfolio, parsed_pf)
 
+    for symbol, error in errors.items():
+        click.secho(f"Couldn't update {symbol}: {error!r}", fg="red", err=True)
+
     for holding in updated_holdings:
         print_updated_stop_loss(holding)
     
@@ -1,75 +1,108 @@
 import os
 from pathlib import Path
-import pandas as pd
-from typing import Dict
-from datetime import date, datetime, timedelta
-from jugaad_data.nse import stock_df, NSELive
-from invest_assist.models import OptionPortfolio, Portfolio
-from invest_assist.strategies import FortyTwenty, MovingAverage
-from invest_assist.strategies.ThirtyThirtyThree import ThirtyThirtyThree
-from invest_assist.strategies.ThirtyTwentyNine import ThirtyTwentyNine
+from datetime import datetime
+from typing import TYPE_CHECKING
+from invest_assist.models.portfolio import Portfolio
 
+# Every portfolio command imports this module, so the stores, the journal
+# and the option models are only imported by the functions that use them.
+if TYPE_CHECKING:
+    from invest_assist.models import OptionPortfolio
+    from invest_assist.portfolio_journal import PortfolioJournal
+    from invest_assist.portfolio_store import PortfolioStore
 
-strategy_class: Dict[str, Dict] = {
-    "FortyTwenty": {"class": FortyTwenty, "min_days_required": 100},
-    "ThirtyTwentyNine": {"class": ThirtyTwentyNine, "min_days_required": 100},
-    "ThirtyThirtyThree": {"class": ThirtyThirtyThree, "min_days_required": 100},
-    "MovingAverage": {"class": MovingAverage, "min_days_required": 100},
-}
 
+def validate_path(ctx, param, value):
+    if value is None:
+        return None
 
-def get_historical_data(symbol: str, days: int) -> pd.DataFrame:
-    today = date.today()
-    ten_years_ago = today - timedelta(days=days)
-    df = stock_df(symbol=symbol, from_date=ten_years_ago, to_date=today, series="EQ")
-
-    df = df.drop_duplicates()
-    return df
+    prefix = os.getenv("PORTFOLIO_HOME", "")
+    return os.path.join(prefix, f"{value}.json")
 
-def get_current_price(symbol:str) -> float:
-    nse = NSELive()
-    q = nse.stock_quote(symbol)
-    return q["priceInfo"]["lastPrice"]
+def portfolio_store() -> "PortfolioStore | None":
+    """The SQLite portfolio store if PORTFOLIO_DB is set, else portfolios are JSON files."""
 
-def get_stop_loss(symbol: str, strategy_name: str) -> float:
-    strategy = strategy_class[strategy_name]["class"]
-    days = strategy_class[strategy_name]["min_days_required"]
+    path = os.getenv("PORTFOLIO_DB")
+    if not path:
+        return None
 
-    stock_data = get_historical_data(symbol, days)
-    return strategy(stock_data).get_stop_loss()
+    from invest_assist.portfolio_store import PortfolioStore
 
-def get_breakout(symbol: str, strategy_name: str) -> bool:
-    strategy = strategy_class[strategy_name]["class"]
-    days = strategy_class[strategy_name]["min_days_required"]
+    return PortfolioStore(path)
 
-    try:
-        nse = NSELive()
-        today = nse.stock_quote(symbol)['priceInfo']
-        stock_data = get_historical_data(symbol, days)
-    except:
-         return False
+def portfolio_journal_home() -> str | None:
+    """
+    The directory of portfolio journals if PORTFOLIO_JOURNAL is set. A
+    journaled portfolio's JSON file is read once to start its journal and is
+    not written again.
+    """
 
+    return os.getenv("PORTFOLIO_JOURNAL")
 
-    return strategy(stock_data).breakout(today)
+def portfolio_journal(path: Path) -> "PortfolioJournal | None":
+    home = portfolio_journal_home()
+    if not home:
+        return None
 
+    from invest_assist.portfolio_journal import PortfolioJournal
 
-def validate_path(ctx, param, value):
-    if value is None:
-        return None
+    return PortfolioJournal(os.path.join(home, portfolio_name(path)))
 
-    prefix = os.getenv("PORTFOLIO_HOME")
-    return os.path.join(prefix, f"{value}.json")
+def portfolio_name(path: Path) -> str:
+    return Path(path).stem
 
 def read_portfolio(path: Path) -> Portfolio:
-        with open(path, "r") as raw_portfolio:
-            return Portfolio.model_validate_json(raw_portfolio.read())
+    store = portfolio_store()
+    if store is not None:
+        return store.read(portfolio_name(path))
+
+    journal = portfolio_journal(path)
+    if journal is not None and journal.exists():
+        return journal.read()
+
+    with open(path, "r") as raw_portfolio:
+        portfolio = Portfolio.model_validate_json(raw_portfolio.read())
+
+    if journal is not None:
+        journal.create(portfolio)
+    return portfolio
 
 def write_portfolio(path: Path, portfolio: Portfolio):
+    store = portfolio_store()
+    if store is not None:
+        store.write(portfolio_name(path), portfolio)
+        return
+
+    journal = portfolio_journal(path)
+    if journal is not None:
+        if journal.exists():
+            journal.append(portfolio)
+        else:
+            journal.create(portfolio)
+        return
+
     with open(path, "w") as file:
         file.write(portfolio.model_dump_json(indent=4))
 
+def replace_portfolio(path: Path, portfolio: Portfolio):
+    """Write `portfolio` in place of any portfolio already at `path`, dropping its holdings."""
+
+    store = portfolio_store()
+    if store is not None:
+        store.replace(portfolio_name(path), portfolio)
+        return
+
+    journal = portfolio_journal(path)
+    if journal is not None:
+        journal.replace(portfolio)
+        return
+
+    write_portfolio(path, portfolio)
+
+
+def load_options_portfolio(options_path) -> "OptionPortfolio":
+    from invest_assist.models import OptionPortfolio
 
-def load_options_portfolio(options_path) -> OptionPortfolio:
     if options_path is None:
         raise Exception("OPTIONS_PATH not set")
 
@@ -86,7 +119,9 @@ def load_options_portfolio(options_path) -> OptionPortfolio:
         option_portfolio = OptionPortfolio.model_validate_json(file.read())
         return option_portfolio
     
-def load_watch_list_portfolio(options_path: str | None, date: datetime) -> OptionPortfolio:
+def load_watch_list_portfolio(options_path: str | None, date: datetime) -> "OptionPortfolio":
+    from invest_assist.models import OptionPortfolio
+
     if options_path is None:
         raise Exception("OPTIONS_PATH not set")
 
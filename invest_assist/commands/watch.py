@@ -0,0 +1,106 @@
+import click
+import pandas as pd
+from io import StringIO
+from invest_assist.company_list import listings
+from invest_assist.models import BreakoutEvent
+from invest_assist.quotes import LiveQuotes, RecordedQuotes, ReplayQuotes
+from invest_assist.watcher import Watcher
+from .market import build_live_state, nse_client, strategy_class
+
+
+def print_event(event: BreakoutEvent):
+    time = event.time.strftime("%H:%M:%S")
+    symbol = click.style(event.symbol, bold=True)
+    click.echo(
+        f"{time} {symbol} broke out with {event.strategy} at {event.price} "
+        f"(high {event.high}, low {event.low})"
+    )
+
+
+@click.command()
+@click.option(
+    "--strategy-name",
+    type=click.Choice(list(strategy_class)),
+    required=True,
+    help="Strategy for which you want to see breakouts.",
+)
+@click.option("--symbols", type=str, required=False, help="Comma separated NSE symbols.")
+@click.option("--all", is_flag=True, help="Watch all stocks")
+@click.option(
+    "-n",
+    type=int,
+    required=False,
+    default=50,
+    help="Top n companies you want to watch.",
+)
+@click.option(
+    "--interval",
+    type=float,
+    required=False,
+    default=60,
+    help="Seconds between two rounds of quotes.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    required=False,
+    default=16,
+    help="How many quotes to fetch concurrently.",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True),
+    required=False,
+    help="Replay recorded quotes from this file instead of polling NSE.",
+)
+@click.option(
+    "--record",
+    type=click.Path(),
+    required=False,
+    help="Append every quote fetched to this file, one per line.",
+)
+def watch(
+    strategy_name: str,
+    symbols: str,
+    all: bool,
+    n: int,
+    interval: float,
+    workers: int,
+    replay: str,
+    record: str,
+):
+    """
+    Keep polling quotes and report companies as they break out for a strategy.
+    """
+
+    if symbols is not None:
+        symbols = symbols.split(",")
+    else:
+        df = pd.read_csv(StringIO(listings))
+        if all:
+            n = len(df)
+        symbols = df.head(n)["Symbol"].tolist()
+
+    if replay is not None:
+        source = ReplayQuotes(replay)
+    else:
+        source = LiveQuotes(nse_client, workers)
+    if record is not None:
+        source = RecordedQuotes(source, record)
+
+    watcher = Watcher(
+        symbols,
+        strategy_name,
+        source,
+        lambda symbol: build_live_state(symbol, strategy_name),
+        workers,
+    )
+
+    try:
+        watcher.run(
+            interval,
+            print_event,
+            lambda symbol, error: click.secho(f"{symbol}: {error!r}", fg="red", err=True),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,192 @@
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, List, Tuple
+import pandas as pd
+from jugaad_data.nse import stock_df
+
+
+DEFAULT_HISTORY_HOME = os.path.join(Path.home(), ".invest_assist", "history")
+
+
+class HistoryStore:
+    """
+    On-disk cache of daily bars, one CSV per symbol and series, kept in date order.
+
+    A sidecar JSON file records the date range that has already been fetched so
+    holidays and weekends at the edges of a request don't trigger a refetch.
+    Bars for today are never persisted since the session might still be open.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        fetch: Callable[..., pd.DataFrame] = stock_df,
+    ) -> None:
+        self.root = Path(root)
+        self.fetch = fetch
+
+    def bars_path(self, symbol: str, series: str) -> Path:
+        return self.root / series / f"{symbol}.csv"
+
+    def coverage_path(self, symbol: str, series: str) -> Path:
+        return self.root / series / f"{symbol}.json"
+
+    def read_coverage(self, symbol: str, series: str) -> Tuple[date, date] | None:
+        path = self.coverage_path(symbol, series)
+        if not path.exists():
+            return None
+
+        with open(path, "r") as file:
+            coverage = json.load(file)
+
+        return (
+            date.fromisoformat(coverage["from_date"]),
+            date.fromisoformat(coverage["to_date"]),
+        )
+
+    def write_coverage(self, symbol: str, series: str, from_date: date, to_date: date):
+        with open(self.coverage_path(symbol, series), "w") as file:
+            json.dump(
+                {"from_date": from_date.isoformat(), "to_date": to_date.isoformat()},
+                file,
+            )
+
+    def read_bars(self, symbol: str, series: str) -> pd.DataFrame:
+        path = self.bars_path(symbol, series)
+        if not path.exists():
+            return pd.DataFrame()
+
+        return pd.read_csv(path, parse_dates=["DATE"], dtype={"SERIES": str})
+
+    def write_bars(self, symbol: str, series: str, df: pd.DataFrame):
+        path = self.bars_path(symbol, series)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False)
+
+    def fetch_range(
+        self, symbol: str, from_date: date, to_date: date, series: str
+    ) -> pd.DataFrame:
+        if pd.bdate_range(from_date, to_date).empty:
+            return pd.DataFrame()
+
+        try:
+            return self.fetch(
+                symbol=symbol, from_date=from_date, to_date=to_date, series=series
+            )
+        except KeyError:
+            # jugaad_data fails to build a frame when the range has no bars.
+            return pd.DataFrame()
+
+    def missing_ranges(
+        self, symbol: str, from_date: date, to_date: date, series: str
+    ) -> List[Tuple[date, date]]:
+        coverage = self.read_coverage(symbol, series)
+        if coverage is None:
+            return [(from_date, to_date)]
+
+        covered_from, covered_to = coverage
+        ranges = []
+        if from_date < covered_from:
+            ranges.append((from_date, covered_from - timedelta(days=1)))
+        if to_date > covered_to:
+            ranges.append((covered_to + timedelta(days=1), to_date))
+        return ranges
+
+    def merge(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        frames = [frame for frame in frames if not frame.empty]
+        if len(frames) == 0:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        df["DATE"] = pd.to_datetime(df["DATE"])
+        df = df.drop_duplicates(subset=["DATE"], keep="last")
+        return df.sort_values("DATE").reset_index(drop=True)
+
+    def append_bars(self, symbol: str, series: str, df: pd.DataFrame):
+        path = self.bars_path(symbol, series)
+        if not path.exists():
+            self.write_bars(symbol, series, df)
+            return
+
+        columns = pd.read_csv(path, nrows=0).columns
+        df.reindex(columns=columns).to_csv(path, mode="a", header=False, index=False)
+
+    def extend(self, symbol: str, series: str, to_date: date) -> pd.DataFrame:
+        """
+        Fetch the bars after the last cached date and append the settled ones
+        to the symbol's file. Returns everything that was fetched, oldest first.
+        """
+
+        covered_from, covered_to = self.read_coverage(symbol, series)
+        if to_date <= covered_to:
+            return pd.DataFrame()
+
+        fresh = self.merge(
+            [self.fetch_range(symbol, covered_to + timedelta(days=1), to_date, series)]
+        )
+        settled_to = min(to_date, date.today() - timedelta(days=1))
+        if settled_to <= covered_to:
+            return fresh
+
+        if not fresh.empty:
+            self.append_bars(symbol, series, fresh[fresh["DATE"].dt.date <= settled_to])
+        self.write_coverage(symbol, series, covered_from, settled_to)
+        return fresh
+
+    def sync(self, symbol: str, days: int, series: str = "EQ") -> int:
+        """
+        Bring a symbol's cache up to date, seeding it with `days` of history
+        if it has never been fetched. Returns the number of bars fetched.
+        """
+
+        today = date.today()
+        if self.read_coverage(symbol, series) is None:
+            return len(self.stock_df(symbol, today - timedelta(days=days), today, series))
+
+        return len(self.extend(symbol, series, today))
+
+    def stock_df(
+        self, symbol: str, from_date: date, to_date: date, series: str = "EQ"
+    ) -> pd.DataFrame:
+        """
+        Drop-in replacement for jugaad_data's stock_df which only hits NSE for
+        the part of the range that isn't cached yet. Rows are newest first.
+        """
+
+        coverage = self.read_coverage(symbol, series)
+        stored = self.read_bars(symbol, series)
+
+        if coverage is not None and from_date >= coverage[0]:
+            df = self.merge([stored, self.extend(symbol, series, to_date)])
+        else:
+            ranges = self.missing_ranges(symbol, from_date, to_date, series)
+            fetched = [self.fetch_range(symbol, start, end, series) for start, end in ranges]
+            df = self.merge([stored] + fetched)
+            self.persist(symbol, series, df, from_date, to_date)
+
+        if df.empty:
+            return df
+
+        in_range = (df["DATE"].dt.date >= from_date) & (df["DATE"].dt.date <= to_date)
+        return df[in_range][::-1].reset_index(drop=True)
+
+    def persist(
+        self, symbol: str, series: str, df: pd.DataFrame, from_date: date, to_date: date
+    ):
+        settled_to = min(to_date, date.today() - timedelta(days=1))
+        coverage = self.read_coverage(symbol, series)
+        if coverage is not None:
+            from_date = min(from_date, coverage[0])
+            settled_to = max(settled_to, coverage[1])
+
+        if from_date > settled_to:
+            return
+
+        if not df.empty:
+            self.write_bars(symbol, series, df[df["DATE"].dt.date <= settled_to])
+        else:
+            self.bars_path(symbol, series).parent.mkdir(parents=True, exist_ok=True)
+
+        self.write_coverage(symbol, series, from_date, settled_to)
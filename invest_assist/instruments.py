@@ -0,0 +1,275 @@
+import json
+import os
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+from invest_assist.models import Instrument
+
+
+DEFAULT_INSTRUMENTS_HOME = os.path.join(Path.home(), ".invest_assist", "instruments")
+
+# Columns of the exchange's instrument master and the fields they are kept as.
+MASTER_COLUMNS = {
+    "Exchange": "exchange",
+    "Token": "token",
+    "LotSize": "lot_size",
+    "Symbol": "symbol",
+    "TradingSymbol": "trading_symbol",
+    "Expiry": "expiry",
+    "Instrument": "instrument",
+    "OptionType": "option_type",
+    "StrikePrice": "strike_price",
+    "TickSize": "tick_size",
+}
+NUMERIC_DTYPES = {
+    "token": np.int64,
+    "lot_size": np.int64,
+    "strike_price": np.float64,
+    "tick_size": np.float64,
+}
+FIELDS = list(MASTER_COLUMNS.values()) + ["underlying"]
+
+# Weekly contracts encode their expiry as YY, a one character month and DD.
+WEEKLY_MONTHS = "123456789OND"
+
+
+def underlying_of(trading_symbol: str, expiry: date, symbol: str) -> str:
+    """
+    The underlying a trading symbol is written on, e.g. WIPRO for
+    WIPRO24SEP610PE and SENSEX50 for SENSEX502490527450PE. Falls back to the
+    exchange's asset code when the expiry isn't in the trading symbol.
+    """
+
+    year = f"{expiry.year % 100:02d}"
+    for code in (
+        f"{year}{expiry.strftime('%b').upper()}",
+        f"{year}{WEEKLY_MONTHS[expiry.month - 1]}{expiry.day:02d}",
+    ):
+        end = trading_symbol.find(code)
+        if end > 0:
+            return trading_symbol[:end]
+
+    return symbol
+
+
+class InstrumentMaster:
+    """
+    The derivative contracts of an exchange's instrument master file, such as
+    BFO_symbols.txt, as memory-mapped column files.
+
+    The CSV is parsed once into one .npy file per field, sorted by underlying,
+    expiry, option type and strike, so every (underlying, expiry, option type)
+    is a contiguous run of rows with ascending strikes. A manifest next to the
+    columns holds those runs and the size and modification time of the CSV
+    they came from; load rebuilds the columns when the CSV changes and
+    otherwise only maps them.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        groups: Dict[str, Dict[date, Dict[str, Tuple[int, int]]]],
+    ) -> None:
+        self.directory = Path(directory)
+        self.groups = groups
+        self._columns = None
+
+    @staticmethod
+    def manifest_path(directory: str | Path) -> Path:
+        return Path(directory) / "manifest.json"
+
+    @staticmethod
+    def column_path(directory: str | Path, column: str) -> Path:
+        return Path(directory) / f"{column}.npy"
+
+    @staticmethod
+    def fingerprint(source: str | Path) -> Dict:
+        stat = os.stat(source)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @classmethod
+    def load(
+        cls, source: str | Path, directory: str | Path | None = None
+    ) -> "InstrumentMaster":
+        if directory is None:
+            directory = Path(DEFAULT_INSTRUMENTS_HOME) / Path(source).stem
+
+        manifest_path = cls.manifest_path(directory)
+        if manifest_path.exists():
+            with open(manifest_path, "r") as file:
+                manifest = json.load(file)
+
+            if manifest["source"] == cls.fingerprint(source):
+                return cls.from_manifest(directory, manifest)
+
+        return cls.build(source, directory)
+
+    @classmethod
+    def from_manifest(cls, directory: str | Path, manifest: Dict) -> "InstrumentMaster":
+        groups = {}
+        for underlying, expiry, option_type, start, end in manifest["groups"]:
+            expiries = groups.setdefault(underlying, {})
+            expiries.setdefault(date.fromisoformat(expiry), {})[option_type] = (
+                start,
+                end,
+            )
+        return cls(directory, groups)
+
+    @classmethod
+    def build(cls, source: str | Path, directory: str | Path) -> "InstrumentMaster":
+        df = pd.read_csv(
+            source, usecols=list(MASTER_COLUMNS), dtype=str, keep_default_na=False
+        ).rename(columns=MASTER_COLUMNS)
+
+        df["expiry"] = pd.to_datetime(df["expiry"], format="%d-%b-%Y").dt.date
+        for column, dtype in NUMERIC_DTYPES.items():
+            df[column] = df[column].astype(dtype)
+        df["underlying"] = [
+            underlying_of(trading_symbol, expiry, symbol)
+            for trading_symbol, expiry, symbol in zip(
+                df["trading_symbol"], df["expiry"], df["symbol"]
+            )
+        ]
+        df = df.sort_values(
+            ["underlying", "expiry", "option_type", "strike_price"], kind="stable"
+        ).reset_index(drop=True)
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for field in FIELDS:
+            if field == "expiry":
+                values = df[field].to_numpy(dtype="datetime64[D]")
+            elif field in NUMERIC_DTYPES:
+                values = df[field].to_numpy(dtype=NUMERIC_DTYPES[field])
+            else:
+                values = df[field].to_numpy(dtype=str)
+            np.save(cls.column_path(directory, field), values)
+
+        order = np.argsort(df["trading_symbol"].to_numpy(dtype=str), kind="stable")
+        np.save(cls.column_path(directory, "trading_symbol_order"), order)
+
+        keys = zip(df["underlying"], df["expiry"], df["option_type"])
+        groups = []
+        start = 0
+        for (underlying, expiry, option_type), rows in groupby(keys):
+            end = start + sum(1 for _ in rows)
+            groups.append([underlying, expiry.isoformat(), option_type, start, end])
+            start = end
+
+        manifest = {"source": cls.fingerprint(source), "groups": groups}
+        with open(cls.manifest_path(directory), "w") as file:
+            json.dump(manifest, file)
+
+        return cls.from_manifest(directory, manifest)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        if self._columns is None:
+            self._columns = {
+                column: np.load(self.column_path(self.directory, column), mmap_mode="r")
+                for column in FIELDS + ["trading_symbol_order"]
+            }
+        return self._columns
+
+    def __len__(self) -> int:
+        return len(self.columns()["token"])
+
+    def instrument(self, row: int) -> Instrument:
+        columns = self.columns()
+        return Instrument(**{field: columns[field][row].item() for field in FIELDS})
+
+    def underlyings(self) -> List[str]:
+        return sorted(self.groups)
+
+    def expiries(self, underlying: str) -> List[date]:
+        return sorted(self.groups.get(underlying, {}))
+
+    def next_expiry(self, underlying: str, on: date | None = None) -> date | None:
+        on = on or date.today()
+        upcoming = [expiry for expiry in self.expiries(underlying) if expiry >= on]
+        return upcoming[0] if len(upcoming) > 0 else None
+
+    def rows(
+        self,
+        underlying: str,
+        expiry: date | None = None,
+        option_type: str | None = None,
+    ) -> np.ndarray:
+        """Rows of an underlying's contracts, optionally of one expiry and option type."""
+
+        ranges = [
+            np.arange(*bounds)
+            for contract_expiry, types in sorted(self.groups.get(underlying, {}).items())
+            if expiry is None or contract_expiry == expiry
+            for contract_type, bounds in sorted(types.items())
+            if option_type is None or contract_type == option_type
+        ]
+        return np.concatenate([np.arange(0)] + ranges)
+
+    def contracts(
+        self,
+        underlying: str,
+        expiry: date | None = None,
+        option_type: str | None = None,
+    ) -> List[Instrument]:
+        return [
+            self.instrument(row) for row in self.rows(underlying, expiry, option_type)
+        ]
+
+    def strikes(self, underlying: str, expiry: date, option_type: str) -> np.ndarray:
+        start, end = self.groups.get(underlying, {}).get(expiry, {}).get(option_type, (0, 0))
+        return self.columns()["strike_price"][start:end]
+
+    def lot_size(self, underlying: str, expiry: date | None = None) -> int | None:
+        expiry = expiry or self.next_expiry(underlying)
+        types = self.groups.get(underlying, {}).get(expiry)
+        if not types:
+            return None
+
+        start, _ = next(iter(types.values()))
+        return int(self.columns()["lot_size"][start])
+
+    def around(
+        self,
+        underlying: str,
+        option_type: str,
+        strike_price: float,
+        expiry: date | None = None,
+    ) -> Tuple[Instrument | None, Instrument | None]:
+        """
+        The contracts with the closest strike below and the closest strike
+        above `strike_price`, like OptionChain.around. Contracts struck exactly
+        at the price are in neither. Defaults to the next expiry.
+        """
+
+        expiry = expiry or self.next_expiry(underlying)
+        start, _ = self.groups.get(underlying, {}).get(expiry, {}).get(option_type, (0, 0))
+        strikes = self.strikes(underlying, expiry, option_type)
+
+        below = int(np.searchsorted(strikes, strike_price, side="left")) - 1
+        above = int(np.searchsorted(strikes, strike_price, side="right"))
+
+        return (
+            self.instrument(start + below) if below >= 0 else None,
+            self.instrument(start + above) if above < len(strikes) else None,
+        )
+
+    def find(self, trading_symbol: str) -> Instrument | None:
+        columns = self.columns()
+        order = columns["trading_symbol_order"]
+        symbols = columns["trading_symbol"]
+
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if symbols[order[middle]] < trading_symbol:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(order) and symbols[order[low]] == trading_symbol:
+            return self.instrument(int(order[low]))
+        return None
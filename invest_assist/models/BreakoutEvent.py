@@ -0,0 +1,11 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class BreakoutEvent(BaseModel):
+    symbol: str
+    strategy: str
+    price: float
+    high: float
+    low: float
+    time: datetime
@@ -7,4 +7,10 @@ class HighLowTradesAnalysisResult(BaseModel):
     days: float = 0
     returns: float = 0
     returns_on_risk: float = 0
-    risk_on_investment: float = 0
\ No newline at end of file
+    risk_on_investment: float = 0
+    median_returns: float = 0
+    returns_p10: float = 0
+    returns_p90: float = 0
+    max_drawdown: float = 0
+    expectancy: float = 0
+    profit_factor: float = 0
@@ -0,0 +1,16 @@
+from datetime import date
+from pydantic import BaseModel
+
+
+class Instrument(BaseModel):
+    exchange: str
+    token: int
+    lot_size: int
+    symbol: str
+    trading_symbol: str
+    underlying: str
+    expiry: date
+    instrument: str
+    option_type: str
+    strike_price: float
+    tick_size: float
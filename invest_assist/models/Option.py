@@ -1,7 +1,8 @@
 from datetime import date
-from typing import Dict
 from pydantic import BaseModel
 
+from invest_assist.option_chain import FnoQuote
+
 
 class Option(BaseModel):
     symbol: str
@@ -21,8 +22,8 @@ class Option(BaseModel):
     def change(self) -> float:
         return round((self.current_price - self.initial_price) / self.initial_price, 2)
     
-    def update(self, quotes: Dict):
-        [quote] = [stock for stock in quotes["stocks"] if stock["metadata"]["identifier"] == self.tick]
+    def update(self, quotes: FnoQuote):
+        quote = quotes[self.tick]
 
         self.current_price = quote["metadata"]["lastPrice"] * self.lot_size
         self.underlying_value = quote["underlyingValue"]
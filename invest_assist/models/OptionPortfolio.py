@@ -1,8 +1,9 @@
 from datetime import date
-from typing import List
+from typing import Dict, List
 from pydantic import BaseModel
 
 from invest_assist.models import Option
+from invest_assist.option_chain import FnoQuote
 
 
 class OptionPortfolio(BaseModel):
@@ -43,9 +44,15 @@ class OptionPortfolio(BaseModel):
     def change(self) -> float:
         return round((self.current_value() - self.total_invested()) / self.total_invested(), 2)
 
-    def update(self, quotes):
+    def update(self, quotes: Dict[str, Dict]):
+        indexed = {}
         for option in self.active_options():
-            option.update(quotes[option.symbol])
+            if option.symbol not in quotes:
+                continue
+
+            if option.symbol not in indexed:
+                indexed[option.symbol] = FnoQuote(quotes[option.symbol])
+            option.update(indexed[option.symbol])
 
     def sell_options(self):
         for option in self.active_options():
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class PortfolioBacktestResult(BaseModel):
+    starting_capital: float = 0
+    final_capital: float = 0
+    returns: float = 0
+    worst_case_drawdown: float = 0
+    trades_taken: int = 0
+    trades_skipped: int = 0
+    trades_invalid: int = 0
+    max_open_positions: int = 0
@@ -0,0 +1,16 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+from invest_assist.models.HighLowTradesAnalysisResult import HighLowTradesAnalysisResult
+
+
+class WalkForwardResult(BaseModel):
+    symbol: str
+    train_from: datetime
+    train_to: datetime
+    test_from: datetime
+    test_to: datetime
+    high: int
+    low: int
+    in_sample: HighLowTradesAnalysisResult
+    out_of_sample: HighLowTradesAnalysisResult
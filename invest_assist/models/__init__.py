@@ -5,4 +5,8 @@ from .CumulativeAnalysisResult import *
 from .OptionTrade import *
 from .OptionTradeAnalysisResult import *
 from .Option import *
-from .OptionPortfolio import *
\ No newline at end of file
+from .OptionPortfolio import *
+from .BreakoutEvent import *
+from .WalkForwardResult import *
+from .PortfolioBacktestResult import *
+from .Instrument import *
\ No newline at end of file
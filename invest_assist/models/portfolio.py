@@ -1,9 +1,7 @@
-from functools import reduce
 import math
-from typing import List
+from typing import Dict, List
 from datetime import date
-from pydantic import BaseModel
-from scipy.optimize import newton
+from pydantic import BaseModel, PrivateAttr
 from itertools import chain
 
 
@@ -12,17 +10,122 @@ def flatten_array(arr):
 
 
 class Portfolio(BaseModel):
+    """
+    Capital, risk and the holdings bought with them.
+
+    The active holdings are kept in an index by their position in `holdings`,
+    along with the running amount invested in them and their current value,
+    so summaries don't scan every holding ever closed. Holdings appended to
+    `holdings` directly are picked up on the next read. Selling and price
+    updates have to go through the portfolio to keep the totals in step.
+
+    Every change made through the portfolio is also recorded as an event
+    that `take_events` hands to the journal, and `apply_event` replays it
+    through the matching `apply_*` method without recording it again.
+    """
+
     current_id: int = 0
     capital: float
     risk_percent: float
     cash_input: float = 0
     holdings: List["Holding"]
 
+    _active: Dict[int, "Holding"] = PrivateAttr(default_factory=dict)
+    _indexed: int = PrivateAttr(default=0)
+    _invested: float = PrivateAttr(default=0)
+    _current_value: float = PrivateAttr(default=0)
+    _events: List[Dict] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context) -> None:
+        self.index_holdings()
+
+    def index_holdings(self):
+        """Index the holdings added since the last call, or all of them if some were removed."""
+
+        if len(self.holdings) < self._indexed:
+            self._active = {}
+            self._indexed = 0
+            self._invested = 0
+            self._current_value = 0
+
+        for position in range(self._indexed, len(self.holdings)):
+            holding = self.holdings[position]
+            if not holding.sold:
+                self._active[position] = holding
+                self._invested += holding.buying_price * holding.units
+                self._current_value += holding.current_price * holding.units
+
+        self._indexed = len(self.holdings)
+
+    def active_index(self) -> Dict[int, "Holding"]:
+        if self._indexed != len(self.holdings):
+            self.index_holdings()
+        return self._active
+
+    def remove_sold(self):
+        sold = [
+            position for position, holding in self.active_index().items() if holding.sold
+        ]
+        for position in sold:
+            holding = self._active.pop(position)
+            self._invested -= holding.buying_price * holding.units
+            self._current_value -= holding.current_price * holding.units
+
+        if len(self._active) == 0:
+            self._invested = 0
+            self._current_value = 0
+
+    def record(self, kind: str, **fields):
+        self._events.append({"kind": kind, **fields})
+
+    def take_events(self) -> List[Dict]:
+        events, self._events = self._events, []
+        return events
+
+    def apply_event(self, event: Dict):
+        fields = {
+            field: value
+            for field, value in event.items()
+            if field not in ("kind", "time")
+        }
+        getattr(self, f"apply_{event['kind']}")(**fields)
+
+    def update_current_price(self, holding: "Holding", new_price: float) -> bool:
+        is_price_updated = self.apply_price(holding.id, new_price, holding)
+        self.record("price", id=holding.id, current_price=float(new_price))
+        return is_price_updated
+
+    def apply_price(
+        self, id: int, current_price: float, holding: "Holding | None" = None
+    ) -> bool:
+        self.active_index()
+        holding = holding if holding is not None else self.find_by_id(id)
+        if not holding.sold:
+            self._current_value += (current_price - holding.current_price) * holding.units
+        return holding.update_current_price(current_price)
+
+    def update_stop_loss(self, holding: "Holding", new_stop_loss: float) -> bool:
+        is_stop_loss_changed = holding.update_stop_loss(new_stop_loss)
+        if is_stop_loss_changed:
+            self.record("stop_loss", id=holding.id, stop_loss=float(new_stop_loss))
+        return is_stop_loss_changed
+
+    def apply_stop_loss(self, id: int, stop_loss: float) -> bool:
+        return self.find_by_id(id).update_stop_loss(stop_loss)
+
     def update_risk(self, new_risk: float) -> float:
-        self.risk_percent = new_risk
+        self.record("risk", risk_percent=new_risk)
+        return self.apply_risk(new_risk)
+
+    def apply_risk(self, risk_percent: float) -> float:
+        self.risk_percent = risk_percent
         return self.risk_percent
 
     def update_capital(self, amount: float) -> float:
+        self.record("capital", amount=amount)
+        return self.apply_capital(amount)
+
+    def apply_capital(self, amount: float) -> float:
         self.capital += amount
         self.cash_input += amount
         return self.capital
@@ -34,21 +137,34 @@ class Portfolio(BaseModel):
         return [holding for holding in self.active_stocks() if holding.symbol == symbol]
 
     def sell_by_symbol(self, symbol: str, selling_price: float | None) -> float:
-        holdings_to_sell = self.find_by_symbol(symbol)
+        ids = [holding.id for holding in self.find_by_symbol(symbol)]
+        return self.sell_by_ids(ids, selling_price)
+
+    def sell_by_id(self, id: int, selling_price: float | None) -> float:
+        return self.sell_by_ids([id], selling_price)
+
+    def sell_by_ids(self, ids: List[int], selling_price: float | None) -> float:
+        selling_date = date.today().isoformat()
+        sold_for = self.apply_sell(ids, selling_price, selling_date)
+        self.record(
+            "sell", ids=ids, selling_price=selling_price, selling_date=selling_date
+        )
+        return sold_for
+
+    def apply_sell(
+        self, ids: List[int], selling_price: float | None, selling_date: str
+    ) -> float:
+        holdings_to_sell = [self.find_by_id(id) for id in ids]
         returns = 0
         for holding in holdings_to_sell:
             sold_for = holding.sell(selling_price)
+            holding.selling_date = date.fromisoformat(selling_date)
             returns += holding.returns()
 
-        self.update_capital(returns)
+        self.remove_sold()
+        self.apply_capital(returns)
         return sold_for
 
-    def sell_by_id(self, id: int, selling_price: float | None) -> float:
-        holding_to_sell = self.find_by_id(id)
-        final_selling_price = holding_to_sell.sell(selling_price)
-        self.update_capital(holding_to_sell.returns())
-        return final_selling_price
-
     def sell_holdings(
         self, id: int | None, symbol: str | None, selling_price: float | None
     ) -> float:
@@ -62,17 +178,15 @@ class Portfolio(BaseModel):
         return self.current_id
 
     def active_stocks(self) -> List["Holding"]:
-        return [holding for holding in self.holdings if not holding.sold]
+        return list(self.active_index().values())
 
     def invested(self) -> float:
-        return reduce(
-            lambda x, y: x + (y.buying_price * y.units), self.active_stocks(), 0
-        )
+        self.active_index()
+        return self._invested
 
     def current_value(self) -> float:
-        return reduce(
-            lambda x, y: x + (y.current_price * y.units), self.active_stocks(), 0
-        )
+        self.active_index()
+        return self._current_value
 
     def remaining_capital(self) -> float:
         return self.capital - self.invested()
@@ -135,8 +249,17 @@ class Portfolio(BaseModel):
 
         holding.id = self.get_next_id()
         self.holdings.append(holding)
+        self.index_holdings()
+        self.record("buy", holding=holding.model_dump(mode="json"))
         return holding
 
+    def apply_buy(self, holding: Dict) -> "Holding":
+        bought = Holding.model_validate(holding)
+        self.current_id = max(self.current_id, bought.id)
+        self.holdings.append(bought)
+        self.index_holdings()
+        return bought
+
 
 class Holding(BaseModel):
     id: int | None = None
@@ -184,3 +307,9 @@ class HistoricalAnalysisResult(BaseModel):
     days_per_return: int
     total_trades: int
     winning_percentage: float
+    median_returns: float = 0
+    returns_p10: float = 0
+    returns_p90: float = 0
+    max_drawdown: float = 0
+    expectancy: float = 0
+    profit_factor: float = 0
@@ -0,0 +1,193 @@
+import threading
+import time
+from typing import Callable, Dict, Tuple
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+RETRY_STATUSES = {401, 403, 429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Spaces calls at least 1 / rate seconds apart across all threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        time.sleep(max(0, slot - now))
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that waits for the rate limiter of a request's host before sending it."""
+
+    def __init__(self, rate_limiter: Callable[[str], RateLimiter], **kwargs) -> None:
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.rate_limiter(request.url).wait()
+        return super().send(request, **kwargs)
+
+
+class NSEClient:
+    """
+    Thread-safe client for the NSE live endpoints used by the commands.
+
+    Unlike jugaad_data's NSELive it is cheap to construct: the session and its
+    cookies are set up on the first request and then shared by every thread.
+    Requests are rate limited per host and retried with exponential backoff.
+    Responses of the routes in `cache_ttls` are reused for that many seconds
+    per (route, parameters), so commands that ask for the same chain or
+    quote twice in a run only fetch it once.
+    """
+
+    base_url = "https://www.nseindia.com/api"
+    page_url = "https://www.nseindia.com/get-quotes/equity?symbol=LT"
+    routes = {
+        "stock_quote": "/quote-equity",
+        "stock_quote_fno": "/quote-derivative",
+        "equities_option_chain": "/option-chain-equities",
+    }
+    headers = {
+        "Referer": "https://www.nseindia.com/get-quotes/equity?symbol=SBIN",
+        "X-Requested-With": "XMLHttpRequest",
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/80.0.3987.132 Safari/537.36",
+        "Accept": "*/*",
+        "Accept-Encoding": "gzip, deflate",
+        "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        page_url: str | None = None,
+        requests_per_second: float = 5,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10,
+        pool_size: int = 32,
+        cache_ttls: Dict[str, float] | None = None,
+    ) -> None:
+        if retries < 0:
+            raise ValueError(f"retries must be at least 0, got {retries}")
+
+        self.base_url = base_url or self.base_url
+        self.page_url = page_url or self.page_url
+        self.requests_per_second = requests_per_second
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache_ttls = cache_ttls or {}
+        self.lock = threading.Lock()
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.responses: Dict[Tuple, Tuple[float, Dict]] = {}
+        self._session: requests.Session | None = None
+
+    def session(self) -> requests.Session:
+        with self.lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(self.headers)
+                self.refresh_cookies(session)
+                self._session = session
+
+            return self._session
+
+    def refresh_cookies(self, session: requests.Session):
+        try:
+            session.get(self.page_url, timeout=self.timeout)
+        except requests.RequestException:
+            pass
+
+    def share_limits(self, session: requests.Session):
+        """
+        Make another library's session, such as the one jugaad_data fetches
+        history with, wait on this client's per-host rate limiters and retry
+        throttled or failed requests with the same backoff.
+        """
+
+        adapter = RateLimitedAdapter(
+            self.rate_limiter,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(
+                total=self.retries,
+                backoff_factor=self.backoff,
+                status_forcelist=sorted(RETRY_STATUSES - {401, 403}),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def rate_limiter(self, url: str) -> RateLimiter:
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.rate_limiters:
+                self.rate_limiters[host] = RateLimiter(self.requests_per_second)
+            return self.rate_limiters[host]
+
+    def get(self, route: str, **params) -> Dict:
+        ttl = self.cache_ttls.get(route, 0)
+        if ttl <= 0:
+            return self.fetch(route, **params)
+
+        key = (route, tuple(sorted(params.items())))
+        with self.lock:
+            cached = self.responses.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        response = self.fetch(route, **params)
+        with self.lock:
+            self.responses[key] = (time.monotonic(), response)
+        return response
+
+    def fetch(self, route: str, **params) -> Dict:
+        url = self.base_url + self.routes[route]
+        session = self.session()
+
+        for attempt in range(self.retries + 1):
+            self.rate_limiter(url).wait()
+            try:
+                response = session.get(url, params=params, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.json()
+
+                error = requests.HTTPError(
+                    f"{response.status_code} for {response.url}", response=response
+                )
+                if response.status_code in (401, 403):
+                    self.refresh_cookies(session)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if attempt < self.retries:
+                time.sleep(self.backoff * 2**attempt)
+
+        raise error
+
+    def stock_quote(self, symbol: str) -> Dict:
+        return self.get("stock_quote", symbol=symbol)
+
+    def stock_quote_fno(self, symbol: str) -> Dict:
+        return self.get("stock_quote_fno", symbol=symbol)
+
+    def equities_option_chain(self, symbol: str) -> Dict:
+        return self.get("equities_option_chain", symbol=symbol)
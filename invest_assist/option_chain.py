@@ -0,0 +1,88 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+
+class OptionChain:
+    """
+    An NSE option chain, as returned by equities_option_chain, indexed once.
+
+    Contracts are grouped by expiry and option type ("CE" or "PE") into
+    strike-sorted lists so the strikes around a price are a binary search,
+    and every contract is kept by its identifier.
+    """
+
+    def __init__(self, option_chain: Dict) -> None:
+        records = option_chain["records"]
+        self.underlying_value = records["underlyingValue"]
+        self.expiries: List[str] = records["expiryDates"]
+        self.strikes: Dict[Tuple[str, str], List[float]] = {}
+        self.identifiers: Dict[Tuple[str, str], List[str]] = {}
+        self.contracts: Dict[str, Dict] = {}
+
+        rows = sorted(records["data"], key=lambda row: row["strikePrice"])
+        for row in rows:
+            for option_type in ("CE", "PE"):
+                if option_type not in row:
+                    continue
+
+                contract = row[option_type]
+                key = (row["expiryDate"], option_type)
+                self.strikes.setdefault(key, []).append(row["strikePrice"])
+                self.identifiers.setdefault(key, []).append(contract["identifier"])
+                self.contracts[contract["identifier"]] = contract
+
+    def nearest_expiry(self) -> str:
+        return self.expiries[0]
+
+    def around(
+        self, option_type: str, strike_price: float, expiry: str | None = None
+    ) -> Tuple[str, str]:
+        """
+        Identifiers of the contracts with the closest strike below and the
+        closest strike above `strike_price`, "" where there is none. Contracts
+        struck exactly at the price are in neither. Defaults to the nearest
+        expiry.
+        """
+
+        key = (expiry or self.nearest_expiry(), option_type)
+        strikes = self.strikes.get(key, [])
+        identifiers = self.identifiers.get(key, [])
+
+        below = bisect_left(strikes, strike_price) - 1
+        above = bisect_right(strikes, strike_price)
+
+        return (
+            identifiers[below] if below >= 0 else "",
+            identifiers[above] if above < len(strikes) else "",
+        )
+
+    def put_ticks(self, strike_price: float) -> List[str]:
+        """The in-the-money put just above the strike, then the one just below."""
+
+        below, above = self.around("PE", strike_price)
+        return [above, below]
+
+    def call_ticks(self, strike_price: float) -> List[str]:
+        """The in-the-money call just below the strike, then the one just above."""
+
+        below, above = self.around("CE", strike_price)
+        return [below, above]
+
+
+class FnoQuote:
+    """An NSE F&O quote, as returned by stock_quote_fno, indexed by contract identifier."""
+
+    def __init__(self, quote: Dict) -> None:
+        self.underlying_value = quote.get("underlyingValue")
+        self.stocks: Dict[str, Dict] = {
+            stock["metadata"]["identifier"]: stock for stock in quote["stocks"]
+        }
+
+    def __getitem__(self, identifier: str) -> Dict:
+        return self.stocks[identifier]
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.stocks
+
+    def get(self, identifier: str) -> Dict | None:
+        return self.stocks.get(identifier)
@@ -0,0 +1,230 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Tuple, Type
+import numpy as np
+import pandas as pd
+
+from invest_assist.models import Portfolio, PortfolioBacktestResult
+from invest_assist.strategies import Strategy
+from invest_assist.trade_ledger import TradeLedger
+
+
+EXIT = 0
+ENTRY = 1
+
+
+def day_numbers(dates: np.ndarray) -> np.ndarray:
+    return pd.to_datetime(dates).to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+
+class PortfolioBacktest:
+    """
+    Replays the trades of many symbols against one shared pool of capital.
+
+    Every symbol's ledger is turned into a date-ordered stream of entries and
+    exits and the streams are k-way merged on a heap, so the whole universe
+    is walked once in time order. Exits on a day are settled before that
+    day's entries. Each entry is sized like Portfolio.buy_stock, with
+    Portfolio.get_units against the capital left after the open positions,
+    and skipped if not even one unit fits. A trade that exits the day it
+    enters is settled as soon as it is taken. Trades whose stop is not below
+    their buying price can't be sized and are counted as invalid.
+
+    The equity curve is taken at the end of every day something happened,
+    with open positions valued at their stop loss, so its drawdown is the
+    worst case: what the portfolio would have lost had every open position
+    been stopped out that day.
+    """
+
+    def __init__(
+        self,
+        portfolio: Portfolio,
+        ledgers: Dict[str, TradeLedger],
+        buying_capacity: float = 1.0,
+    ) -> None:
+        self.portfolio = portfolio
+        self.symbols = list(ledgers)
+        self.ledgers = list(ledgers.values())
+        self.buying_capacity = buying_capacity
+        self.taken: List[Dict] = []
+        self.curve: List[Tuple[int, float, float, int]] = []
+
+    def stream(self, symbol_id: int) -> List[Tuple[int, int, int, int]]:
+        ledger = self.ledgers[symbol_id]
+        entries = day_numbers(ledger.start_date).tolist()
+        exits = day_numbers(ledger.selling_date).tolist()
+        events = [(day, ENTRY, symbol_id, trade) for trade, day in enumerate(entries)]
+        events += [(day, EXIT, symbol_id, trade) for trade, day in enumerate(exits)]
+        return sorted(events)
+
+    def events(self) -> Iterator[Tuple[int, int, int, int]]:
+        return heapq.merge(*[self.stream(i) for i in range(len(self.ledgers))])
+
+    def run(self) -> PortfolioBacktestResult:
+        portfolio = Portfolio(
+            capital=self.portfolio.capital,
+            risk_percent=self.portfolio.risk_percent,
+            holdings=[],
+        )
+        columns = [
+            (
+                ledger.buy_price.tolist(),
+                ledger.initial_stop_loss.tolist(),
+                ledger.selling_price.tolist(),
+                day_numbers(ledger.selling_date).tolist(),
+            )
+            for ledger in self.ledgers
+        ]
+
+        invested = 0.0
+        at_risk = 0.0
+        positions: Dict[Tuple[int, int], int] = {}
+        skipped = 0
+        invalid = 0
+        max_positions = 0
+        self.taken = []
+        self.curve = []
+
+        for day, kind, symbol_id, trade in self.events():
+            buy_prices, stops, selling_prices, exit_days = columns[symbol_id]
+            buy_price = buy_prices[trade]
+            stop_loss = stops[trade]
+
+            if kind == EXIT:
+                units = positions.pop((symbol_id, trade), None)
+                if units is None:
+                    continue
+
+                invested -= units * buy_price
+                at_risk -= units * (buy_price - stop_loss)
+                portfolio.capital += units * (selling_prices[trade] - buy_price)
+                self.mark(day, portfolio.capital, at_risk, len(positions))
+                continue
+
+            if buy_price <= stop_loss:
+                invalid += 1
+                continue
+
+            available = (portfolio.capital - invested) * self.buying_capacity
+            units = portfolio.get_units(available, buy_price, stop_loss)
+            if units <= 0:
+                skipped += 1
+                continue
+
+            if exit_days[trade] == day:
+                portfolio.capital += units * (selling_prices[trade] - buy_price)
+            else:
+                invested += units * buy_price
+                at_risk += units * (buy_price - stop_loss)
+                positions[(symbol_id, trade)] = units
+                max_positions = max(max_positions, len(positions))
+            self.mark(day, portfolio.capital, at_risk, len(positions))
+            self.taken.append(
+                {
+                    "symbol": self.symbols[symbol_id],
+                    "trade": trade,
+                    "units": units,
+                    "buy_price": buy_price,
+                    "stop_loss": stop_loss,
+                    "selling_price": selling_prices[trade],
+                }
+            )
+
+        equity = self.equity_curve()
+        return PortfolioBacktestResult(
+            starting_capital=self.portfolio.capital,
+            final_capital=portfolio.capital,
+            returns=(portfolio.capital - self.portfolio.capital) / self.portfolio.capital,
+            worst_case_drawdown=(
+                float(equity["DRAWDOWN"].max()) if len(equity) > 0 else 0.0
+            ),
+            trades_taken=len(self.taken),
+            trades_skipped=skipped,
+            trades_invalid=invalid,
+            max_open_positions=max_positions,
+        )
+
+    def mark(self, day: int, capital: float, at_risk: float, open_positions: int):
+        """Record the day's equity, replacing what was recorded earlier that day."""
+
+        point = (day, capital, capital - at_risk, open_positions)
+        if len(self.curve) > 0 and self.curve[-1][0] == day:
+            self.curve[-1] = point
+        else:
+            self.curve.append(point)
+
+    def equity_curve(self) -> pd.DataFrame:
+        """
+        Realised capital, capital with open positions at their stops, open
+        positions and worst-case drawdown at the end of every day with events.
+        """
+
+        days, capital, worst_case, open_positions = (
+            zip(*self.curve) if len(self.curve) > 0 else ([], [], [], [])
+        )
+        worst_case = np.array(worst_case, dtype=np.float64)
+        peaks = np.maximum.accumulate(
+            np.concatenate(([self.portfolio.capital], worst_case))
+        )[1:]
+
+        return pd.DataFrame(
+            {
+                "DATE": np.array(days, dtype="datetime64[D]"),
+                "CAPITAL": np.array(capital, dtype=np.float64),
+                "WORST_CASE": worst_case,
+                "OPEN_POSITIONS": np.array(open_positions, dtype=np.int64),
+                "DRAWDOWN": 1 - worst_case / peaks,
+            }
+        )
+
+    def trades(self) -> pd.DataFrame:
+        return pd.DataFrame(self.taken)
+
+
+def symbol_ledger(
+    symbol: str,
+    strategy: Type[Strategy],
+    days: int,
+    stock_data: Callable[[str, date, date, str], pd.DataFrame],
+) -> TradeLedger:
+    today = date.today()
+    df = stock_data(
+        symbol=symbol, from_date=today - timedelta(days=days), to_date=today, series="EQ"
+    )
+    return strategy(df.drop_duplicates()).ledger()
+
+
+def build_ledgers(
+    symbols: List[str],
+    strategy: Type[Strategy],
+    days: int,
+    stock_data: Callable[[str, date, date, str], pd.DataFrame],
+    max_workers: int | None = None,
+    on_done: Callable[[str], None] | None = None,
+) -> Tuple[Dict[str, TradeLedger], Dict[str, Exception]]:
+    """
+    Run a strategy over every symbol on a process pool and collect the
+    ledgers, in the order of `symbols`, and the errors keyed by symbol.
+    """
+
+    ledgers = {}
+    errors = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        future_to_symbol = {
+            executor.submit(symbol_ledger, symbol, strategy, days, stock_data): symbol
+            for symbol in symbols
+        }
+
+        for future in as_completed(future_to_symbol):
+            symbol = future_to_symbol[future]
+            try:
+                ledgers[symbol] = future.result()
+            except Exception as e:
+                errors[symbol] = e
+
+            if on_done is not None:
+                on_done(symbol)
+
+    return {symbol: ledgers[symbol] for symbol in symbols if symbol in ledgers}, errors
@@ -0,0 +1,143 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from invest_assist.models import Portfolio
+
+
+class PortfolioJournal:
+    """
+    A portfolio kept as the events that changed it, one JSON line each.
+
+    `snapshot.json` holds the portfolio as of some number of events along
+    with the byte offset of the next one, so `read` loads it and replays
+    only the tail. `append` writes the new events and, once
+    `snapshot_every` of them have piled up since the snapshot, replaces the
+    snapshot with the portfolio it was given. `initial.json` is never
+    replaced, so `history` can replay every state the portfolio went through
+    without keeping copies of them.
+
+    Once a portfolio is journaled its JSON file is no longer written; the
+    journal replaces it.
+    """
+
+    def __init__(self, path: str | Path, snapshot_every: int = 50) -> None:
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+
+    @property
+    def events_path(self) -> Path:
+        return self.path / "events.jsonl"
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.path / "snapshot.json"
+
+    @property
+    def initial_path(self) -> Path:
+        return self.path / "initial.json"
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists()
+
+    def create(self, portfolio: Portfolio):
+        if self.exists():
+            raise FileExistsError(f"A journal already exists at {self.path}")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        portfolio.take_events()
+        self.events_path.touch()
+        self.write_snapshot(self.initial_path, portfolio, events=0, offset=0)
+        self.write_snapshot(self.snapshot_path, portfolio, events=0, offset=0)
+
+    def replace(self, portfolio: Portfolio):
+        """Start the journal over from `portfolio`, discarding its events and history."""
+
+        for path in [self.events_path, self.snapshot_path, self.initial_path]:
+            path.unlink(missing_ok=True)
+        self.create(portfolio)
+
+    def snapshot(self) -> Dict:
+        if not self.exists():
+            raise FileNotFoundError(f"No portfolio journal at {self.path}")
+
+        with open(self.snapshot_path, "r") as file:
+            return json.load(file)
+
+    def tail(self) -> Tuple[Dict, List[Dict]]:
+        """The latest snapshot and the events recorded after it."""
+
+        snapshot = self.snapshot()
+        with open(self.events_path, "rb") as file:
+            file.seek(snapshot["offset"])
+            events = [json.loads(line) for line in file if line.strip()]
+        return snapshot, events
+
+    def read(self) -> Portfolio:
+        snapshot, events = self.tail()
+        portfolio = Portfolio.model_validate(snapshot["portfolio"])
+        for event in events:
+            portfolio.apply_event(event)
+        return portfolio
+
+    def append(self, portfolio: Portfolio) -> List[Dict]:
+        """
+        Append the events `portfolio` recorded since it was read. The
+        portfolio is expected to be the journal's state after them, and is
+        what the next snapshot is taken of.
+        """
+
+        events = portfolio.take_events()
+        if not events:
+            return events
+
+        time = datetime.now().isoformat(timespec="seconds")
+        lines = "".join(
+            json.dumps({**event, "time": time}) + "\n" for event in events
+        )
+        with open(self.events_path, "a") as file:
+            file.write(lines)
+
+        snapshot, tail = self.tail()
+        if len(tail) >= self.snapshot_every:
+            self.write_snapshot(
+                self.snapshot_path,
+                portfolio,
+                events=snapshot["events"] + len(tail),
+                offset=self.events_path.stat().st_size,
+            )
+        return events
+
+    def history(self) -> Iterator[Tuple[Dict, Portfolio]]:
+        """
+        Each event since the portfolio was created with the portfolio right
+        after it. The same portfolio is yielded every time, changed in place.
+        """
+
+        if not self.exists():
+            raise FileNotFoundError(f"No portfolio journal at {self.path}")
+
+        with open(self.initial_path, "r") as file:
+            portfolio = Portfolio.model_validate(json.load(file)["portfolio"])
+
+        with open(self.events_path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                portfolio.apply_event(event)
+                yield event, portfolio
+
+    @staticmethod
+    def write_snapshot(path: Path, portfolio: Portfolio, events: int, offset: int):
+        snapshot = {
+            "events": events,
+            "offset": offset,
+            "portfolio": portfolio.model_dump(mode="json"),
+        }
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "w") as file:
+            json.dump(snapshot, file)
+        os.replace(temporary, path)
@@ -0,0 +1,177 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+from invest_assist.models import Holding, Portfolio
+
+
+HOLDING_COLUMNS = [
+    "id",
+    "symbol",
+    "units",
+    "current_price",
+    "buying_price",
+    "stop_loss",
+    "strategy",
+    "buying_date",
+    "sold",
+    "historical_data",
+    "selling_price",
+    "risk",
+    "selling_date",
+]
+
+
+class PortfolioStore:
+    """
+    SQLite tables of portfolios and their holdings, one row per holding.
+
+    Commands only need the holdings that are still held, so `read` leaves
+    sold holdings out unless asked for them and `write` upserts the holdings
+    of the portfolio it is given. A portfolio that has closed thousands of
+    trades costs the same to load as one that hasn't.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS portfolios (
+                    name TEXT PRIMARY KEY,
+                    current_id INTEGER NOT NULL,
+                    capital REAL NOT NULL,
+                    risk_percent REAL NOT NULL,
+                    cash_input REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS holdings (
+                    portfolio TEXT NOT NULL REFERENCES portfolios (name),
+                    id INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    units INTEGER NOT NULL,
+                    current_price REAL NOT NULL,
+                    buying_price REAL NOT NULL,
+                    stop_loss REAL NOT NULL,
+                    strategy TEXT NOT NULL,
+                    buying_date TEXT NOT NULL,
+                    sold INTEGER NOT NULL,
+                    historical_data TEXT NOT NULL,
+                    selling_price REAL,
+                    risk REAL NOT NULL,
+                    selling_date TEXT NOT NULL,
+                    PRIMARY KEY (portfolio, id)
+                );
+                CREATE INDEX IF NOT EXISTS holdings_sold ON holdings (portfolio, sold);
+                CREATE INDEX IF NOT EXISTS holdings_symbol ON holdings (portfolio, symbol);
+                """
+            )
+        return self._connection
+
+    def names(self) -> List[str]:
+        rows = self.connection().execute("SELECT name FROM portfolios ORDER BY name")
+        return [row[0] for row in rows]
+
+    def exists(self, name: str) -> bool:
+        row = self.connection().execute(
+            "SELECT 1 FROM portfolios WHERE name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def read(self, name: str, include_sold: bool = False) -> Portfolio:
+        connection = self.connection()
+        row = connection.execute(
+            """
+            SELECT current_id, capital, risk_percent, cash_input
+            FROM portfolios WHERE name = ?
+            """,
+            (name,),
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No portfolio named {name} in {self.path}")
+
+        query = f"SELECT {', '.join(HOLDING_COLUMNS)} FROM holdings WHERE portfolio = ?"
+        if not include_sold:
+            query += " AND sold = 0"
+
+        holdings = [
+            self.holding(dict(zip(HOLDING_COLUMNS, values)))
+            for values in connection.execute(query + " ORDER BY id", (name,))
+        ]
+
+        current_id, capital, risk_percent, cash_input = row
+        return Portfolio(
+            current_id=current_id,
+            capital=capital,
+            risk_percent=risk_percent,
+            cash_input=cash_input,
+            holdings=holdings,
+        )
+
+    def write(self, name: str, portfolio: Portfolio, replace: bool = False):
+        """
+        Upsert the portfolio and the holdings it was given. Holdings it
+        doesn't have, such as the sold ones `read` left out, are kept unless
+        `replace` is set, in which case they are deleted in the same
+        transaction.
+        """
+
+        connection = self.connection()
+        with connection:
+            if replace:
+                connection.execute("DELETE FROM holdings WHERE portfolio = ?", (name,))
+            connection.execute(
+                """
+                INSERT INTO portfolios (name, current_id, capital, risk_percent, cash_input)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    current_id = excluded.current_id,
+                    capital = excluded.capital,
+                    risk_percent = excluded.risk_percent,
+                    cash_input = excluded.cash_input
+                """,
+                (
+                    name,
+                    portfolio.current_id,
+                    portfolio.capital,
+                    portfolio.risk_percent,
+                    portfolio.cash_input,
+                ),
+            )
+            connection.executemany(
+                f"""
+                INSERT OR REPLACE INTO holdings (portfolio, {', '.join(HOLDING_COLUMNS)})
+                VALUES (?, {', '.join('?' for _ in HOLDING_COLUMNS)})
+                """,
+                [(name, *self.row(holding)) for holding in portfolio.holdings],
+            )
+
+    def replace(self, name: str, portfolio: Portfolio):
+        self.write(name, portfolio, replace=True)
+
+    def import_json(
+        self, name: str, path: str | Path, overwrite: bool = False
+    ) -> Portfolio:
+        with open(path, "r") as raw_portfolio:
+            portfolio = Portfolio.model_validate_json(raw_portfolio.read())
+
+        self.write(name, portfolio, replace=overwrite)
+        return portfolio
+
+    @staticmethod
+    def row(holding: Holding) -> tuple:
+        values = holding.model_dump(mode="json")
+        values["sold"] = int(holding.sold)
+        values["historical_data"] = holding.historical_data.model_dump_json()
+        return tuple(values[column] for column in HOLDING_COLUMNS)
+
+    @staticmethod
+    def holding(values: Dict) -> Holding:
+        values["sold"] = bool(values["sold"])
+        values["historical_data"] = json.loads(values["historical_data"])
+        return Holding.model_validate(values)
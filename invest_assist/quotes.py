@@ -0,0 +1,122 @@
+import json
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from invest_assist.nse_client import NSEClient
+from invest_assist.option_chain import FnoQuote, OptionChain
+from invest_assist.scanner import scan
+
+
+def price_info(quote: Dict) -> Tuple[str, Dict]:
+    """
+    Symbol and priceInfo of an NSE quote, as the strategies' breakout expects.
+
+    Equity quotes carry their own priceInfo. F&O quotes such as the ones from
+    stock_quote_fno only have the underlying's price, which then stands in
+    for the open, high and low as well.
+    """
+
+    symbol = quote["info"]["symbol"]
+    if "priceInfo" in quote:
+        return symbol, quote["priceInfo"]
+
+    price = quote["underlyingValue"]
+    return symbol, {
+        "lastPrice": price,
+        "open": price,
+        "intraDayHighLow": {"max": price, "min": price},
+    }
+
+
+def read_recorded_quotes(path: str | Path) -> List[Dict]:
+    """
+    Quotes saved in a file, either a single quote or a list of quotes in one
+    JSON document, or one quote per line as written by RecordedQuotes.
+    """
+
+    with open(path, "r") as file:
+        text = file.read()
+
+    try:
+        recorded = json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    return recorded if isinstance(recorded, list) else [recorded]
+
+
+class LiveQuotes:
+    """Fetches the equity quote of every symbol from NSE on a bounded thread pool."""
+
+    def __init__(self, client: NSEClient, max_workers: int = 16) -> None:
+        self.client = client
+        self.max_workers = max_workers
+
+    def fetch(self, symbols: List[str]) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+        return scan(symbols, self.client.stock_quote, self.max_workers)
+
+    def exhausted(self, symbols: List[str]) -> bool:
+        return False
+
+
+class ReplayQuotes:
+    """
+    Plays back recorded quotes, the next recorded quote of each symbol on
+    every fetch, so a watch can be run offline.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.pending: Dict[str, deque] = defaultdict(deque)
+        for quote in read_recorded_quotes(path):
+            self.pending[quote["info"]["symbol"]].append(quote)
+
+    def fetch(self, symbols: List[str]) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+        quotes = {
+            symbol: self.pending[symbol].popleft()
+            for symbol in symbols
+            if len(self.pending.get(symbol, ())) > 0
+        }
+        return quotes, {}
+
+    def exhausted(self, symbols: List[str]) -> bool:
+        return all(len(self.pending.get(symbol, ())) == 0 for symbol in symbols)
+
+
+class RecordedQuotes:
+    """Passes the quotes of another source through, appending them to a file."""
+
+    def __init__(self, source, path: str | Path) -> None:
+        self.source = source
+        self.path = path
+
+    def fetch(self, symbols: List[str]) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+        quotes, errors = self.source.fetch(symbols)
+        with open(self.path, "a") as file:
+            for quote in quotes.values():
+                file.write(json.dumps(quote) + "\n")
+        return quotes, errors
+
+    def exhausted(self, symbols: List[str]) -> bool:
+        return self.source.exhausted(symbols)
+
+
+def fetch_chain(client: NSEClient, symbol: str) -> Tuple[OptionChain, FnoQuote]:
+    return (
+        OptionChain(client.equities_option_chain(symbol)),
+        FnoQuote(client.stock_quote_fno(symbol)),
+    )
+
+
+def fetch_chains(
+    client: NSEClient,
+    symbols: List[str],
+    max_workers: int = 16,
+    on_done: Callable[[str], None] | None = None,
+) -> Tuple[Dict[str, Tuple[OptionChain, FnoQuote]], Dict[str, Exception]]:
+    """
+    Option chain and F&O quote of every symbol, fetched on a bounded thread
+    pool, and the errors keyed by symbol.
+    """
+
+    return scan(symbols, lambda symbol: fetch_chain(client, symbol), max_workers, on_done)
@@ -0,0 +1,35 @@
+import concurrent.futures
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+
+def scan(
+    items: Iterable[str],
+    check: Callable[[str], Any],
+    max_workers: int = 16,
+    on_done: Callable[[str], None] | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Run `check` for every item on a bounded thread pool.
+
+    Returns the results and the errors keyed by item, so one failing symbol
+    doesn't abort the scan. `on_done` is called from the calling thread as
+    each item finishes, which makes it safe to drive a progress bar with it.
+    """
+
+    results = {}
+    errors = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_item = {executor.submit(check, item): item for item in items}
+
+        for future in concurrent.futures.as_completed(future_to_item):
+            item = future_to_item[future]
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                errors[item] = e
+
+            if on_done is not None:
+                on_done(item)
+
+    return results, errors
@@ -0,0 +1,91 @@
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple
+import numpy as np
+import pandas as pd
+
+
+PRICE_COLUMNS = ["HIGH", "LOW", "LTP"]
+# ROW numbers the bars of the full frame so dropping duplicate price rows
+# can't merge bars that differ in other columns, and COMPLETE is NaN where
+# any column of the full frame is, so dropping incomplete rows drops the
+# same bars it would on the full frame.
+ROW_COLUMNS = ["ROW", "COMPLETE"]
+
+
+class SharedHistory(Mapping):
+    """
+    Price history of many symbols packed into memory-mapped column files.
+
+    Every column of every symbol lives in one .npy file per column, so worker
+    processes map the same pages instead of each unpickling its own copy of
+    the data. Only the directory and the per-symbol row offsets are pickled.
+    It reads like a dict of symbol to DataFrame, newest bar first, holding
+    the columns the high/low strategies use and the ROW_COLUMNS that make
+    their deduplication and dropna behave as on the full frame.
+    """
+
+    def __init__(self, directory: str, offsets: Dict[str, Tuple[int, int]]) -> None:
+        self.directory = directory
+        self.offsets = offsets
+        self._columns = None
+
+    @classmethod
+    def pack(
+        cls, historical_data: Dict[str, pd.DataFrame], directory: str
+    ) -> "SharedHistory":
+        offsets = {}
+        frames = []
+        start = 0
+        for symbol, df in historical_data.items():
+            df = df.drop_duplicates()
+            df = df[["DATE"] + PRICE_COLUMNS].assign(
+                ROW=np.arange(len(df), dtype=np.float64),
+                COMPLETE=np.where(df.notna().all(axis=1), 1.0, np.nan),
+            )
+            offsets[symbol] = (start, start + len(df))
+            start += len(df)
+            frames.append(df)
+
+        dtypes = {"DATE": "datetime64[ns]"} | {
+            column: np.float64 for column in PRICE_COLUMNS + ROW_COLUMNS
+        }
+        for column, dtype in dtypes.items():
+            values = [df[column].to_numpy(dtype=dtype) for df in frames]
+            np.save(
+                cls.column_path(directory, column),
+                np.concatenate([np.empty(0, dtype=dtype)] + values),
+            )
+
+        return cls(directory, offsets)
+
+    @staticmethod
+    def column_path(directory: str, column: str) -> str:
+        return os.path.join(directory, f"{column}.npy")
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        if self._columns is None:
+            self._columns = {
+                column: np.load(self.column_path(self.directory, column), mmap_mode="r")
+                for column in ["DATE"] + PRICE_COLUMNS + ROW_COLUMNS
+            }
+        return self._columns
+
+    def arrays(self, symbol: str) -> Dict[str, np.ndarray]:
+        start, end = self.offsets[symbol]
+        return {column: values[start:end] for column, values in self.columns().items()}
+
+    def __getitem__(self, symbol: str) -> pd.DataFrame:
+        return pd.DataFrame(self.arrays(symbol))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getstate__(self):
+        return {"directory": self.directory, "offsets": self.offsets}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"], state["offsets"])
@@ -0,0 +1,71 @@
+from typing import Dict
+import numpy as np
+
+
+STATISTICS = [
+    "median_returns",
+    "returns_p10",
+    "returns_p90",
+    "max_drawdown",
+    "expectancy",
+    "profit_factor",
+]
+
+
+# Ratios are capped so results stay finite and survive a JSON round trip,
+# which writes infinity as null and then refuses to read it back.
+MAX_RATIO = 999.0
+
+
+def ratio(gain: float, loss: float) -> float:
+    if loss == 0:
+        return MAX_RATIO if gain > 0 else 0.0
+    return min(gain / loss, MAX_RATIO)
+
+
+def max_drawdown(returns: np.ndarray, compounded: bool) -> float:
+    """
+    Largest fall from a peak of the equity curve of trades taken in order.
+
+    Compounded returns are fractions of the capital and the drawdown is a
+    fraction of the peak. Otherwise returns add up, e.g. in multiples of risk,
+    and the drawdown is in the same unit.
+    """
+
+    if compounded:
+        equity = np.concatenate(([1.0], np.cumprod(1 + returns)))
+        peaks = np.maximum.accumulate(equity)
+        return float(np.max(1 - equity / peaks))
+
+    equity = np.concatenate(([0.0], np.cumsum(returns)))
+    peaks = np.maximum.accumulate(equity)
+    return float(np.max(peaks - equity))
+
+
+def trade_statistics(returns: np.ndarray, compounded: bool) -> Dict[str, float]:
+    """
+    Distribution statistics of per-trade returns in the order they were taken.
+
+    Expectancy is the expected profit per trade in units of the average loss,
+    (win rate * average win - loss rate * average loss) / average loss, and
+    profit factor is gross profit over gross loss. Both are MAX_RATIO when
+    there are wins but no losses.
+    """
+
+    if len(returns) == 0:
+        return {statistic: 0.0 for statistic in STATISTICS}
+
+    p10, median, p90 = np.percentile(returns, [10, 50, 90])
+    wins = returns[returns > 0]
+    losses = -returns[returns < 0]
+    average_loss = losses.mean() if len(losses) > 0 else 0.0
+    expected = (wins.sum() - losses.sum()) / len(returns)
+
+    return {
+        "median_returns": round(float(median), 2),
+        "returns_p10": round(float(p10), 2),
+        "returns_p90": round(float(p90), 2),
+        "max_drawdown": round(max_drawdown(returns, compounded), 2),
+        "expectancy": round(ratio(float(expected), float(average_loss)), 2),
+        "profit_factor": round(ratio(float(wins.sum()), float(losses.sum())), 2),
+    }
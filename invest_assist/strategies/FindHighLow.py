@@ -1,19 +1,48 @@
+import numpy as np
 import pandas as pd
 from invest_assist.models import HighLowTrade
 from invest_assist.trade import Trade
+from invest_assist.trade_ledger import TradeLedger
 from typing import List
 from .strategy import Strategy
+from .simulation import simulate_ledger
+from .sparse_table import SparseTable
 
 
+class HighLowIndex:
+    """
+    Sorted and deduplicated bars of one symbol with sparse tables over HIGH and
+    LOW, so FindHighLow can get the N-day high/low for any N without rolling.
+    Build it once per symbol and share it across every (high, low) pair.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df[::-1].reset_index(drop=True).drop_duplicates()
+        self.highs = SparseTable(self.df["HIGH"].to_numpy(dtype=np.float64), np.maximum)
+        self.lows = SparseTable(self.df["LOW"].to_numpy(dtype=np.float64), np.minimum)
+
+    def frame(self, high: int, low: int) -> pd.DataFrame:
+        df = self.df.assign(
+            CURRENT_HIGH=self.highs.rolling(high), CURRENT_LOW=self.lows.rolling(low)
+        )
+        return df.dropna(how="any").reset_index()
+
 
 class FindHighLow(Strategy):
-    def __init__(self, df: pd.DataFrame, high: int, low: int):
-        self.df = df.copy()
+    def __init__(
+        self, df: pd.DataFrame, high: int, low: int, index: HighLowIndex | None = None
+    ):
+        self.df = df.copy() if index is None else df
         self.high = high
         self.low = low
+        self.index = index
 
 
     def preprocess(self):
+        if self.index is not None:
+            self.df = self.index.frame(self.high, self.low)
+            return
+
         self.df = self.df[::-1].reset_index(drop=True)
         self.df = self.df.drop_duplicates()
 
@@ -31,39 +60,12 @@ class FindHighLow(Strategy):
     def can_update_sell_price(self, trade: Trade, row: pd.Series):
         return row["CURRENT_LOW"] > trade.stop_loss
 
-    def execute(self) -> List[HighLowTrade]:
+    def ledger(self) -> TradeLedger:
         self.preprocess()
+        return simulate_ledger(self.df, self.can_buy(self.df), "CURRENT_LOW")
 
-        trades = []
-        current_trade = None
-
-        for _, row in self.df.iterrows():
-            if current_trade is None and self.can_buy(row):
-                current_trade = HighLowTrade(
-                    buy_price=row["LTP"],
-                    start_date=row["DATE"],
-                    initial_stop_loss=row["CURRENT_LOW"],
-                    stop_loss=row["CURRENT_LOW"],
-                )
-            else:
-
-                if current_trade is not None and self.can_update_sell_price(
-                    current_trade, row
-                ):
-                    current_trade.update_stop_loss(row["CURRENT_LOW"])
-
-                if current_trade is not None and row["LOW"] <= current_trade.stop_loss:
-                    current_trade.sell(row["DATE"])
-                    trades.append(current_trade)
-                    current_trade = None
-
-        if current_trade is not None:
-            current_trade.update_stop_loss(self.df.iloc[-1]["LTP"])
-            current_trade.sell(self.df.iloc[-1]["DATE"])
-
-            trades.append(current_trade)
-
-        return trades
+    def execute(self) -> List[HighLowTrade]:
+        return self.ledger().high_low_trades()
     
     def breakout(self, today: dict) -> bool:
         pass
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from invest_assist.trade import Trade
 from typing import List
@@ -23,3 +24,21 @@ class HighBreakoutFinder:
         self.preprocess()
         row = self.df.iloc[-1]
         return row["HIGH"] >= row["BREAKOUT"]
+
+    @staticmethod
+    def largest_window(df: pd.DataFrame, max_days: int = 100, min_days: int = 2) -> int:
+        """
+        Largest window in [min_days, max_days] whose high the latest bar breaks, or 0.
+
+        Same answer as trying breakout() for every window from max_days down,
+        but from a single running max over the trailing bars. Windows longer
+        than the available history are never a breakout.
+        """
+
+        highs = df.drop_duplicates()["HIGH"].to_numpy()[:max_days]
+        if len(highs) == 0:
+            return 0
+
+        is_breakout = np.maximum.accumulate(highs) <= highs[0]
+        window = len(highs) if is_breakout.all() else int(np.argmin(is_breakout))
+        return window if window >= min_days else 0
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from invest_assist.trade import Trade
 from typing import List
@@ -23,3 +24,21 @@ class LowBreakoutFinder:
         self.preprocess()
         row = self.df.iloc[-1]
         return row["LOW"] <= row["BREAKOUT"]
+
+    @staticmethod
+    def largest_window(df: pd.DataFrame, max_days: int = 100, min_days: int = 2) -> int:
+        """
+        Largest window in [min_days, max_days] whose low the latest bar breaks, or 0.
+
+        Same answer as trying breakout() for every window from max_days down,
+        but from a single running min over the trailing bars. Windows longer
+        than the available history are never a breakout.
+        """
+
+        lows = df.drop_duplicates()["LOW"].to_numpy()[:max_days]
+        if len(lows) == 0:
+            return 0
+
+        is_breakout = np.minimum.accumulate(lows) >= lows[0]
+        window = len(lows) if is_breakout.all() else int(np.argmin(is_breakout))
+        return window if window >= min_days else 0
@@ -1,3 +1,4 @@
+from .donchian import *
 from .forty_twenty import *
 from .moving_average import *
 from .FindHighLow import *
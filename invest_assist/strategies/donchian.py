@@ -0,0 +1,127 @@
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+import pandas as pd
+from invest_assist.trade import Trade
+from invest_assist.trade_ledger import TradeLedger
+from .strategy import Strategy
+from .simulation import simulate_ledger, simulate_trailing_stop
+from .indicators import ChannelBreakoutState, settled_bars
+from .FindHighLow import HighLowIndex
+
+
+class DonchianBreakout(Strategy):
+    """
+    Channel breakout: buy when the day's high is the `high_days` high and
+    trail the stop up to the `low_days` low.
+
+    Strategies such as FortyTwenty are subclasses that only set the two
+    windows, and `ledgers` runs any number of window pairs over one symbol
+    in a single pass.
+    """
+
+    high_days: int
+    low_days: int
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.parameters = {"high_days": cls.high_days, "low_days": cls.low_days}
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df.copy()
+
+    @property
+    def high_column(self) -> str:
+        return f"{self.high_days}D_HIGH"
+
+    @property
+    def low_column(self) -> str:
+        return f"LOWEST_{self.low_days}D"
+
+    def preprocess(self):
+        self.df = self.df[::-1].reset_index(drop=True)
+        self.df = self.df.drop_duplicates()
+
+        self.df[self.high_column] = self.df["HIGH"].rolling(window=self.high_days).max()
+        self.df[self.low_column] = self.df["LOW"].rolling(window=self.low_days).min()
+        self.df.dropna(how="any", inplace=True)
+        self.df = self.df.reset_index()
+
+    def can_buy(self, row: pd.Series) -> bool:
+        return row["HIGH"] == row[self.high_column]
+
+    def can_sell(self, trade: Trade, row: pd.Series) -> bool:
+        return row["LOW"] <= trade.stop_loss
+
+    def can_update_sell_price(self, trade: Trade, row: pd.Series):
+        return row[self.low_column] > trade.stop_loss
+
+    def ledger(self) -> TradeLedger:
+        self.preprocess()
+        return simulate_ledger(self.df, self.can_buy(self.df), self.low_column)
+
+    def execute(self) -> List[Trade]:
+        return self.ledger().trades()
+
+    def get_stop_loss(self) -> float:
+        self.preprocess()
+        return self.df.iloc[-1][self.low_column]
+
+    def live_state(self) -> ChannelBreakoutState:
+        state = ChannelBreakoutState(high_days=self.high_days, low_days=self.low_days)
+        for bar in settled_bars(self.df, max(self.high_days, self.low_days)):
+            state.add_bar(bar)
+        return state
+
+    def breakout(self, today: dict) -> bool:
+        return self.live_state().breakout(today)
+
+    @staticmethod
+    def ledgers(
+        df: pd.DataFrame, windows: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], TradeLedger]:
+        """
+        The ledger of every (high_days, low_days) pair, the same as running
+        each pair's strategy on `df`.
+
+        The frame is reversed and deduplicated once and each distinct window's
+        high or low is read off the HighLowIndex sparse tables once, however
+        many pairs share it.
+        """
+
+        index = HighLowIndex(df)
+        complete = ~index.df.isna().any(axis=1).to_numpy()
+        dates = index.df["DATE"].to_numpy()
+        high = index.df["HIGH"].to_numpy(dtype=np.float64)
+        low = index.df["LOW"].to_numpy(dtype=np.float64)
+        ltp = index.df["LTP"].to_numpy()
+
+        highs: Dict[int, np.ndarray] = {}
+        lows: Dict[int, np.ndarray] = {}
+        ledgers = {}
+        for high_days, low_days in windows:
+            if high_days not in highs:
+                highs[high_days] = index.highs.rolling(high_days)
+            if low_days not in lows:
+                lows[low_days] = index.lows.rolling(low_days)
+
+            current_high = highs[high_days]
+            current_low = lows[low_days]
+            rows = np.flatnonzero(
+                complete & ~np.isnan(current_high) & ~np.isnan(current_low)
+            )
+
+            entries, exits, selling_prices = simulate_trailing_stop(
+                high[rows] == current_high[rows],
+                low[rows],
+                current_low[rows],
+                ltp[rows].astype(np.float64),
+            )
+            ledgers[(high_days, low_days)] = TradeLedger(
+                buy_price=ltp[rows][entries],
+                initial_stop_loss=current_low[rows][entries],
+                selling_price=selling_prices,
+                start_date=dates[rows][entries],
+                selling_date=dates[rows][exits],
+            )
+
+        return ledgers
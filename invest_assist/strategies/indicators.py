@@ -0,0 +1,145 @@
+from collections import deque
+from typing import Dict, List, Mapping
+import pandas as pd
+
+
+class RollingExtreme:
+    """
+    Max (or min) of the last `window` values pushed.
+
+    A monotonic deque keeps only the values that can still become the extreme,
+    so each push costs amortised O(1) and reading the extreme is O(1).
+    """
+
+    def __init__(self, window: int, highest: bool = True) -> None:
+        self.window = window
+        self.highest = highest
+        self.count = 0
+        self.candidates = deque()
+
+    def beats(self, value: float, other: float) -> bool:
+        return value >= other if self.highest else value <= other
+
+    def push(self, value: float):
+        while self.candidates and self.beats(value, self.candidates[-1][1]):
+            self.candidates.pop()
+
+        self.candidates.append((self.count, value))
+        self.count += 1
+
+        if self.candidates[0][0] <= self.count - 1 - self.window:
+            self.candidates.popleft()
+
+    def full(self) -> bool:
+        return self.count >= self.window
+
+    def value(self) -> float:
+        return self.candidates[0][1]
+
+
+class RollingMean:
+    """Mean of the last `window` values pushed, kept as a running sum."""
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+
+    def push(self, value: float):
+        if self.full():
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+    def full(self) -> bool:
+        return len(self.values) == self.window
+
+    def value(self) -> float:
+        return self.total / self.window
+
+    def value_with(self, value: float) -> float:
+        """Mean the window would have if `value` was pushed next."""
+
+        return (self.total - self.values[0] + value) / self.window
+
+
+class ChannelBreakoutState:
+    """
+    Live indicators of a channel breakout strategy such as FortyTwenty.
+
+    Settled bars are fed in with add_bar. A quote for the running session is
+    then checked against the high of the last `high_days` settled bars in
+    O(1), without touching the history again.
+    """
+
+    def __init__(self, high_days: int, low_days: int) -> None:
+        self.highs = RollingExtreme(high_days, highest=True)
+        self.lows = RollingExtreme(low_days, highest=False)
+
+    def add_bar(self, bar: Mapping):
+        self.highs.push(bar["HIGH"])
+        self.lows.push(bar["LOW"])
+
+    def ready(self) -> bool:
+        return self.highs.full() and self.lows.full()
+
+    def stop_loss(self) -> float:
+        return self.lows.value()
+
+    def breakout(self, today: dict) -> bool:
+        if not self.ready():
+            return False
+
+        return today["intraDayHighLow"]["max"] >= self.highs.value()
+
+
+class MovingAverageState:
+    """
+    Live indicators of the MovingAverage strategy.
+
+    The 10 and 20 day means include the running session's price, so a quote
+    is checked with the running sums of the settled closes. A breakout is a
+    buy signal today that wasn't one on the last settled bar.
+    """
+
+    def __init__(self) -> None:
+        self.mean_10 = RollingMean(10)
+        self.mean_20 = RollingMean(20)
+        self.lows = RollingExtreme(10, highest=False)
+        self.could_buy = False
+
+    def add_bar(self, bar: Mapping):
+        self.mean_10.push(bar["CLOSE"])
+        self.mean_20.push(bar["CLOSE"])
+        self.lows.push(bar["LOW"])
+
+        if self.ready():
+            self.could_buy = self.can_buy(
+                bar["LTP"], self.lows.value(), self.mean_10.value(), self.mean_20.value()
+            )
+
+    def ready(self) -> bool:
+        return self.mean_20.full() and self.lows.full()
+
+    def stop_loss(self) -> float:
+        return self.lows.value()
+
+    @staticmethod
+    def can_buy(ltp: float, lowest: float, mean_10: float, mean_20: float) -> bool:
+        return ltp > lowest and mean_10 >= mean_20
+
+    def breakout(self, today: dict) -> bool:
+        if not self.ready() or self.could_buy:
+            return False
+
+        ltp = today["lastPrice"]
+        lowest = min(today["intraDayHighLow"]["min"], self.lows.value())
+        return self.can_buy(
+            ltp, lowest, self.mean_10.value_with(ltp), self.mean_20.value_with(ltp)
+        )
+
+
+def settled_bars(df: pd.DataFrame, days: int) -> List[Dict]:
+    """The last `days` distinct bars of a newest-first history, oldest first."""
+
+    return df[::-1].drop_duplicates().tail(days).to_dict("records")
@@ -1,9 +1,11 @@
-from datetime import datetime
 from typing import List
 import pandas as pd
 
 from invest_assist.trade import Trade
 from .strategy import Strategy
+from invest_assist.trade_ledger import TradeLedger
+from .simulation import simulate_ledger
+from .indicators import MovingAverageState, settled_bars
 
 
 class MovingAverage(Strategy):
@@ -34,77 +36,25 @@ class MovingAverage(Strategy):
     def can_update_sell_price(self, trade: Trade, row: pd.Series):
         return row["LOWEST_10D"] > trade.stop_loss
 
-    def execute(self) -> List[Trade]:
-        self.preprocess()
+    def buy_signals(self) -> pd.Series:
+        above_low = self.df["LTP"] > self.df["LOWEST_10D"]
+        return above_low & (self.df["MEAN_10D"] >= self.df["MEAN_20D"])
 
-        trades = []
-        current_trade = None
-
-        for _, row in self.df.iterrows():
-
-            if current_trade is None and self.can_buy(row):
-                
-                current_trade = Trade(
-                    buy_price=row["LTP"],
-                    start_date=row["DATE"],
-                    initial_stop_loss=row["LOWEST_10D"],
-                )
-            else:
-
-                if current_trade is not None and self.can_update_sell_price(
-                    current_trade, row
-                ):
-                    current_trade.update_stop_loss(row["LOWEST_10D"])
-
-                if current_trade is not None and row["LOW"] <= current_trade.stop_loss:
-                    current_trade.sell(row["DATE"])
-                    trades.append(current_trade)
-                    current_trade = None
-
-        if current_trade is not None:
-            current_trade.stop_loss = self.df.iloc[-1]["LTP"]
-            current_trade.sell(self.df.iloc[-1]["DATE"])
-
-            trades.append(current_trade)
-
-        return trades
-
-    def add_todays_data(self, today: dict):
-        new_row = self.df.iloc[-1].copy()
-        last_19_rows = self.df.tail(19)
-        last_9_rows = self.df.tail(9)
-        new_row["index"] = new_row["index"] + 1
-        new_row["DATE"] = datetime.now()
-        new_row["LTP"] = today["lastPrice"]
-        new_row["OPEN"] = today["open"]
-        new_row["HIGH"] = today["intraDayHighLow"]["max"]
-        new_row["LOW"] = today["intraDayHighLow"]["min"]
-        new_row["CLOSE"] = today["lastPrice"]
-        new_row["LOWEST_10D"] = (
-            new_row["LOW"]
-            if new_row["LOW"] < new_row["LOWEST_10D"]
-            else new_row["LOWEST_10D"]
-        )
-
-        new_row["MEAN_20"] = (last_19_rows["CLOSE"].sum() + new_row["CLOSE"]) / 20
-        new_row["MEAN_10"] = (last_9_rows["CLOSE"].sum() + new_row["CLOSE"]) / 10
-
-        self.df.loc[len(self.df) + 1] = new_row
-
-    def breakout(self, today: dict) -> bool:
+    def ledger(self) -> TradeLedger:
         self.preprocess()
+        return simulate_ledger(self.df, self.buy_signals(), "LOWEST_10D")
 
-        if len(self.df) <= 0:
-            return False
+    def execute(self) -> List[Trade]:
+        return self.ledger().trades()
 
-        self.add_todays_data(today)
-        last_row = self.df.iloc[-1]
-        second_last_row = self.df.iloc[-2]
+    def live_state(self) -> MovingAverageState:
+        state = MovingAverageState()
+        for bar in settled_bars(self.df, 20):
+            state.add_bar(bar)
+        return state
 
-        if self.can_buy(second_last_row):
-            return False
-        
-        return self.can_buy(last_row)
+    def breakout(self, today: dict) -> bool:
+        return self.live_state().breakout(today)
 
     def get_stop_loss(self) -> float:
         self.preprocess()
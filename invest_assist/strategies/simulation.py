@@ -0,0 +1,102 @@
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+
+from invest_assist.trade import Trade
+from invest_assist.trade_ledger import TradeLedger
+
+
+def find_exit(
+    low: np.ndarray, stop_line: np.ndarray, entry: int
+) -> Tuple[int, float] | None:
+    """
+    Trail the stop from `entry` and return the bar and price it gets hit at.
+
+    The stop only ever moves up to the stop line, so it is the running max of
+    the line since entry. The scan starts with a small window and doubles it so
+    a trade costs time proportional to its own length, not the whole history.
+    """
+
+    n = len(low)
+    stop_loss = stop_line[entry]
+    start = entry + 1
+    size = 64
+
+    while start < n:
+        end = min(start + size, n)
+        trail = np.maximum(np.maximum.accumulate(stop_line[start:end]), stop_loss)
+        hits = np.flatnonzero(low[start:end] <= trail)
+
+        if len(hits) > 0:
+            return start + hits[0], trail[hits[0]]
+
+        stop_loss = trail[-1]
+        start = end
+        size *= 2
+
+    return None
+
+
+def simulate_trailing_stop(
+    buy_signals: np.ndarray,
+    low: np.ndarray,
+    stop_line: np.ndarray,
+    ltp: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the buy / trail stop / sell state machine shared by the breakout strategies.
+
+    A trade opens at the first bar with a buy signal while flat, with its stop
+    at that bar's stop line. On every later bar the stop is raised to the stop
+    line if that is higher and the trade is sold once the bar's low reaches it.
+    A trade still open at the end is closed at the last LTP.
+
+    Returns the entry bar, exit bar and selling price of every trade.
+    """
+
+    n = len(low)
+    candidates = np.flatnonzero(buy_signals)
+    entries, exits, selling_prices = [], [], []
+    start = 0
+
+    while True:
+        next_candidate = np.searchsorted(candidates, start)
+        if next_candidate == len(candidates):
+            break
+
+        entry = candidates[next_candidate]
+        entries.append(entry)
+        exit = find_exit(low, stop_line, entry)
+
+        if exit is None:
+            exits.append(n - 1)
+            selling_prices.append(ltp[n - 1])
+            break
+
+        exits.append(exit[0])
+        selling_prices.append(exit[1])
+        start = exit[0] + 1
+
+    return (
+        np.array(entries, dtype=np.int64),
+        np.array(exits, dtype=np.int64),
+        np.array(selling_prices, dtype=np.float64),
+    )
+
+
+def simulate_ledger(
+    df: pd.DataFrame, buy_signals: pd.Series, stop_column: str
+) -> TradeLedger:
+    entries, exits, selling_prices = simulate_trailing_stop(
+        buy_signals.to_numpy(dtype=bool),
+        df["LOW"].to_numpy(dtype=np.float64),
+        df[stop_column].to_numpy(dtype=np.float64),
+        df["LTP"].to_numpy(dtype=np.float64),
+    )
+    return TradeLedger.from_simulation(df, stop_column, entries, exits, selling_prices)
+
+
+def simulate_trades(
+    df: pd.DataFrame, buy_signals: pd.Series, stop_column: str
+) -> List[Trade]:
+    return simulate_ledger(df, buy_signals, stop_column).trades()
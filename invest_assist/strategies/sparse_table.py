@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class SparseTable:
+    """
+    Answers max/min over any window of a series in O(1) after an O(n log n) build.
+
+    Level k holds op(values[i : i + 2**k]) for every i, and any window is covered
+    by two overlapping blocks of the largest power of two that fits in it.
+    `op` must be idempotent, e.g. np.maximum or np.minimum.
+    """
+
+    def __init__(self, values: np.ndarray, op: np.ufunc) -> None:
+        self.op = op
+        self.levels = [np.asarray(values, dtype=np.float64)]
+
+        width = 1
+        while width * 2 <= len(values):
+            previous = self.levels[-1]
+            self.levels.append(op(previous[:-width], previous[width:]))
+            width *= 2
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def query(self, end: int, window: int) -> float:
+        """op over the `window` values ending at and including index `end`."""
+
+        level = window.bit_length() - 1
+        start = end - window + 1
+        block = self.levels[level]
+        return self.op(block[start], block[end - (1 << level) + 1])
+
+    def rolling(self, window: int) -> np.ndarray:
+        """Same as Series.rolling(window) with max/min: NaN until a full window."""
+
+        n = len(self)
+        result = np.full(n, np.nan)
+        if window > n:
+            return result
+
+        level = window.bit_length() - 1
+        block = self.levels[level]
+        starts = np.arange(n - window + 1)
+        result[window - 1 :] = self.op(
+            block[starts], block[starts + window - (1 << level)]
+        )
+        return result
@@ -0,0 +1,155 @@
+import sqlite3
+from typing import Dict, Iterable, List, Set, Tuple
+import numpy as np
+
+from invest_assist.models import HighLowTradesAnalysisResult
+
+
+RESULT_FIELDS = list(HighLowTradesAnalysisResult.model_fields.keys())
+
+
+class SweepStore:
+    """
+    SQLite table of find_high_low results, one row per window pair and symbol.
+
+    Each (high, low) cell of the sweep covers both the high-low and the
+    low-high pair. Whether a cell is done depends on the symbols asked
+    about: it is pending while any of them lacks either pair's result, so
+    growing the universe picks up the new symbols, and symbols saved before
+    an interruption are not run again.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS cells (
+                high INTEGER NOT NULL,
+                low INTEGER NOT NULL,
+                PRIMARY KEY (high, low)
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                type TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                {", ".join(f"{field} REAL NOT NULL" for field in RESULT_FIELDS)},
+                PRIMARY KEY (type, symbol)
+            );
+            """
+        )
+        self.add_missing_fields()
+
+    def add_missing_fields(self):
+        """Add the columns of result fields introduced after the table was made."""
+
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(results)")}
+        with self.connection:
+            for field in RESULT_FIELDS:
+                if field not in columns:
+                    self.connection.execute(
+                        f"ALTER TABLE results ADD COLUMN {field} REAL NOT NULL DEFAULT 0"
+                    )
+
+    def add_cells(self, combinations: List[Tuple[int, int]]):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO cells (high, low) VALUES (?, ?)", combinations
+            )
+
+    def pending_cells(
+        self,
+        symbols: Iterable[str],
+        limit: int,
+        skip: Set[Tuple[int, int]] = frozenset(),
+    ) -> List[Tuple[int, int]]:
+        """The first `limit` cells, outside `skip`, that some of `symbols` lack results for."""
+
+        symbols = list(symbols)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS universe (symbol TEXT PRIMARY KEY)"
+            )
+            self.connection.execute("DELETE FROM universe")
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO universe (symbol) VALUES (?)",
+                [(symbol,) for symbol in symbols],
+            )
+
+        saved = """
+            (SELECT COUNT(*) FROM results
+             WHERE type = {key} AND symbol IN (SELECT symbol FROM universe))
+        """
+        rows = self.connection.execute(
+            f"""
+            SELECT high, low FROM cells
+            WHERE {saved.format(key="high || '-' || low")} < ?
+               OR {saved.format(key="low || '-' || high")} < ?
+            ORDER BY rowid LIMIT ?
+            """,
+            (len(set(symbols)), len(set(symbols)), limit + len(skip)),
+        ).fetchall()
+        return [cell for cell in rows if cell not in skip][:limit]
+
+    def complete_cells(
+        self, symbols: List[str], cells: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """The cells that every one of `symbols` has been saved for."""
+
+        incomplete = set()
+        for symbol in symbols:
+            incomplete.update(self.pending_for_symbol(symbol, cells))
+        return [cell for cell in cells if cell not in incomplete]
+
+    def saved_types(self, symbol: str) -> Set[str]:
+        rows = self.connection.execute(
+            "SELECT type FROM results WHERE symbol = ?", (symbol,)
+        )
+        return {row[0] for row in rows}
+
+    def pending_for_symbol(
+        self, symbol: str, cells: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        saved = self.saved_types(symbol)
+        return [
+            (high, low)
+            for high, low in cells
+            if f"{high}-{low}" not in saved or f"{low}-{high}" not in saved
+        ]
+
+    def save(self, symbol: str, results: Dict[str, List[HighLowTradesAnalysisResult]]):
+        rows = [
+            (key, symbol, *[getattr(result, field) for field in RESULT_FIELDS])
+            for key, key_results in results.items()
+            for result in key_results
+        ]
+        placeholders = ", ".join("?" for _ in range(len(RESULT_FIELDS) + 2))
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO results (type, symbol, {', '.join(RESULT_FIELDS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+
+    def results(self, key: str) -> List[HighLowTradesAnalysisResult]:
+        rows = self.connection.execute(
+            f"SELECT {', '.join(RESULT_FIELDS)} FROM results WHERE type = ?", (key,)
+        )
+        return [
+            HighLowTradesAnalysisResult(**dict(zip(RESULT_FIELDS, row))) for row in rows
+        ]
+
+    def result_columns(
+        self, key: str, symbols: List[str] | None = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        The results of one high/low pair as one array per field, only for
+        `symbols` if given rather than every symbol ever saved.
+        """
+
+        query = f"SELECT {', '.join(RESULT_FIELDS)} FROM results WHERE type = ?"
+        parameters = [key]
+        if symbols is not None:
+            query += f" AND symbol IN ({', '.join('?' for _ in symbols)})"
+            parameters += list(symbols)
+        rows = self.connection.execute(query, parameters).fetchall()
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(RESULT_FIELDS))
+        return {field: values[:, i] for i, field in enumerate(RESULT_FIELDS)}
@@ -0,0 +1,142 @@
+from typing import Iterable, Iterator, List
+import numpy as np
+import pandas as pd
+
+from invest_assist.models import HighLowTrade
+from invest_assist.trade import Trade
+
+
+class TradeLedger:
+    """
+    Closed trades stored column-wise, one NumPy array per field.
+
+    Strategies emit a ledger so analyzers can reduce over whole columns
+    instead of building and walking one object per trade. Indexing or
+    iterating a ledger gives Trade views for the code that prints trades.
+    Dates keep the dtype of the frame they came from: datetime64 columns
+    come back as Timestamps and object columns as the original objects.
+    """
+
+    def __init__(
+        self,
+        buy_price: np.ndarray,
+        initial_stop_loss: np.ndarray,
+        selling_price: np.ndarray,
+        start_date: np.ndarray,
+        selling_date: np.ndarray,
+    ) -> None:
+        self.buy_price = np.asarray(buy_price)
+        self.initial_stop_loss = np.asarray(initial_stop_loss)
+        self.selling_price = np.asarray(selling_price, dtype=np.float64)
+        self.start_date = np.asarray(start_date)
+        self.selling_date = np.asarray(selling_date)
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "TradeLedger":
+        trades = list(trades)
+        return cls(
+            buy_price=[trade.buy_price for trade in trades],
+            initial_stop_loss=[trade.initial_stop_loss for trade in trades],
+            selling_price=[trade.selling_price for trade in trades],
+            start_date=np.array([trade.start_date for trade in trades], dtype=object),
+            selling_date=np.array([trade.selling_date for trade in trades], dtype=object),
+        )
+
+    @classmethod
+    def from_high_low_trades(cls, trades: Iterable[HighLowTrade]) -> "TradeLedger":
+        trades = list(trades)
+        return cls(
+            buy_price=[trade.buy_price for trade in trades],
+            initial_stop_loss=[trade.initial_stop_loss for trade in trades],
+            selling_price=[trade.sell_price for trade in trades],
+            start_date=np.array([trade.start_date for trade in trades], dtype=object),
+            selling_date=np.array([trade.end_date for trade in trades], dtype=object),
+        )
+
+    @classmethod
+    def from_simulation(
+        cls,
+        df: pd.DataFrame,
+        stop_column: str,
+        entries: np.ndarray,
+        exits: np.ndarray,
+        selling_prices: np.ndarray,
+    ) -> "TradeLedger":
+        dates = df["DATE"].to_numpy()
+        return cls(
+            buy_price=df["LTP"].to_numpy()[entries],
+            initial_stop_loss=df[stop_column].to_numpy()[entries],
+            selling_price=selling_prices,
+            start_date=dates[entries],
+            selling_date=dates[exits],
+        )
+
+    def __len__(self) -> int:
+        return len(self.buy_price)
+
+    def __getitem__(self, i: int) -> Trade:
+        trade = Trade(
+            buy_price=self.buy_price[i].item(),
+            start_date=self.dates(self.start_date[i : i + 1])[0],
+            initial_stop_loss=self.initial_stop_loss[i].item(),
+        )
+        trade.update_stop_loss(self.selling_price[i].item())
+        trade.sell(self.dates(self.selling_date[i : i + 1])[0])
+        return trade
+
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(self.trades())
+
+    @staticmethod
+    def dates(column: np.ndarray) -> List:
+        if np.issubdtype(column.dtype, np.datetime64):
+            return list(pd.DatetimeIndex(column))
+        return column.tolist()
+
+    def trades(self) -> List[Trade]:
+        trades = []
+        for buy_price, initial_stop_loss, selling_price, start_date, selling_date in zip(
+            self.buy_price.tolist(),
+            self.initial_stop_loss.tolist(),
+            self.selling_price.tolist(),
+            self.dates(self.start_date),
+            self.dates(self.selling_date),
+        ):
+            trade = Trade(
+                buy_price=buy_price,
+                start_date=start_date,
+                initial_stop_loss=initial_stop_loss,
+            )
+            trade.update_stop_loss(selling_price)
+            trade.sell(selling_date)
+            trades.append(trade)
+
+        return trades
+
+    def high_low_trades(self) -> List[HighLowTrade]:
+        return [
+            HighLowTrade(
+                buy_price=trade.buy_price,
+                start_date=trade.start_date,
+                initial_stop_loss=trade.initial_stop_loss,
+                stop_loss=trade.stop_loss,
+                sell_price=trade.selling_price,
+                end_date=trade.selling_date,
+            )
+            for trade in self.trades()
+        ]
+
+    def returns(self) -> np.ndarray:
+        return (self.selling_price - self.buy_price) / self.buy_price
+
+    def risk(self) -> np.ndarray:
+        return (self.buy_price - self.initial_stop_loss) / self.buy_price
+
+    def returns_on_risk(self) -> np.ndarray:
+        risk = self.risk()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(risk == 0, 0.0, self.returns() / risk)
+
+    def days(self) -> np.ndarray:
+        held = pd.to_datetime(self.selling_date) - pd.to_datetime(self.start_date)
+        return np.asarray(held.days, dtype=np.int64)
@@ -0,0 +1,128 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+from invest_assist.HighLowAnalyzer import HighLowAnalyzer
+from invest_assist.models import HighLowTradesAnalysisResult, WalkForwardResult
+from invest_assist.strategies import HighLowIndex
+from invest_assist.strategies.simulation import simulate_trailing_stop
+from invest_assist.trade_ledger import TradeLedger
+
+
+class WalkForward:
+    """
+    Walk-forward selection of FindHighLow's (high, low) windows for one symbol.
+
+    The history is split into rolling folds of `train_days` bars followed by
+    `test_days` bars. In every fold the pair with the best in-sample score
+    is picked and then scored on the test bars it hasn't seen.
+
+    The N-day highs and lows only look back, so each pair's indicator columns
+    are computed once over the whole history from the symbol's HighLowIndex
+    and every fold just simulates trades on its slice of them.
+    """
+
+    def __init__(
+        self,
+        index: HighLowIndex,
+        pairs: List[Tuple[int, int]],
+        train_days: int,
+        test_days: int,
+        metric: str = "returns",
+        min_trades: int = 5,
+    ) -> None:
+        self.index = index
+        self.pairs = pairs
+        self.train_days = train_days
+        self.test_days = test_days
+        self.metric = metric
+        self.min_trades = min_trades
+
+        df = index.df
+        self.dates = df["DATE"].to_numpy()
+        self.high = df["HIGH"].to_numpy(dtype=np.float64)
+        self.low = df["LOW"].to_numpy(dtype=np.float64)
+        self.ltp = df["LTP"].to_numpy(dtype=np.float64)
+
+    def folds(self) -> List[Tuple[slice, slice]]:
+        folds = []
+        start = 0
+        while start + self.train_days + self.test_days <= len(self.dates):
+            test_from = start + self.train_days
+            folds.append(
+                (slice(start, test_from), slice(test_from, test_from + self.test_days))
+            )
+            start += self.test_days
+        return folds
+
+    def indicators(self, high: int, low: int) -> Tuple[np.ndarray, np.ndarray]:
+        return self.index.highs.rolling(high), self.index.lows.rolling(low)
+
+    def ledger(
+        self, current_high: np.ndarray, current_low: np.ndarray, window: slice
+    ) -> TradeLedger:
+        bars = np.arange(len(self.dates))[window]
+        bars = bars[~np.isnan(current_high[bars]) & ~np.isnan(current_low[bars])]
+
+        entries, exits, selling_prices = simulate_trailing_stop(
+            self.high[bars] == current_high[bars],
+            self.low[bars],
+            current_low[bars],
+            self.ltp[bars],
+        )
+        return TradeLedger(
+            buy_price=self.ltp[bars][entries],
+            initial_stop_loss=current_low[bars][entries],
+            selling_price=selling_prices,
+            start_date=self.dates[bars][entries],
+            selling_date=self.dates[bars][exits],
+        )
+
+    def score(
+        self, current_high: np.ndarray, current_low: np.ndarray, window: slice
+    ) -> HighLowTradesAnalysisResult:
+        return HighLowAnalyzer(self.ledger(current_high, current_low, window)).analyze()
+
+    def select(self, folds: List[Tuple[slice, slice]]) -> List[Tuple[int, int] | None]:
+        best: List[Tuple[float, Tuple[int, int]] | None] = [None] * len(folds)
+
+        for pair in self.pairs:
+            current_high, current_low = self.indicators(*pair)
+            for i, (train, _) in enumerate(folds):
+                result = self.score(current_high, current_low, train)
+                if result.total_trades < self.min_trades:
+                    continue
+
+                value = getattr(result, self.metric)
+                if best[i] is None or value > best[i][0]:
+                    best[i] = (value, pair)
+
+        return [None if choice is None else choice[1] for choice in best]
+
+    def run(self, symbol: str) -> List[WalkForwardResult]:
+        folds = self.folds()
+        chosen = self.select(folds)
+
+        folds_by_pair: Dict[Tuple[int, int], List[int]] = {}
+        for i, pair in enumerate(chosen):
+            if pair is not None:
+                folds_by_pair.setdefault(pair, []).append(i)
+
+        results = {}
+        for pair, fold_ids in folds_by_pair.items():
+            current_high, current_low = self.indicators(*pair)
+            for i in fold_ids:
+                train, test = folds[i]
+                results[i] = WalkForwardResult(
+                    symbol=symbol,
+                    train_from=pd.Timestamp(self.dates[train.start]),
+                    train_to=pd.Timestamp(self.dates[train.stop - 1]),
+                    test_from=pd.Timestamp(self.dates[test.start]),
+                    test_to=pd.Timestamp(self.dates[test.stop - 1]),
+                    high=pair[0],
+                    low=pair[1],
+                    in_sample=self.score(current_high, current_low, train),
+                    out_of_sample=self.score(current_high, current_low, test),
+                )
+
+        return [results[i] for i in sorted(results)]
@@ -0,0 +1,127 @@
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Protocol, Set, Tuple
+
+from invest_assist.models import BreakoutEvent
+from invest_assist.quotes import price_info
+from invest_assist.scanner import scan
+
+
+class QuoteSource(Protocol):
+    def fetch(self, symbols: List[str]) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+        ...
+
+    def exhausted(self, symbols: List[str]) -> bool:
+        ...
+
+
+class Watcher:
+    """
+    Watches symbols for breakouts of one strategy during a session.
+
+    The indicator state of every symbol is built once, concurrently, and kept
+    in memory. Each poll fetches one round of quotes, folds them into the
+    session's running high and low and checks them against that state, so a
+    round costs one quote per symbol. A symbol is reported once per session.
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        strategy_name: str,
+        source: QuoteSource,
+        live_state: Callable[[str], Any],
+        max_workers: int = 16,
+    ) -> None:
+        self.symbols = symbols
+        self.strategy_name = strategy_name
+        self.source = source
+        self.live_state = live_state
+        self.max_workers = max_workers
+        self.reset()
+
+    def reset(self):
+        self.day = date.today()
+        self.states: Dict[str, Any] = {}
+        self.sessions: Dict[str, Dict] = {}
+        self.broken_out: Set[str] = set()
+
+    def load_states(self, symbols: List[str]) -> Dict[str, Exception]:
+        missing = [symbol for symbol in symbols if symbol not in self.states]
+        states, errors = scan(missing, self.live_state, self.max_workers)
+        self.states.update(states)
+        return errors
+
+    def session_quote(self, symbol: str, info: Dict) -> Dict:
+        price = info["lastPrice"]
+        high = max(info["intraDayHighLow"]["max"], price)
+        low = min(info["intraDayHighLow"]["min"], price)
+
+        session = self.sessions.get(symbol)
+        if session is not None:
+            high = max(high, session["intraDayHighLow"]["max"])
+            low = min(low, session["intraDayHighLow"]["min"])
+
+        self.sessions[symbol] = {
+            "lastPrice": price,
+            "open": info["open"] if session is None else session["open"],
+            "intraDayHighLow": {"max": high, "min": low},
+        }
+        return self.sessions[symbol]
+
+    def watching(self) -> List[str]:
+        return [symbol for symbol in self.symbols if symbol not in self.broken_out]
+
+    def poll(self) -> Tuple[List[BreakoutEvent], Dict[str, Exception]]:
+        if date.today() != self.day:
+            self.reset()
+
+        watching = self.watching()
+        quotes, errors = self.source.fetch(watching)
+        errors.update(self.load_states([symbol for symbol in watching if symbol in quotes]))
+
+        events = []
+        for symbol in watching:
+            if symbol not in quotes or symbol not in self.states:
+                continue
+
+            today = self.session_quote(symbol, price_info(quotes[symbol])[1])
+            if not self.states[symbol].breakout(today):
+                continue
+
+            self.broken_out.add(symbol)
+            events.append(
+                BreakoutEvent(
+                    symbol=symbol,
+                    strategy=self.strategy_name,
+                    price=today["lastPrice"],
+                    high=today["intraDayHighLow"]["max"],
+                    low=today["intraDayHighLow"]["min"],
+                    time=datetime.now(),
+                )
+            )
+
+        return events, errors
+
+    def run(
+        self,
+        interval: float,
+        on_event: Callable[[BreakoutEvent], None],
+        on_error: Callable[[str, Exception], None] | None = None,
+    ):
+        """
+        Poll every `interval` seconds until the quote source runs out or
+        every symbol has broken out.
+        """
+
+        while len(self.watching()) > 0 and not self.source.exhausted(self.watching()):
+            started = time.monotonic()
+            events, errors = self.poll()
+
+            for event in events:
+                on_event(event)
+            if on_error is not None:
+                for symbol, error in errors.items():
+                    on_error(symbol, error)
+
+            time.sleep(max(0, interval - (time.monotonic() - started)))
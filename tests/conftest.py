@@ -0,0 +1,21 @@
+import pytest
+
+from invest_assist.models.portfolio import HistoricalAnalysisResult, Holding, Portfolio
+from tests.helpers import analysis_result, make_holding
+
+
+@pytest.fixture()
+def historical_analysis_result():
+    return analysis_result("RELIANCE")
+
+
+@pytest.fixture()
+def holding(historical_analysis_result: HistoricalAnalysisResult):
+    return make_holding(1, "RELIANCE", historical_data=historical_analysis_result)
+
+
+@pytest.fixture()
+def portfolio():
+    """An empty portfolio; modules that need holdings override it."""
+
+    return Portfolio(capital=10000, risk_percent=0.01, cash_input=10000, holdings=[])
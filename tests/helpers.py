@@ -0,0 +1,94 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from invest_assist.models.portfolio import HistoricalAnalysisResult, Holding
+
+
+def random_walk(
+    seed: int | str,
+    bars: int = 400,
+    spread: float = 2,
+    start: str | date = "2015-01-01",
+    end: str | date | None = None,
+    whole: bool = False,
+    repeat: int | None = None,
+) -> pd.DataFrame:
+    """
+    Daily bars of a seeded random walk, newest first like jugaad_data frames.
+
+    A string seed is a symbol. HIGH and LOW are up to `spread` away from the
+    close, and `whole` rounds prices to whole numbers so highs and lows tie
+    as often as real ones do. The bars are dated from `start`, or up to
+    `end` if given, and `repeat` duplicates one bar. Each column has its own
+    stream, so growing `bars` only adds bars at the newest end.
+    """
+
+    if isinstance(seed, str):
+        seed = sum(map(ord, seed))
+
+    close = 100 + np.cumsum(np.random.default_rng([seed, 0]).normal(0, 2, bars))
+    above = np.random.default_rng([seed, 1]).uniform(0, spread, bars)
+    below = np.random.default_rng([seed, 2]).uniform(0, spread, bars)
+    if whole:
+        close, above, below = np.round(close), np.floor(above), np.floor(below)
+
+    dates = (
+        pd.bdate_range(end=end, periods=bars)
+        if end is not None
+        else pd.bdate_range(start=start, periods=bars)
+    )
+    df = pd.DataFrame(
+        {
+            "DATE": dates,
+            "OPEN": close,
+            "HIGH": close + above,
+            "LOW": close - below,
+            "LTP": close,
+            "CLOSE": close,
+        }
+    )
+    if repeat is not None:
+        df = pd.concat([df, df.iloc[[repeat]]])
+    return df[::-1].reset_index(drop=True)
+
+
+def random_walk_history(symbol, from_date, to_date, series) -> pd.DataFrame:
+    """A `get_historical_data` stand-in with a walk per symbol ending on `to_date`."""
+
+    return random_walk(symbol, end=to_date)
+
+
+def analysis_result(symbol: str = "RELIANCE", **fields) -> HistoricalAnalysisResult:
+    return HistoricalAnalysisResult(
+        **{
+            "symbol": symbol,
+            "returns": 1.5,
+            "days_per_return": 40,
+            "total_trades": 33,
+            "winning_percentage": 0.45,
+            **fields,
+        }
+    )
+
+
+def make_holding(id: int = 1, symbol: str = "RELIANCE", **fields) -> Holding:
+    """An open FortyTwenty holding, with `fields` overriding its defaults."""
+
+    return Holding(
+        **{
+            "id": id,
+            "symbol": symbol,
+            "units": 4,
+            "current_price": 340,
+            "buying_price": 330,
+            "stop_loss": 300,
+            "strategy": "FortyTwenty",
+            "buying_date": date(2024, 5, 1),
+            "sold": False,
+            "risk": 200,
+            "historical_data": analysis_result(symbol),
+            **fields,
+        }
+    )
@@ -0,0 +1,95 @@
+import time
+import pytest
+
+from invest_assist.analysis_cache import AnalysisCache
+from invest_assist.analyzer import Analyzer
+from invest_assist.models.portfolio import Portfolio
+from invest_assist.strategies.forty_twenty import FortyTwenty
+from tests.helpers import random_walk
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    return AnalysisCache(tmp_path / "cache" / "analysis.sqlite", max_entries=3)
+
+
+class GrowingHistory:
+    """A random walk per symbol that can grow by a bar."""
+
+    def __init__(self, bars: int = 400) -> None:
+        self.bars = bars
+
+    def __call__(self, symbol, from_date, to_date, series):
+        return random_walk(symbol, self.bars)
+
+
+class CountingFortyTwenty(FortyTwenty):
+    runs = 0
+
+    def ledger(self):
+        CountingFortyTwenty.runs += 1
+        return super().ledger()
+
+
+class TestAnalysisCache:
+    def test_round_trip_and_persistence(self, cache: AnalysisCache):
+        key = AnalysisCache.digest("INFY", 1.5)
+
+        assert cache.get(key) is None
+        cache.put(key, "result")
+
+        assert cache.get(key) == "result"
+        assert AnalysisCache(cache.path).get(key) == "result"
+
+    def test_evicts_least_recently_used(self, cache: AnalysisCache):
+        for key in ["a", "b", "c"]:
+            cache.put(key, key)
+            time.sleep(0.01)
+
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("d", "d")
+
+        assert len(cache) == 3
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ["a", "c", "d"]] == ["a", "c", "d"]
+
+
+class TestCachedAnalyse:
+    def test_reuses_result_until_a_new_bar(self, cache: AnalysisCache):
+        portfolio = Portfolio(current_id=0, capital=10000, risk_percent=0.1, holdings=[])
+        history = GrowingHistory()
+        CountingFortyTwenty.runs = 0
+
+        def analyse():
+            return Analyzer(
+                "INFY", portfolio, CountingFortyTwenty, 3650, history, cache
+            ).analyse()
+
+        first = analyse()
+        assert analyse() == first
+        assert CountingFortyTwenty.runs == 1
+        assert first == Analyzer(
+            "INFY", portfolio, FortyTwenty, 3650, history
+        ).analyse()
+
+        history.bars += 1
+        analyse()
+        assert CountingFortyTwenty.runs == 2
+
+        portfolio.risk_percent = 0.05
+        analyse()
+        assert CountingFortyTwenty.runs == 3
+
+    def test_recomputes_unreadable_entries(self, cache: AnalysisCache):
+        portfolio = Portfolio(current_id=0, capital=10000, risk_percent=0.1, holdings=[])
+        history = GrowingHistory()
+        CountingFortyTwenty.runs = 0
+        analyzer = Analyzer("INFY", portfolio, CountingFortyTwenty, 3650, history, cache)
+        key = analyzer.cache_key(history("INFY", None, None, None))
+        cache.put(key, '{"returns": null}')
+
+        result = analyzer.analyse()
+
+        assert CountingFortyTwenty.runs == 1
+        assert cache.get(key) == result.model_dump_json()
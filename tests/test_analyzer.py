@@ -6,10 +6,12 @@ import pytest
 
 
 from invest_assist.analyzer import Analyzer
-from invest_assist.models.portfolio import Portfolio
+from invest_assist.models.portfolio import HistoricalAnalysisResult, Portfolio
+from invest_assist.strategies import MovingAverage
 from invest_assist.strategies.forty_twenty import FortyTwenty
 from invest_assist.trade import Trade
 from invest_assist.trade_analysis import TradeAnalysis
+from tests.helpers import random_walk_history
 
 
 @pytest.fixture()
@@ -324,3 +326,49 @@ class TestAnalyzer:
         assert result.days_per_return == 0
         assert result.winning_percentage == 0.67
         assert result.total_trades == 3
+
+
+def missing_history(symbol, from_date, to_date, series):
+    if symbol == "GONE":
+        raise KeyError(symbol)
+    return random_walk_history(symbol, from_date, to_date, series)
+
+
+class TestBacktest:
+    def test_matches_one_analyzer_per_pair(self, portfolio: Portfolio):
+        strategies = {"FortyTwenty": FortyTwenty, "MovingAverage": MovingAverage}
+
+        results, errors = Analyzer.backtest(
+            ["REL", "TCS"], portfolio, strategies, 365, random_walk_history, max_workers=2
+        )
+
+        assert errors == {}
+        assert results[["symbol", "strategy"]].values.tolist() == [
+            ["REL", "FortyTwenty"],
+            ["REL", "MovingAverage"],
+            ["TCS", "FortyTwenty"],
+            ["TCS", "MovingAverage"],
+        ]
+        for row in results.to_dict("records"):
+            strategy = strategies[row.pop("strategy")]
+            expected = Analyzer(
+                row["symbol"], portfolio, strategy, 365, random_walk_history
+            ).analyse()
+            assert HistoricalAnalysisResult(**row) == expected
+
+    def test_failing_symbol_is_isolated(self, portfolio: Portfolio):
+        done = []
+
+        results, errors = Analyzer.backtest(
+            ["GONE", "REL"],
+            portfolio,
+            {"FortyTwenty": FortyTwenty},
+            365,
+            missing_history,
+            max_workers=2,
+            on_done=done.append,
+        )
+
+        assert results["symbol"].tolist() == ["REL"]
+        assert list(errors) == [("GONE", "FortyTwenty")]
+        assert sorted(done) == ["GONE", "REL"]
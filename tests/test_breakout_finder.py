@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.strategies import HighBreakoutFinder, LowBreakoutFinder
+
+
+@pytest.fixture()
+def df():
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+    data = {
+        "DATE": pd.bdate_range("2023-01-02", periods=300),
+        "HIGH": np.round(close * 1.01, 1),
+        "LOW": np.round(close * 0.99, 1),
+    }
+    return pd.DataFrame(data)[::-1].reset_index(drop=True)
+
+
+def largest_window_by_scan(finder, df: pd.DataFrame) -> int:
+    for i in range(100, 1, -1):
+        if finder(df, i).breakout():
+            return i
+    return 0
+
+
+class TestLargestWindow:
+    @pytest.mark.parametrize("finder", [HighBreakoutFinder, LowBreakoutFinder])
+    def test_matches_scanning_every_window(self, finder, df: pd.DataFrame):
+        for start in range(0, 150, 30):
+            stock_data = df[start:].reset_index(drop=True)
+            assert finder.largest_window(stock_data, 100) == largest_window_by_scan(
+                finder, stock_data
+            )
+
+    def test_new_high_breaks_every_window(self, df: pd.DataFrame):
+        df.loc[0, "HIGH"] = df["HIGH"].max() + 1
+        assert HighBreakoutFinder.largest_window(df, 100) == 100
+
+    def test_no_breakout(self, df: pd.DataFrame):
+        df.loc[0, "LOW"] = df["LOW"].max() + 1
+        assert LowBreakoutFinder.largest_window(df, 100) == 0
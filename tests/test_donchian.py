@@ -0,0 +1,44 @@
+import pytest
+
+from invest_assist.strategies import DonchianBreakout, FortyTwenty
+from invest_assist.strategies.ThirtyThirtyThree import ThirtyThirtyThree
+from invest_assist.strategies.ThirtyTwentyNine import ThirtyTwentyNine
+from tests.helpers import random_walk
+
+
+def strategy_for(high_days: int, low_days: int):
+    return type(
+        "Window", (DonchianBreakout,), {"high_days": high_days, "low_days": low_days}
+    )
+
+
+class TestDonchianBreakout:
+    def test_registered_strategies_keep_their_windows(self):
+        assert FortyTwenty.parameters == {"high_days": 40, "low_days": 20}
+        assert ThirtyThirtyThree.parameters == {"high_days": 30, "low_days": 33}
+        assert ThirtyTwentyNine.parameters == {"high_days": 30, "low_days": 29}
+
+    def test_columns_follow_windows(self):
+        strategy = ThirtyTwentyNine(random_walk(0, 600, spread=3, whole=True, repeat=100))
+        strategy.preprocess()
+
+        assert strategy.df.columns.tolist()[-2:] == ["30D_HIGH", "LOWEST_29D"]
+        assert strategy.get_stop_loss() == strategy.df.iloc[-1]["LOWEST_29D"]
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_fused_ledgers_match_each_strategy(self, seed: int):
+        df = random_walk(seed, 600, spread=3, whole=True, repeat=100)
+        windows = [(40, 20), (30, 33), (30, 29), (55, 20), (10, 60)]
+
+        ledgers = DonchianBreakout.ledgers(df, windows)
+
+        assert list(ledgers) == windows
+        for window in windows:
+            expected = strategy_for(*window)(df).ledger()
+            fused = ledgers[window]
+            assert len(fused) > 0
+            assert fused.buy_price.tolist() == expected.buy_price.tolist()
+            assert fused.initial_stop_loss.tolist() == expected.initial_stop_loss.tolist()
+            assert fused.selling_price.tolist() == expected.selling_price.tolist()
+            assert fused.start_date.tolist() == expected.start_date.tolist()
+            assert fused.selling_date.tolist() == expected.selling_date.tolist()
@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+from unittest.mock import Mock
+import pandas as pd
+import pytest
+
+from invest_assist.history_store import HistoryStore
+
+
+def bars(from_date: date, to_date: date) -> pd.DataFrame:
+    days = pd.bdate_range(from_date, to_date)
+    rows = [[day, "EQ", 100 + i, 110 + i, 90 + i, 100 + i] for i, day in enumerate(days)]
+    df = pd.DataFrame(rows, columns=["DATE", "SERIES", "OPEN", "HIGH", "LOW", "LTP"])
+    return df[::-1].reset_index(drop=True)
+
+
+@pytest.fixture()
+def fetch():
+    fetch = Mock()
+    fetch.side_effect = lambda symbol, from_date, to_date, series: bars(
+        from_date, to_date
+    )
+    return fetch
+
+
+@pytest.fixture()
+def store(tmp_path, fetch):
+    return HistoryStore(tmp_path, fetch)
+
+
+class TestHistoryStore:
+    def test_first_read_fetches_whole_range(self, store: HistoryStore, fetch: Mock):
+        df = store.stock_df("REL", date(2024, 1, 1), date(2024, 1, 31))
+
+        fetch.assert_called_once_with(
+            symbol="REL", from_date=date(2024, 1, 1), to_date=date(2024, 1, 31), series="EQ"
+        )
+        assert len(df) == 23
+        assert df.iloc[0]["DATE"] == pd.Timestamp(2024, 1, 31)
+        assert df.iloc[-1]["DATE"] == pd.Timestamp(2024, 1, 1)
+
+    def test_cached_range_does_not_fetch(self, store: HistoryStore, fetch: Mock):
+        first = store.stock_df("REL", date(2024, 1, 1), date(2024, 1, 31))
+        fetch.reset_mock()
+
+        second = store.stock_df("REL", date(2024, 1, 10), date(2024, 1, 20))
+
+        fetch.assert_not_called()
+        expected = first[
+            (first["DATE"] >= "2024-01-10") & (first["DATE"] <= "2024-01-20")
+        ]
+        assert second["DATE"].tolist() == expected["DATE"].tolist()
+
+    def test_fetches_only_missing_ranges(self, store: HistoryStore, fetch: Mock):
+        store.stock_df("REL", date(2024, 1, 10), date(2024, 1, 20))
+        fetch.reset_mock()
+
+        df = store.stock_df("REL", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [call.kwargs for call in fetch.call_args_list] == [
+            dict(symbol="REL", from_date=date(2024, 1, 1), to_date=date(2024, 1, 9), series="EQ"),
+            dict(symbol="REL", from_date=date(2024, 1, 21), to_date=date(2024, 1, 31), series="EQ"),
+        ]
+        assert len(df) == 23
+        assert df["DATE"].is_monotonic_decreasing
+
+    def test_weekend_only_range_is_not_fetched(self, store: HistoryStore, fetch: Mock):
+        store.stock_df("REL", date(2024, 1, 1), date(2024, 1, 5))
+        fetch.reset_mock()
+
+        store.stock_df("REL", date(2024, 1, 1), date(2024, 1, 7))
+
+        fetch.assert_not_called()
+
+    def test_todays_bar_is_not_persisted(self, store: HistoryStore, fetch: Mock):
+        today = date.today()
+        store.stock_df("REL", today - timedelta(days=10), today)
+
+        assert store.read_coverage("REL", "EQ")[1] == today - timedelta(days=1)
+        assert (store.read_bars("REL", "EQ")["DATE"].dt.date < today).all()
+
+    def test_sync_appends_bars_after_last_cached_date(
+        self, store: HistoryStore, fetch: Mock
+    ):
+        today = date.today()
+        store.stock_df("REL", today - timedelta(days=30), today - timedelta(days=10))
+        before = store.read_bars("REL", "EQ")
+        fetch.reset_mock()
+
+        store.sync("REL", 4000)
+
+        fetch.assert_called_once_with(
+            symbol="REL",
+            from_date=today - timedelta(days=9),
+            to_date=today,
+            series="EQ",
+        )
+        after = store.read_bars("REL", "EQ")
+        assert after[: len(before)].equals(before)
+        assert after["DATE"].is_monotonic_increasing
+        assert store.read_coverage("REL", "EQ")[1] == today - timedelta(days=1)
+
+    def test_sync_seeds_uncached_symbol(self, store: HistoryStore, fetch: Mock):
+        today = date.today()
+
+        store.sync("REL", 100)
+
+        fetch.assert_called_once_with(
+            symbol="REL",
+            from_date=today - timedelta(days=100),
+            to_date=today,
+            series="EQ",
+        )
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.strategies import FortyTwenty, MovingAverage
+from invest_assist.strategies.indicators import RollingExtreme, RollingMean
+from invest_assist.strategies.ThirtyThirtyThree import ThirtyThirtyThree
+
+
+@pytest.fixture()
+def values():
+    return np.random.default_rng(5).normal(100, 10, 200).round(1)
+
+
+@pytest.fixture()
+def df(values: np.ndarray):
+    return pd.DataFrame(
+        {
+            "DATE": pd.bdate_range("2020-01-01", periods=len(values)),
+            "OPEN": values,
+            "HIGH": values + 2,
+            "LOW": values - 2,
+            "LTP": values,
+            "CLOSE": values,
+        }
+    )[::-1].reset_index(drop=True)
+
+
+def quote(price: float, high: float, low: float) -> dict:
+    return {
+        "lastPrice": price,
+        "open": price,
+        "intraDayHighLow": {"max": high, "min": low},
+    }
+
+
+class TestRollingIndicators:
+    @pytest.mark.parametrize("window", [1, 3, 20, 200])
+    def test_extremes_match_pandas(self, values: np.ndarray, window: int):
+        highs = RollingExtreme(window, highest=True)
+        lows = RollingExtreme(window, highest=False)
+        series = pd.Series(values)
+        expected_highs = series.rolling(window).max()
+        expected_lows = series.rolling(window).min()
+
+        for i, value in enumerate(values):
+            highs.push(value)
+            lows.push(value)
+            assert highs.full() == (i + 1 >= window)
+            if highs.full():
+                assert highs.value() == expected_highs[i]
+                assert lows.value() == expected_lows[i]
+
+    def test_mean(self, values: np.ndarray):
+        mean = RollingMean(10)
+        expected = pd.Series(values).rolling(10).mean()
+
+        for i, value in enumerate(values):
+            if mean.full():
+                assert mean.value_with(value) == pytest.approx(expected[i])
+            mean.push(value)
+            if mean.full():
+                assert mean.value() == pytest.approx(expected[i])
+
+
+class TestLiveState:
+    @pytest.mark.parametrize("strategy,days", [(FortyTwenty, 40), (ThirtyThirtyThree, 30)])
+    def test_channel_breakout(self, df: pd.DataFrame, strategy, days: int):
+        channel_high = df["HIGH"][:days].max()
+
+        assert strategy(df).breakout(quote(100, channel_high, 90))
+        assert not strategy(df).breakout(quote(100, channel_high - 0.1, 90))
+        assert not strategy(df[:days - 1]).breakout(quote(100, 1000, 90))
+
+    def test_channel_stop_loss(self, df: pd.DataFrame):
+        strategy = FortyTwenty(df)
+
+        assert strategy.live_state().stop_loss() == strategy.get_stop_loss()
+
+    def test_moving_average_breakout(self, df: pd.DataFrame):
+        for end in range(0, 150, 7):
+            history = df[end:]
+            for price in [80, 100, 120]:
+                today = pd.DataFrame(
+                    {"CLOSE": [price], "LOW": [price - 5], "LTP": [price]}
+                )
+                bars = pd.concat([history[::-1], today], ignore_index=True)
+                mean_10 = bars["CLOSE"].rolling(10).mean()
+                mean_20 = bars["CLOSE"].rolling(20).mean()
+                lowest = bars["LOW"].rolling(10).min()
+                signals = (bars["LTP"] > lowest) & (mean_10 >= mean_20)
+
+                expected = not signals.iloc[-2] and signals.iloc[-1]
+                actual = MovingAverage(history).breakout(quote(price, price, price - 5))
+                assert actual == expected
@@ -0,0 +1,104 @@
+from datetime import date
+import os
+from pathlib import Path
+import pandas as pd
+import pytest
+
+from invest_assist.instruments import InstrumentMaster, underlying_of
+
+
+MASTER_PATH = Path(__file__).parent.parent / "BFO_symbols.txt"
+
+
+@pytest.fixture(scope="module")
+def master(tmp_path_factory):
+    return InstrumentMaster.load(MASTER_PATH, tmp_path_factory.mktemp("instruments"))
+
+
+@pytest.fixture(scope="module")
+def raw():
+    return pd.read_csv(MASTER_PATH, index_col=False)
+
+
+class TestUnderlying:
+    def test_monthly_and_weekly_contracts(self):
+        assert underlying_of("WIPRO24SEP610PE", date(2024, 9, 12), "WIPROPT") == "WIPRO"
+        assert underlying_of("M&M24SEP3300PE", date(2024, 9, 26), "MNMLOPT") == "M&M"
+        assert (
+            underlying_of("SENSEX502490527450PE", date(2024, 9, 5), "SX50OPT")
+            == "SENSEX50"
+        )
+        assert underlying_of("SENSEX24O0481000CE", date(2024, 10, 4), "BSXOPT") == "SENSEX"
+
+    def test_falls_back_to_symbol(self):
+        assert underlying_of("ODD", date(2024, 9, 5), "ODDOPT") == "ODDOPT"
+
+
+class TestInstrumentMaster:
+    def test_keeps_every_contract(self, master: InstrumentMaster, raw):
+        assert len(master) == len(raw)
+        assert sum(len(master.rows(u)) for u in master.underlyings()) == len(raw)
+
+    def test_find_matches_csv(self, master: InstrumentMaster, raw):
+        for row in raw.sample(50, random_state=0).itertuples():
+            instrument = master.find(row.TradingSymbol)
+            assert instrument.token == row.Token
+            assert instrument.lot_size == row.LotSize
+            assert instrument.strike_price == row.StrikePrice
+            assert instrument.option_type == row.OptionType
+            assert instrument.expiry == pd.to_datetime(row.Expiry).date()
+
+        assert master.find("MISSING24SEP1CE") is None
+
+    def test_contracts_are_grouped_and_sorted(self, master: InstrumentMaster):
+        expiry = date(2024, 9, 12)
+        contracts = master.contracts("WIPRO", expiry, "PE")
+        strikes = [contract.strike_price for contract in contracts]
+
+        assert strikes == sorted(strikes)
+        assert all(contract.underlying == "WIPRO" for contract in contracts)
+        assert all(contract.expiry == expiry for contract in contracts)
+        assert master.strikes("WIPRO", expiry, "PE").tolist() == strikes
+        assert master.lot_size("WIPRO", expiry) == 1500
+
+    def test_around(self, master: InstrumentMaster):
+        expiry = date(2024, 9, 12)
+
+        below, above = master.around("WIPRO", "CE", 603, expiry)
+        assert (below.trading_symbol, above.trading_symbol) == (
+            "WIPRO24SEP600CE",
+            "WIPRO24SEP605CE",
+        )
+
+        below, above = master.around("WIPRO", "PE", 600, expiry)
+        assert (below.strike_price, above.strike_price) == (595, 605)
+
+        strikes = master.strikes("WIPRO", expiry, "PE")
+        assert master.around("WIPRO", "PE", strikes[0] - 1, expiry)[0] is None
+        assert master.around("WIPRO", "PE", strikes[-1] + 1, expiry)[1] is None
+
+    def test_next_expiry(self, master: InstrumentMaster):
+        assert master.next_expiry("WIPRO", date(2024, 9, 13)) == date(2024, 10, 10)
+        assert master.next_expiry("WIPRO", date(2030, 1, 1)) is None
+
+
+class TestCache:
+    def test_reuses_columns_until_source_changes(self, tmp_path):
+        source = tmp_path / "master.txt"
+        source.write_bytes(MASTER_PATH.read_bytes())
+        cache = tmp_path / "cache"
+
+        InstrumentMaster.load(source, cache)
+        token_path = InstrumentMaster.column_path(cache, "token")
+        built_at = token_path.stat().st_mtime_ns
+
+        assert len(InstrumentMaster.load(source, cache)) == len(
+            pd.read_csv(source, index_col=False)
+        )
+        assert token_path.stat().st_mtime_ns == built_at
+
+        lines = source.read_text().splitlines(keepends=True)
+        source.write_text("".join(lines[:11]))
+        os.utime(source, ns=(built_at + 10**9, built_at + 10**9))
+
+        assert len(InstrumentMaster.load(source, cache)) == 10
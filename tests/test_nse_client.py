@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+import requests
+
+from invest_assist.nse_client import NSEClient, RateLimiter
+from invest_assist.scanner import scan
+
+
+class StandInNSE(BaseHTTPRequestHandler):
+    failures = {}
+    hits = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        symbol = parse_qs(url.query).get("symbol", [""])[0]
+        StandInNSE.hits.append((url.path, symbol))
+
+        if StandInNSE.failures.get(symbol, 0) > 0:
+            StandInNSE.failures[symbol] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        body = json.dumps({"priceInfo": {"lastPrice": len(symbol)}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    StandInNSE.failures = {}
+    StandInNSE.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInNSE)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture()
+def client(server: str):
+    return NSEClient(
+        base_url=f"{server}/api",
+        page_url=f"{server}/",
+        requests_per_second=1000,
+        backoff=0.01,
+    )
+
+
+class TestNSEClient:
+    def test_stock_quote(self, client: NSEClient):
+        assert client.stock_quote("INFY") == {"priceInfo": {"lastPrice": 4}}
+        assert StandInNSE.hits == [("/", ""), ("/api/quote-equity", "INFY")]
+
+    def test_retries_failed_requests(self, client: NSEClient):
+        StandInNSE.failures = {"INFY": 2}
+
+        assert client.stock_quote("INFY") == {"priceInfo": {"lastPrice": 4}}
+
+    def test_gives_up_after_retries(self, client: NSEClient):
+        StandInNSE.failures = {"INFY": 10}
+
+        with pytest.raises(requests.HTTPError):
+            client.stock_quote("INFY")
+
+        assert len(StandInNSE.hits) == 1 + client.retries + 1
+
+    def test_scan_shares_one_session(self, client: NSEClient):
+        symbols = [f"SYM{i}" for i in range(40)]
+        StandInNSE.failures = {"SYM3": 10}
+
+        results, errors = scan(symbols, client.stock_quote, max_workers=8)
+
+        assert len(results) == 39
+        assert list(errors.keys()) == ["SYM3"]
+        assert StandInNSE.hits.count(("/", "")) == 1
+
+    def test_caches_configured_routes(self, server: str):
+        client = NSEClient(
+            base_url=f"{server}/api",
+            page_url=f"{server}/",
+            requests_per_second=1000,
+            cache_ttls={"stock_quote_fno": 0.2},
+        )
+
+        for _ in range(3):
+            client.stock_quote_fno("INFY")
+            client.stock_quote_fno("TCS")
+            client.stock_quote("INFY")
+
+        assert StandInNSE.hits.count(("/api/quote-derivative", "INFY")) == 1
+        assert StandInNSE.hits.count(("/api/quote-derivative", "TCS")) == 1
+        assert StandInNSE.hits.count(("/api/quote-equity", "INFY")) == 3
+
+        time.sleep(0.25)
+        client.stock_quote_fno("INFY")
+
+        assert StandInNSE.hits.count(("/api/quote-derivative", "INFY")) == 2
+
+    def test_failures_are_not_cached(self, server: str):
+        client = NSEClient(
+            base_url=f"{server}/api",
+            page_url=f"{server}/",
+            requests_per_second=1000,
+            retries=0,
+            cache_ttls={"stock_quote_fno": 60},
+        )
+        StandInNSE.failures = {"INFY": 1}
+
+        with pytest.raises(requests.HTTPError):
+            client.stock_quote_fno("INFY")
+
+        assert client.stock_quote_fno("INFY") == {"priceInfo": {"lastPrice": 4}}
+
+    def test_rejects_negative_retries(self):
+        with pytest.raises(ValueError):
+            NSEClient(retries=-1)
+
+    def test_shares_limits_with_other_sessions(self, server: str):
+        client = NSEClient(
+            base_url=f"{server}/api", requests_per_second=50, backoff=0.01
+        )
+        session = requests.Session()
+        client.share_limits(session)
+        StandInNSE.failures = {"INFY": 2}
+        start = time.monotonic()
+
+        assert session.get(f"{server}/history", params={"symbol": "INFY"}).ok
+        for _ in range(5):
+            session.get(f"{server}/history", params={"symbol": "TCS"})
+
+        assert StandInNSE.hits.count(("/history", "INFY")) == 3
+        assert list(client.rate_limiters) == [urlparse(server).netloc]
+        assert time.monotonic() - start >= 0.1
+
+
+class TestRateLimiter:
+    def test_spaces_out_calls(self):
+        limiter = RateLimiter(50)
+        start = time.monotonic()
+
+        for _ in range(6):
+            limiter.wait()
+
+        assert time.monotonic() - start >= 0.1
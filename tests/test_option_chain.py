@@ -0,0 +1,146 @@
+from datetime import date
+import json
+from pathlib import Path
+import numpy as np
+import pytest
+
+from invest_assist.models import Option, OptionPortfolio
+from invest_assist.option_chain import FnoQuote, OptionChain
+from invest_assist.quotes import fetch_chains
+
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture()
+def option_data():
+    with open(ROOT / "option.json") as file:
+        return json.load(file)
+
+
+@pytest.fixture()
+def quote_data():
+    with open(ROOT / "quotes.json") as file:
+        return json.load(file)
+
+
+def scan_ticks(option_type, expected_strike_price, option_data):
+    """The linear scan option_analysis used before the chain was indexed."""
+
+    nearest_expiry = option_data["records"]["expiryDates"][0]
+    below, above = "", ""
+    below_diff, above_diff = -1000000, 1000000
+
+    for option in option_data["records"]["data"]:
+        if option_type in option.keys() and option["expiryDate"] == nearest_expiry:
+            diff = option["strikePrice"] - expected_strike_price
+            if diff < 0 and diff > below_diff:
+                below_diff = diff
+                below = option[option_type]["identifier"]
+            if diff > 0 and diff < above_diff:
+                above_diff = diff
+                above = option[option_type]["identifier"]
+
+    return below, above
+
+
+class TestOptionChain:
+    def test_matches_linear_scan(self, option_data):
+        chain = OptionChain(option_data)
+        strikes = [row["strikePrice"] for row in option_data["records"]["data"]]
+        prices = np.concatenate(
+            (np.linspace(min(strikes) - 100, max(strikes) + 100, 500), strikes)
+        )
+
+        for price in prices:
+            below, above = scan_ticks("PE", price, option_data)
+            assert chain.put_ticks(price) == [above, below]
+
+            below, above = scan_ticks("CE", price, option_data)
+            assert chain.call_ticks(price) == [below, above]
+
+    def test_other_expiry(self, option_data):
+        chain = OptionChain(option_data)
+        expiry = chain.expiries[1]
+
+        below, above = chain.around("CE", chain.underlying_value, expiry)
+
+        assert chain.contracts[below]["expiryDate"] == expiry
+        assert chain.contracts[below]["strikePrice"] < chain.underlying_value
+        assert chain.contracts[above]["strikePrice"] > chain.underlying_value
+
+    def test_no_contracts(self, option_data):
+        chain = OptionChain(option_data)
+
+        assert chain.around("CE", 100, "01-Jan-2000") == ("", "")
+
+
+class RecordedClient:
+    def __init__(self, option_data, quote_data, failing):
+        self.option_data = option_data
+        self.quote_data = quote_data
+        self.failing = failing
+
+    def equities_option_chain(self, symbol):
+        if symbol in self.failing:
+            raise ConnectionError(symbol)
+        return self.option_data
+
+    def stock_quote_fno(self, symbol):
+        return self.quote_data
+
+
+class TestFetchChains:
+    def test_isolates_failing_symbols(self, option_data, quote_data):
+        client = RecordedClient(option_data, quote_data, failing={"TCS"})
+        done = []
+
+        chains, errors = fetch_chains(
+            client, ["RELIANCE", "TCS", "INFY"], max_workers=3, on_done=done.append
+        )
+
+        assert sorted(chains) == ["INFY", "RELIANCE"]
+        assert list(errors) == ["TCS"]
+        assert sorted(done) == ["INFY", "RELIANCE", "TCS"]
+        chain, quote = chains["RELIANCE"]
+        assert chain.underlying_value == option_data["records"]["underlyingValue"]
+        assert all(tick in quote for tick in chain.call_ticks(chain.underlying_value))
+
+
+class TestFnoQuote:
+    def test_indexes_by_identifier(self, quote_data):
+        quote = FnoQuote(quote_data)
+
+        for stock in quote_data["stocks"]:
+            assert quote[stock["metadata"]["identifier"]] is stock
+        assert "missing" not in quote
+        assert quote.get("missing") is None
+
+    def test_updates_options(self, quote_data):
+        stock = next(
+            stock
+            for stock in quote_data["stocks"]
+            if stock["metadata"]["instrumentType"] == "Stock Options"
+        )
+        option = Option(
+            symbol="RELIANCE",
+            tick=stock["metadata"]["identifier"],
+            expiry=date(2024, 9, 26),
+            strike=stock["metadata"]["strikePrice"],
+            option_type="CALL",
+            lot_size=250,
+            underlying_value=0,
+            current_price=0,
+            initial_price=100,
+            expected_hit=date(2024, 9, 20),
+        )
+        portfolio = OptionPortfolio(date=date(2024, 9, 1), options=[option])
+
+        portfolio.update({"RELIANCE": quote_data})
+
+        assert option.current_price == stock["metadata"]["lastPrice"] * 250
+        assert option.underlying_value == stock["underlyingValue"]
+
+        portfolio.update({})
+
+        assert option.current_price == stock["metadata"]["lastPrice"] * 250
@@ -2,35 +2,9 @@ import unittest
 from unittest.mock import patch
 import pytest
 from datetime import date
+import numpy as np
 from invest_assist.models.portfolio import HistoricalAnalysisResult, Holding, Portfolio
-
-
-@pytest.fixture()
-def historical_analysis_result():
-    return HistoricalAnalysisResult(
-        symbol="RELIANCE",
-        returns=1.5,
-        days_per_return=40,
-        total_trades=33,
-        winning_percentage=0.45,
-    )
-
-
-@pytest.fixture()
-def holding(historical_analysis_result: HistoricalAnalysisResult):
-    return Holding(
-        id=1,
-        symbol="RELIANCE",
-        units=4,
-        current_price=340,
-        buying_price=330,
-        stop_loss=300,
-        strategy="FortyTwenty",
-        buying_date=date(2024, 5, 1),
-        sold=False,
-        risk=200,
-        historical_data=historical_analysis_result,
-    )
+from invest_assist.statistics import trade_statistics
 
 
 @pytest.fixture()
@@ -273,3 +247,96 @@ class TestPortfolio:
         )
 
         assert actual == expected
+
+    def test_round_trip_with_winning_history(self, portfolio: Portfolio):
+        hd = HistoricalAnalysisResult(
+            symbol="REL",
+            returns=0.3,
+            days_per_return=40,
+            total_trades=2,
+            winning_percentage=1,
+            **trade_statistics(np.array([0.1, 0.2]), compounded=False),
+        )
+        portfolio.buy_stock(
+            symbol="REL",
+            current_price=300,
+            buying_price=300,
+            stop_loss=280,
+            buying_capacity=1,
+            strategy="FortyTwenty",
+            buying_date=date(2024, 5, 1),
+            hd=hd,
+        )
+
+        loaded = Portfolio.model_validate_json(portfolio.model_dump_json())
+
+        assert loaded.holdings[-1].historical_data == hd
+
+
+def scanned_totals(portfolio: Portfolio):
+    active = [holding for holding in portfolio.holdings if not holding.sold]
+    return (
+        [holding.id for holding in active],
+        sum(holding.buying_price * holding.units for holding in active),
+        sum(holding.current_price * holding.units for holding in active),
+    )
+
+
+def maintained_totals(portfolio: Portfolio):
+    return (
+        [holding.id for holding in portfolio.active_stocks()],
+        portfolio.invested(),
+        portfolio.current_value(),
+    )
+
+
+class TestPortfolioAggregates:
+    def test_follow_buys_sells_and_prices(
+        self, portfolio: Portfolio, historical_analysis_result: HistoricalAnalysisResult
+    ):
+        portfolio.capital = 100000
+        for i, symbol in enumerate(["REL", "TCS", "REL", "INFY"]):
+            portfolio.buy_stock(
+                symbol=symbol,
+                current_price=300 + i,
+                buying_price=300 + i,
+                stop_loss=280,
+                buying_capacity=0.2,
+                strategy="FortyTwenty",
+                buying_date=date(2024, 5, 1),
+                hd=historical_analysis_result,
+            )
+        assert len(portfolio.active_stocks()) == 5
+        assert maintained_totals(portfolio) == scanned_totals(portfolio)
+
+        portfolio.update_current_price(portfolio.find_by_id(3), 350)
+        portfolio.sell_by_symbol("REL", 320)
+        assert maintained_totals(portfolio) == scanned_totals(portfolio)
+
+        portfolio.sell_by_id(1, None)
+        portfolio.update_current_price(portfolio.find_by_id(5), 290)
+        assert maintained_totals(portfolio) == scanned_totals(portfolio)
+        assert [holding.id for holding in portfolio.active_stocks()] == [3, 5]
+
+    def test_skip_sold_holdings(
+        self, portfolio: Portfolio, holding: Holding, holding_id_2: Holding
+    ):
+        holding.sell(310)
+        closed = [holding.model_copy(update={"id": i}) for i in range(10, 1000)]
+
+        loaded = Portfolio(
+            current_id=1000,
+            capital=3000,
+            risk_percent=0.1,
+            holdings=closed + [holding_id_2],
+        )
+
+        assert maintained_totals(loaded) == ([2], 600, 1000)
+        assert loaded.return_percent() == 400 / 3000
+
+    def test_pick_up_appended_holdings(self, portfolio: Portfolio, holding_id_2: Holding):
+        assert portfolio.invested() == 1320
+
+        portfolio.holdings.append(holding_id_2)
+
+        assert maintained_totals(portfolio) == scanned_totals(portfolio)
@@ -0,0 +1,166 @@
+from datetime import date
+import numpy as np
+import pytest
+
+from invest_assist.models import Portfolio
+from invest_assist.portfolio_backtest import PortfolioBacktest, build_ledgers
+from invest_assist.strategies.forty_twenty import FortyTwenty
+from invest_assist.trade_ledger import TradeLedger
+from tests.helpers import random_walk_history
+
+
+def ledger(trades):
+    """Ledger from (buy, stop, sell, start, end) tuples with day offsets."""
+
+    start = np.datetime64("2024-01-01")
+    buy, stop, sell, entry, exit = zip(*trades)
+    return TradeLedger(
+        buy_price=np.array(buy, dtype=np.float64),
+        initial_stop_loss=np.array(stop, dtype=np.float64),
+        selling_price=np.array(sell, dtype=np.float64),
+        start_date=start + np.array(entry),
+        selling_date=start + np.array(exit),
+    )
+
+
+class TestPortfolioBacktest:
+    def test_events_are_merged_in_time_order(self, portfolio: Portfolio):
+        backtest = PortfolioBacktest(
+            portfolio,
+            {
+                "A": ledger([(100, 90, 110, 0, 5), (100, 90, 110, 8, 12)]),
+                "B": ledger([(100, 90, 110, 3, 8)]),
+            },
+        )
+
+        events = list(backtest.events())
+
+        assert [event[0] for event in events] == sorted(event[0] for event in events)
+        # Exits come before entries on the same day.
+        day_8 = [event for event in events if event[0] == events[-2][0]]
+        assert [kind for _, kind, _, _ in day_8] == [0, 1]
+
+    def test_sizes_like_portfolio(self, portfolio: Portfolio):
+        backtest = PortfolioBacktest(portfolio, {"A": ledger([(100, 90, 120, 0, 5)])})
+
+        result = backtest.run()
+
+        units = portfolio.get_units(portfolio.capital, 100, 90)
+        assert backtest.trades()["units"].tolist() == [units]
+        assert result.final_capital == portfolio.capital + units * 20
+        assert result.trades_taken == 1
+        assert result.trades_skipped == 0
+
+    def test_skips_trades_once_capital_is_used(self, portfolio: Portfolio):
+        # Each trade risks 100 on a 1 point stop, so it wants all the capital.
+        trades = {
+            symbol: ledger([(100, 99, 101, 0, 10)]) for symbol in ["A", "B", "C"]
+        }
+
+        result = PortfolioBacktest(portfolio, trades).run()
+
+        assert result.trades_taken == 1
+        assert result.trades_skipped == 2
+        assert result.max_open_positions == 1
+
+    def test_exit_frees_capital_for_same_day_entry(self, portfolio: Portfolio):
+        trades = {
+            "A": ledger([(100, 99, 101, 0, 5)]),
+            "B": ledger([(100, 99, 101, 5, 10)]),
+        }
+
+        result = PortfolioBacktest(portfolio, trades).run()
+
+        assert result.trades_taken == 2
+        assert result.trades_skipped == 0
+
+    def test_equity_curve_and_drawdown(self, portfolio: Portfolio):
+        backtest = PortfolioBacktest(
+            portfolio,
+            {
+                "A": ledger(
+                    [
+                        (100, 90, 110, 0, 1),
+                        (100, 90, 80, 2, 3),
+                        (100, 90, 105, 4, 5),
+                    ]
+                )
+            },
+        )
+
+        result = backtest.run()
+        equity = backtest.equity_curve()
+
+        # Open positions count at their stops, so each entry dips the curve by
+        # its risk until the exit. The loss shrinks the capital, so the last
+        # trade is sized smaller.
+        assert equity["CAPITAL"].tolist() == [10000, 10100, 10100, 9900, 9900, 9945]
+        assert equity["WORST_CASE"].tolist() == [9900, 10100, 10000, 9900, 9810, 9945]
+        assert equity["OPEN_POSITIONS"].tolist() == [1, 0, 1, 0, 1, 0]
+        assert equity["DRAWDOWN"].tolist() == pytest.approx(
+            [0.01, 0, 100 / 10100, 200 / 10100, 290 / 10100, 155 / 10100]
+        )
+        assert result.worst_case_drawdown == pytest.approx(290 / 10100)
+        assert result.returns == pytest.approx(-0.0055)
+
+    def test_open_losses_count_towards_drawdown(self, portfolio: Portfolio):
+        # Realised capital never drops below the start, but with A and B
+        # both open a day in, their stops put 2% of it at risk.
+        backtest = PortfolioBacktest(
+            portfolio,
+            {
+                "A": ledger([(100, 90, 150, 0, 2)]),
+                "B": ledger([(100, 90, 95, 1, 4)]),
+            },
+        )
+
+        result = backtest.run()
+        equity = backtest.equity_curve()
+
+        assert equity["DATE"].tolist() == [
+            np.datetime64("2024-01-01") + day for day in [0, 1, 2, 4]
+        ]
+        assert equity["CAPITAL"].tolist() == [10000, 10000, 10500, 10450]
+        assert equity["WORST_CASE"].tolist() == [9900, 9800, 10400, 10450]
+        assert result.worst_case_drawdown == pytest.approx(0.02)
+
+    def test_same_day_trades_are_settled(self, portfolio: Portfolio):
+        backtest = PortfolioBacktest(portfolio, {"A": ledger([(100, 90, 110, 3, 3)])})
+
+        result = backtest.run()
+
+        assert result.trades_taken == 1
+        assert result.trades_skipped == 0
+        assert result.final_capital == portfolio.capital + 100
+        assert backtest.equity_curve()["OPEN_POSITIONS"].tolist() == [0]
+
+    def test_trades_without_risk_are_invalid(self, portfolio: Portfolio):
+        result = PortfolioBacktest(
+            portfolio,
+            {"A": ledger([(100, 100, 110, 0, 5)]), "B": ledger([(100, 90, 110, 0, 5)])},
+        ).run()
+
+        assert result.trades_taken == 1
+        assert result.trades_skipped == 0
+        assert result.trades_invalid == 1
+
+    def test_no_trades(self, portfolio: Portfolio):
+        result = PortfolioBacktest(portfolio, {}).run()
+
+        assert result.final_capital == portfolio.capital
+        assert result.worst_case_drawdown == 0
+        assert len(PortfolioBacktest(portfolio, {}).equity_curve()) == 0
+
+
+class TestBuildLedgers:
+    def test_matches_strategy_ledgers(self):
+        ledgers, errors = build_ledgers(
+            ["REL", "TCS"], FortyTwenty, 365, random_walk_history, max_workers=2
+        )
+
+        assert list(ledgers) == ["REL", "TCS"]
+        assert errors == {}
+        for symbol, symbol_ledger in ledgers.items():
+            expected = FortyTwenty(random_walk_history(symbol, None, date.today(), "EQ")).ledger()
+            assert symbol_ledger.buy_price.tolist() == expected.buy_price.tolist()
+            assert symbol_ledger.selling_price.tolist() == expected.selling_price.tolist()
@@ -0,0 +1,163 @@
+from datetime import date
+import pytest
+from click.testing import CliRunner
+
+from invest_assist.commands.add_capital import add_capital
+from invest_assist.commands.create_portfolio import create_portfolio
+from invest_assist.commands.sell import sell
+from invest_assist.commands.update_risk import update_risk
+from invest_assist.models.portfolio import Portfolio
+from invest_assist.portfolio_journal import PortfolioJournal
+from tests.helpers import analysis_result
+
+
+def buy(portfolio: Portfolio, symbol: str, buying_price: float = 100):
+    return portfolio.buy_stock(
+        symbol=symbol,
+        current_price=buying_price,
+        buying_price=buying_price,
+        stop_loss=buying_price - 10,
+        buying_capacity=0.2,
+        strategy="FortyTwenty",
+        buying_date=date(2024, 5, 1),
+        hd=analysis_result(symbol),
+    )
+
+
+@pytest.fixture()
+def journal(tmp_path, portfolio: Portfolio):
+    journal = PortfolioJournal(tmp_path / "main", snapshot_every=3)
+    journal.create(portfolio)
+    return journal
+
+
+class TestPortfolioEvents:
+    def test_mutations_are_recorded(self, portfolio: Portfolio):
+        portfolio.update_capital(500)
+        holding = buy(portfolio, "INFY")
+        portfolio.update_stop_loss(holding, 95)
+        portfolio.update_stop_loss(holding, 95)
+        portfolio.update_current_price(holding, 110)
+        portfolio.sell_by_id(holding.id, None)
+
+        events = portfolio.take_events()
+
+        assert [event["kind"] for event in events] == [
+            "capital",
+            "buy",
+            "stop_loss",
+            "price",
+            "sell",
+        ]
+        assert portfolio.take_events() == []
+
+    def test_replay_matches(self, portfolio: Portfolio):
+        replayed = portfolio.model_copy(deep=True)
+        portfolio.update_risk(0.02)
+        buy(portfolio, "INFY")
+        buy(portfolio, "TCS", 200)
+        portfolio.update_current_price(portfolio.find_by_id(2), 230)
+        portfolio.sell_by_symbol("INFY", 120)
+
+        for event in portfolio.take_events():
+            replayed.apply_event(event)
+
+        assert replayed == portfolio
+        assert replayed.current_value() == portfolio.current_value()
+
+
+class TestPortfolioJournal:
+    def test_reads_snapshot_and_tail(self, journal: PortfolioJournal):
+        portfolio = journal.read()
+        buy(portfolio, "INFY")
+        portfolio.update_capital(1000)
+        journal.append(portfolio)
+
+        assert journal.snapshot()["events"] == 0
+        assert journal.read() == portfolio
+
+    def test_snapshots_every_few_events(self, journal: PortfolioJournal):
+        portfolio = journal.read()
+        for symbol in ["INFY", "TCS", "WIPRO", "HCLTECH"]:
+            buy(portfolio, symbol)
+            journal.append(portfolio)
+
+        snapshot, tail = journal.tail()
+
+        assert snapshot["events"] == 3
+        assert [event["holding"]["symbol"] for event in tail] == ["HCLTECH"]
+        assert journal.read() == portfolio
+
+    def test_history(self, journal: PortfolioJournal):
+        portfolio = journal.read()
+        portfolio.update_capital(1000)
+        journal.append(portfolio)
+        holding = buy(portfolio, "INFY")
+        journal.append(portfolio)
+        portfolio.sell_by_id(holding.id, 110)
+        journal.append(portfolio)
+
+        capitals = [state.capital for _, state in journal.history()]
+
+        assert capitals == [11000, 11000, 11000 + 10 * holding.units]
+
+    def test_missing_journal(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            PortfolioJournal(tmp_path / "nope").read()
+
+
+class TestCommandsWithJournal:
+    def test_commands_append(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PORTFOLIO_JOURNAL", str(tmp_path / "journal"))
+        monkeypatch.setenv("PORTFOLIO_HOME", str(tmp_path / "json"))
+        runner = CliRunner()
+
+        result = runner.invoke(
+            create_portfolio,
+            ["--portfolio-name", "main", "--capital", "1000", "--risk-percent", "0.1"],
+        )
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(add_capital, ["--portfolio", "main", "--amount", "500"])
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(update_risk, ["--portfolio", "main", "--new-risk", "0.05"])
+        assert result.exit_code == 0, result.output
+
+        journal = PortfolioJournal(tmp_path / "journal" / "main")
+        stored = journal.read()
+        assert (stored.capital, stored.cash_input, stored.risk_percent) == (1500, 1500, 0.05)
+        assert [event["kind"] for event in journal.tail()[1]] == ["capital", "risk"]
+        assert not (tmp_path / "json").exists()
+
+    def test_create_replaces_existing_journal(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PORTFOLIO_JOURNAL", str(tmp_path / "journal"))
+        runner = CliRunner()
+
+        for capital in ["1000", "5000"]:
+            result = runner.invoke(
+                create_portfolio,
+                ["--portfolio-name", "main", "--capital", capital, "--risk-percent", "0.1"],
+            )
+            assert result.exit_code == 0, result.output
+            result = runner.invoke(add_capital, ["--portfolio", "main", "--amount", "500"])
+            assert result.exit_code == 0, result.output
+
+        journal = PortfolioJournal(tmp_path / "journal" / "main")
+        assert journal.read().capital == 5500
+        assert [state.capital for _, state in journal.history()] == [5500]
+
+    def test_existing_json_is_journaled(self, tmp_path, monkeypatch, portfolio: Portfolio):
+        buy(portfolio, "RELIANCE")
+        portfolio.take_events()
+        (tmp_path / "main.json").write_text(portfolio.model_dump_json())
+        monkeypatch.setenv("PORTFOLIO_HOME", str(tmp_path))
+        monkeypatch.setenv("PORTFOLIO_JOURNAL", str(tmp_path / "journal"))
+        runner = CliRunner()
+
+        result = runner.invoke(
+            sell, ["--portfolio", "main", "--symbol", "RELIANCE", "--selling-price", "110"]
+        )
+        assert result.exit_code == 0, result.output
+
+        stored = PortfolioJournal(tmp_path / "journal" / "main").read()
+        assert stored.holdings[0].sold
+        assert stored.capital == portfolio.capital + 10 * portfolio.holdings[0].units
@@ -0,0 +1,149 @@
+import pytest
+from click.testing import CliRunner
+
+from invest_assist.commands.add_capital import add_capital
+from invest_assist.commands.create_portfolio import create_portfolio
+from invest_assist.commands.migrate_portfolios import migrate_portfolios
+from invest_assist.commands.sell import sell
+from invest_assist.models.portfolio import Holding, Portfolio
+from invest_assist.portfolio_store import PortfolioStore
+from tests.helpers import analysis_result, make_holding
+
+
+def holding(id: int, symbol: str, sold: bool = False) -> Holding:
+    # A non-default expectancy checks the analysis columns round trip.
+    return make_holding(
+        id,
+        symbol,
+        sold=sold,
+        selling_price=350 if sold else None,
+        historical_data=analysis_result(symbol, expectancy=0.3),
+    )
+
+
+@pytest.fixture()
+def portfolio():
+    return Portfolio(
+        current_id=3,
+        capital=3000,
+        risk_percent=0.1,
+        cash_input=2500,
+        holdings=[
+            holding(1, "RELIANCE", sold=True),
+            holding(2, "INFY"),
+            holding(3, "RELIANCE"),
+        ],
+    )
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return PortfolioStore(tmp_path / "portfolios.sqlite")
+
+
+class TestPortfolioStore:
+    def test_round_trip(self, store: PortfolioStore, portfolio: Portfolio):
+        store.write("main", portfolio)
+
+        assert store.read("main", include_sold=True) == portfolio
+        assert store.names() == ["main"]
+
+    def test_reads_active_holdings_only(self, store: PortfolioStore, portfolio: Portfolio):
+        store.write("main", portfolio)
+
+        active = store.read("main")
+
+        assert [h.id for h in active.holdings] == [2, 3]
+        assert active.invested() == portfolio.invested()
+        assert active.current_id == 3
+
+    def test_write_keeps_untouched_sold_holdings(
+        self, store: PortfolioStore, portfolio: Portfolio
+    ):
+        store.write("main", portfolio)
+
+        active = store.read("main")
+        active.sell_by_id(2, 400)
+        store.write("main", active)
+
+        everything = store.read("main", include_sold=True)
+        assert [(h.id, h.sold) for h in everything.holdings] == [
+            (1, True),
+            (2, True),
+            (3, False),
+        ]
+        assert everything.capital == 3000 + 4 * 70
+
+    def test_replace_drops_old_holdings(self, store: PortfolioStore, portfolio: Portfolio):
+        store.write("main", portfolio)
+        fresh = Portfolio(capital=5000, risk_percent=0.1, holdings=[holding(1, "TCS")])
+
+        store.replace("main", fresh)
+
+        assert store.read("main", include_sold=True) == fresh
+
+    def test_missing_portfolio(self, store: PortfolioStore):
+        with pytest.raises(FileNotFoundError):
+            store.read("nope")
+
+
+class TestCommandsWithStore:
+    def test_commands_use_database(self, tmp_path, monkeypatch):
+        db = tmp_path / "portfolios.sqlite"
+        monkeypatch.setenv("PORTFOLIO_DB", str(db))
+        monkeypatch.setenv("PORTFOLIO_HOME", str(tmp_path / "json"))
+        runner = CliRunner()
+
+        result = runner.invoke(
+            create_portfolio,
+            ["--portfolio-name", "main", "--capital", "1000", "--risk-percent", "0.1"],
+        )
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(add_capital, ["--portfolio", "main", "--amount", "500"])
+        assert result.exit_code == 0, result.output
+
+        stored = PortfolioStore(db).read("main")
+        assert (stored.capital, stored.cash_input) == (1500, 1500)
+        assert not (tmp_path / "json").exists()
+
+    def test_create_replaces_existing_portfolio(self, tmp_path, monkeypatch, portfolio):
+        db = tmp_path / "portfolios.sqlite"
+        PortfolioStore(db).write("main", portfolio)
+        monkeypatch.setenv("PORTFOLIO_DB", str(db))
+
+        result = CliRunner().invoke(
+            create_portfolio,
+            ["--portfolio-name", "main", "--capital", "5000", "--risk-percent", "0.1"],
+        )
+        assert result.exit_code == 0, result.output
+
+        stored = PortfolioStore(db).read("main", include_sold=True)
+        assert (stored.capital, stored.holdings) == (5000, [])
+
+    def test_migration_then_sell(self, tmp_path, monkeypatch, portfolio: Portfolio):
+        (tmp_path / "main.json").write_text(portfolio.model_dump_json())
+        db = tmp_path / "portfolios.sqlite"
+        monkeypatch.setenv("PORTFOLIO_HOME", str(tmp_path))
+        runner = CliRunner()
+
+        result = runner.invoke(migrate_portfolios, ["--db", str(db)])
+        assert result.exit_code == 0, result.output
+        assert "Imported main with 3 holdings" in result.output
+        assert PortfolioStore(db).read("main", include_sold=True) == portfolio
+
+        result = runner.invoke(migrate_portfolios, ["--db", str(db)])
+        assert "Skipped main" in result.output
+
+        trimmed = Portfolio(**{**portfolio.model_dump(), "holdings": portfolio.holdings[::2]})
+        (tmp_path / "main.json").write_text(trimmed.model_dump_json())
+        result = runner.invoke(migrate_portfolios, ["--db", str(db), "--overwrite"])
+        assert "Imported main with 2 holdings" in result.output
+        assert PortfolioStore(db).read("main", include_sold=True) == trimmed
+
+        monkeypatch.setenv("PORTFOLIO_DB", str(db))
+        result = runner.invoke(sell, ["--portfolio", "main", "--symbol", "RELIANCE"])
+        assert result.exit_code == 0, result.output
+
+        stored = PortfolioStore(db).read("main", include_sold=True)
+        assert [(h.id, h.sold) for h in stored.holdings] == [(1, True), (3, True)]
+        assert stored.holdings[0].selling_price == 350
@@ -0,0 +1,69 @@
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.shared_history import SharedHistory
+from invest_assist.strategies import FindHighLow
+
+
+def prices(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), 1)
+    df = pd.DataFrame(
+        {
+            "DATE": pd.bdate_range("2020-01-01", periods=n),
+            "SERIES": "EQ",
+            "HIGH": close * 1.01,
+            "LOW": close * 0.99,
+            "LTP": close,
+        }
+    )
+    return df[::-1].reset_index(drop=True)
+
+
+@pytest.fixture()
+def historical_data():
+    return {"REL": prices(1, 300), "TCS": prices(2, 200)}
+
+
+@pytest.fixture()
+def history(tmp_path, historical_data):
+    return SharedHistory.pack(historical_data, str(tmp_path))
+
+
+class TestSharedHistory:
+    def test_reads_like_a_dict_of_frames(self, history: SharedHistory, historical_data):
+        assert list(history.keys()) == ["REL", "TCS"]
+        for symbol, df in historical_data.items():
+            expected = df[["DATE", "HIGH", "LOW", "LTP"]]
+            pd.testing.assert_frame_equal(
+                history[symbol][expected.columns], expected, check_dtype=False
+            )
+
+    def test_pickles_without_the_data(self, history: SharedHistory):
+        payload = pickle.dumps(history)
+        assert len(payload) < 1000
+
+        attached = pickle.loads(payload)
+        pd.testing.assert_frame_equal(attached["TCS"], history["TCS"])
+
+    def test_find_high_low_trades_are_unchanged(
+        self, history: SharedHistory, historical_data
+    ):
+        expected = FindHighLow(historical_data["REL"], 20, 10).execute()
+        assert FindHighLow(history["REL"], 20, 10).execute() == expected
+
+    def test_rows_differing_outside_prices_match_the_full_frame(self, tmp_path):
+        df = prices(3, 300)
+        # Bars repeated under another series and bars missing a non-price value.
+        repeated = df.iloc[::10].assign(SERIES="BE")
+        df = pd.concat([df, repeated]).sort_values("DATE", ascending=False, kind="stable")
+        df = df.reset_index(drop=True)
+        df.loc[df.index[::7], "SERIES"] = None
+
+        history = SharedHistory.pack({"REL": df}, str(tmp_path))
+
+        for high, low in [(20, 10), (10, 20), (55, 5)]:
+            expected = FindHighLow(df, high, low).execute()
+            assert FindHighLow(history["REL"], high, low).execute() == expected
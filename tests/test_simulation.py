@@ -0,0 +1,42 @@
+import numpy as np
+
+from invest_assist.strategies.simulation import simulate_trailing_stop
+
+
+class TestSimulateTrailingStop:
+    def test_trails_stop_and_sells_when_low_hits_it(self):
+        buy_signals = np.array([True, False, False, False, True, False])
+        low = np.array([10.0, 11.0, 12.0, 11.5, 13.0, 14.0])
+        stop_line = np.array([9.0, 10.0, 11.5, 11.0, 12.0, 13.0])
+        ltp = np.array([10.5, 11.5, 12.5, 12.0, 13.5, 14.5])
+
+        entries, exits, selling_prices = simulate_trailing_stop(
+            buy_signals, low, stop_line, ltp
+        )
+
+        assert entries.tolist() == [0, 4]
+        assert exits.tolist() == [3, 5]
+        assert selling_prices.tolist() == [11.5, 14.5]
+
+    def test_no_buy_signal(self):
+        entries, exits, selling_prices = simulate_trailing_stop(
+            np.zeros(3, dtype=bool), np.ones(3), np.ones(3), np.ones(3)
+        )
+
+        assert len(entries) == len(exits) == len(selling_prices) == 0
+
+    def test_long_trade_spans_multiple_scan_windows(self):
+        n = 500
+        buy_signals = np.zeros(n, dtype=bool)
+        buy_signals[0] = True
+        low = np.arange(n, dtype=np.float64) + 10
+        stop_line = np.arange(n, dtype=np.float64)
+        low[400] = 398.0
+
+        entries, exits, selling_prices = simulate_trailing_stop(
+            buy_signals, low, stop_line, low
+        )
+
+        assert entries.tolist() == [0]
+        assert exits.tolist() == [400]
+        assert selling_prices.tolist() == [400.0]
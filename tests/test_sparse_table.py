@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.strategies import FindHighLow, HighLowIndex
+from invest_assist.strategies.sparse_table import SparseTable
+
+
+@pytest.fixture()
+def values():
+    return np.random.default_rng(3).normal(100, 10, 257)
+
+
+class TestSparseTable:
+    @pytest.mark.parametrize("window", [1, 2, 3, 7, 8, 64, 100, 257, 300])
+    def test_rolling_matches_pandas(self, values: np.ndarray, window: int):
+        series = pd.Series(values)
+
+        np.testing.assert_array_equal(
+            SparseTable(values, np.maximum).rolling(window),
+            series.rolling(window).max().to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            SparseTable(values, np.minimum).rolling(window),
+            series.rolling(window).min().to_numpy(),
+        )
+
+    def test_query(self, values: np.ndarray):
+        table = SparseTable(values, np.maximum)
+
+        assert table.query(99, 40) == values[60:100].max()
+        assert table.query(0, 1) == values[0]
+
+
+class TestHighLowIndex:
+    def test_find_high_low_trades_are_unchanged(self, values: np.ndarray):
+        df = pd.DataFrame(
+            {
+                "DATE": pd.bdate_range("2020-01-01", periods=len(values)),
+                "HIGH": values * 1.01,
+                "LOW": values * 0.99,
+                "LTP": values,
+            }
+        )[::-1]
+        df = pd.concat([df[:10], df[5:10], df[10:]]).reset_index(drop=True)
+        index = HighLowIndex(df)
+
+        for high, low in [(20, 10), (5, 50), (1, 1)]:
+            expected = FindHighLow(df, high, low)
+            actual = FindHighLow(df, high, low, index)
+
+            assert actual.execute() == expected.execute()
+            pd.testing.assert_frame_equal(actual.df, expected.df)
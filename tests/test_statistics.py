@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from invest_assist.CummulativeAnalyzer import CumulativeAnalyzer
+from invest_assist.models import HighLowTradesAnalysisResult
+from invest_assist.statistics import MAX_RATIO, max_drawdown, trade_statistics
+
+
+class TestTradeStatistics:
+    def test_statistics(self):
+        returns = np.array([0.1, -0.05, 0.2, -0.1, 0.05])
+
+        statistics = trade_statistics(returns, compounded=True)
+
+        assert statistics["median_returns"] == 0.05
+        assert statistics["profit_factor"] == round(0.35 / 0.15, 2)
+        # (0.35 - 0.15) / 5 per trade over an average loss of 0.075.
+        assert statistics["expectancy"] == round(0.04 / 0.075, 2)
+        assert statistics["max_drawdown"] == round(1 - 1.32 * 0.9 / 1.32, 2)
+
+    def test_drawdown(self):
+        returns = np.array([1.0, 2.0, -1.5, -1.0, 3.0, -0.5])
+
+        assert max_drawdown(returns, compounded=False) == 2.5
+        assert max_drawdown(np.array([0.5, 0.5]), compounded=True) == 0
+        assert max_drawdown(np.array([-0.5, 1.0, -0.5]), compounded=True) == 0.5
+
+    def test_no_losses(self):
+        statistics = trade_statistics(np.array([0.1, 0.2]), compounded=True)
+
+        assert statistics["profit_factor"] == MAX_RATIO
+        assert statistics["expectancy"] == MAX_RATIO
+
+    def test_no_trades(self):
+        assert set(trade_statistics(np.array([]), compounded=False).values()) == {0}
+
+
+class TestCumulativeAnalyzer:
+    @pytest.fixture()
+    def results(self):
+        rng = np.random.default_rng(2)
+        return [
+            HighLowTradesAnalysisResult(
+                total_trades=int(rng.integers(10, 40)),
+                profitable_trades=round(rng.uniform(), 2),
+                days=round(rng.uniform(1, 30), 2),
+                returns=round(rng.normal(), 2),
+                returns_on_risk=round(rng.normal(), 2),
+                risk_on_investment=round(rng.uniform(), 2),
+                median_returns=round(rng.normal(), 2),
+            )
+            for _ in range(50)
+        ]
+
+    def test_averages_symbols_with_enough_trades(self, results):
+        valid = [result for result in results if result.total_trades >= 20]
+
+        result = CumulativeAnalyzer(results, "20-10").analyse()
+
+        assert result.type == "20-10"
+        assert result.total_trades == sum(r.total_trades for r in valid)
+        assert result.returns == round(sum(r.returns for r in valid) / len(valid), 2)
+        assert result.days == round(sum(r.days for r in valid) / len(valid), 2)
+        assert result.median_returns == round(
+            float(np.median([r.median_returns for r in valid])), 2
+        )
+
+    def test_capped_ratios_dont_swamp_the_pair(self):
+        results = [
+            HighLowTradesAnalysisResult(total_trades=25, profit_factor=1.2, expectancy=0.2),
+            HighLowTradesAnalysisResult(total_trades=25, profit_factor=1.5, expectancy=0.4),
+            HighLowTradesAnalysisResult(total_trades=25, profit_factor=0.8, expectancy=-0.1),
+            HighLowTradesAnalysisResult(
+                total_trades=25, profit_factor=MAX_RATIO, expectancy=MAX_RATIO
+            ),
+        ]
+
+        result = CumulativeAnalyzer(results, "20-10").analyse()
+
+        assert result.profit_factor == 1.35
+        assert result.expectancy == 0.3
+
+    def test_columns_give_the_same_result(self, results):
+        columns = {
+            field: np.array([getattr(result, field) for result in results], dtype=float)
+            for field in HighLowTradesAnalysisResult.model_fields
+        }
+
+        assert (
+            CumulativeAnalyzer(columns, "20-10").analyse()
+            == CumulativeAnalyzer(results, "20-10").analyse()
+        )
+
+    def test_no_valid_symbols(self):
+        assert CumulativeAnalyzer([], "20-10").analyse().total_trades == 0
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+from click.utils import make_default_short_help
+
+from invest_assist.commands import stock
+from invest_assist.commands.stock import subcommands
+
+
+HEAVY_MODULES = ["pandas", "numpy", "scipy", "jugaad_data", "requests"]
+
+
+def imported_heavy_modules(commands, args=None):
+    script = "\n".join(
+        ["import contextlib, io, sys", "from invest_assist.commands import stock"]
+        + [f"stock.get_command(None, {name!r})" for name in commands]
+        + (
+            [
+                "with contextlib.redirect_stdout(io.StringIO()):",
+                f"    stock.main({args!r}, standalone_mode=False)",
+            ]
+            if args is not None
+            else []
+        )
+        + [f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return output.stdout.split()
+
+
+class TestStock:
+    def test_every_subcommand_resolves_to_its_name(self):
+        for name in subcommands:
+            assert stock.get_command(None, name).name == name
+
+    def test_unknown_subcommand(self):
+        assert stock.get_command(None, "nope") is None
+
+    def test_short_help_matches_the_commands(self):
+        for name, (_, _, short_help) in subcommands.items():
+            command = stock.get_command(None, name)
+            assert make_default_short_help(command.help) == make_default_short_help(
+                short_help
+            )
+
+    def test_group_import_is_light(self):
+        assert imported_heavy_modules([]) == []
+        assert imported_heavy_modules([], ["--help"]) == []
+
+    def test_portfolio_commands_are_light(self):
+        commands = [
+            "list-portfolios",
+            "update-risk",
+            "describe",
+            "create-portfolio",
+            "add-capital",
+            "sell",
+        ]
+
+        assert imported_heavy_modules(commands) == []
@@ -0,0 +1,148 @@
+import concurrent.futures
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from invest_assist.commands import find_high_low
+from invest_assist.models import HighLowTradesAnalysisResult
+from invest_assist.sweep import SweepStore
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = SweepStore(str(tmp_path / "sweep.db"))
+    store.add_cells([(20, 10), (30, 5), (40, 20)])
+    return store
+
+
+@pytest.fixture()
+def result():
+    return HighLowTradesAnalysisResult(
+        total_trades=25,
+        profitable_trades=0.4,
+        days=12.5,
+        returns=0.03,
+        returns_on_risk=0.5,
+        risk_on_investment=0.06,
+    )
+
+
+class TestSweepStore:
+    def test_pending_cells_in_insertion_order(self, store: SweepStore):
+        assert store.pending_cells(["REL"], 2) == [(20, 10), (30, 5)]
+
+    def test_cells_are_pending_for_symbols_without_results(self, store: SweepStore, result):
+        store.save("REL", {"20-10": [result], "10-20": [result]})
+        store.add_cells([(20, 10)])
+
+        assert store.pending_cells(["REL"], 10) == [(30, 5), (40, 20)]
+        assert store.pending_cells(["REL", "TCS"], 10) == [(20, 10), (30, 5), (40, 20)]
+
+    def test_saved_symbols_are_not_pending(self, store: SweepStore, result):
+        store.save("REL", {"20-10": [result], "10-20": [result], "30-5": [result]})
+
+        assert store.pending_for_symbol("REL", [(20, 10), (30, 5)]) == [(30, 5)]
+        assert store.pending_for_symbol("TCS", [(20, 10)]) == [(20, 10)]
+
+    def test_results_survive_reopening(self, store: SweepStore, result, tmp_path):
+        store.save("REL", {"20-10": [result]})
+
+        reopened = SweepStore(str(tmp_path / "sweep.db"))
+
+        assert reopened.results("20-10") == [result]
+        assert reopened.pending_cells(["REL"], 10) == [(20, 10), (30, 5), (40, 20)]
+
+    def test_result_columns(self, store: SweepStore, result):
+        store.save("REL", {"20-10": [result]})
+        store.save("TCS", {"20-10": [result]})
+
+        columns = store.result_columns("20-10")
+
+        assert columns["total_trades"].tolist() == [25, 25]
+        assert columns["returns"].tolist() == [0.03, 0.03]
+        assert store.result_columns("30-5")["returns"].tolist() == []
+        assert store.result_columns("20-10", ["TCS", "INFY"])["total_trades"].tolist() == [25]
+
+    def test_complete_cells(self, store: SweepStore, result):
+        store.save("REL", {"20-10": [result], "10-20": [result], "30-5": [result]})
+        store.save("TCS", {"20-10": [result], "10-20": [result]})
+
+        assert store.complete_cells(["REL", "TCS"], [(20, 10), (30, 5)]) == [(20, 10)]
+        assert store.pending_cells(["REL", "TCS"], 2, {(20, 10)}) == [(30, 5), (40, 20)]
+
+
+    def test_old_tables_gain_new_fields(self, tmp_path, result):
+        path = str(tmp_path / "old.db")
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE results (type TEXT NOT NULL, symbol TEXT NOT NULL, "
+            "total_trades REAL NOT NULL, PRIMARY KEY (type, symbol))"
+        )
+        connection.execute("INSERT INTO results VALUES ('20-10', 'REL', 30)")
+        connection.commit()
+        connection.close()
+
+        store = SweepStore(path)
+        store.save("TCS", {"20-10": [result]})
+
+        assert [r.total_trades for r in store.results("20-10")] == [30, 25]
+
+
+@pytest.fixture()
+def bars():
+    return pd.DataFrame(
+        {"DATE": pd.bdate_range("2024-01-01", periods=3), "HIGH": 2.0, "LOW": 1.0, "LTP": 1.5}
+    )
+
+
+class TestRunSweep:
+    @pytest.fixture()
+    def analyzed(self, result, monkeypatch):
+        """Symbols analysed by the stand-in worker, which fails for BAD."""
+
+        analyzed = []
+
+        def analyze(symbol, cells):
+            analyzed.append(symbol)
+            if symbol == "BAD":
+                raise ValueError("no data")
+            return {
+                key: [result]
+                for high, low in cells
+                for key in [f"{high}-{low}", f"{low}-{high}"]
+            }
+
+        monkeypatch.setattr(find_high_low, "analyze_shared_symbol", analyze)
+        monkeypatch.setattr(
+            concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor
+        )
+        return analyzed
+
+    def test_failed_symbols_leave_cells_pending(self, store: SweepStore, analyzed, bars):
+        completed = find_high_low.run_sweep(
+            {"REL": bars}, store, max_cells=2, minutes=None, batch_size=1
+        )
+        assert completed == [(20, 10), (30, 5)]
+
+        completed = find_high_low.run_sweep(
+            {"REL": bars, "BAD": bars}, store, max_cells=10, minutes=None, batch_size=1
+        )
+        assert completed == []
+        assert store.pending_cells(["REL", "BAD"], 10) == [(20, 10), (30, 5), (40, 20)]
+        assert store.pending_cells(["REL"], 10) == []
+
+    def test_growing_the_universe_runs_the_new_symbols(
+        self, store: SweepStore, analyzed, bars
+    ):
+        find_high_low.run_sweep({"REL": bars, "TCS": bars}, store, 10, None)
+        analyzed.clear()
+
+        completed = find_high_low.run_sweep(
+            {"REL": bars, "TCS": bars, "INFY": bars}, store, 10, None
+        )
+
+        assert completed == [(20, 10), (30, 5), (40, 20)]
+        assert analyzed == ["INFY"]
+        assert store.pending_for_symbol("INFY", completed) == []
+        assert len(store.result_columns("20-10", ["REL", "TCS", "INFY"])["returns"]) == 3
@@ -0,0 +1,74 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.analyzer import Analyzer
+from invest_assist.HighLowAnalyzer import HighLowAnalyzer
+from invest_assist.models import Portfolio
+from invest_assist.strategies import FindHighLow, FortyTwenty, MovingAverage
+from invest_assist.trade import Trade
+from invest_assist.trade_ledger import TradeLedger
+from tests.helpers import random_walk
+
+
+class TestTradeLedger:
+    def test_views_round_trip(self):
+        trade = Trade(buy_price=100, start_date=date(2024, 1, 1), initial_stop_loss=90)
+        trade.update_stop_loss(95)
+        trade.sell(date(2024, 1, 11))
+
+        ledger = TradeLedger.from_trades([trade, trade])
+
+        assert len(ledger) == 2
+        assert ledger[1] == trade
+        assert list(ledger) == [trade, trade]
+        np.testing.assert_array_equal(ledger.days(), [10, 10])
+        np.testing.assert_allclose(ledger.returns_on_risk(), [-0.5, -0.5])
+
+    def test_strategy_views_keep_timestamps(self):
+        trades = FortyTwenty(random_walk(1, 800, spread=3)).execute()
+
+        assert len(trades) > 0
+        assert all(isinstance(trade.start_date, pd.Timestamp) for trade in trades)
+        assert all(isinstance(trade.buy_price, float) for trade in trades)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_analyse_matches_trade_by_trade(self, portfolio: Portfolio, seed: int):
+        df = random_walk(seed, 800, spread=3)
+        for strategy in [FortyTwenty, MovingAverage]:
+            analyzer = Analyzer("REL", portfolio, strategy, 365, lambda **_: df)
+            trade_analysis = [
+                analyzer.get_trade_analysis(trade) for trade in strategy(df).execute()
+            ]
+
+            result = analyzer.analyse()
+
+            assert result.total_trades == len(trade_analysis)
+            assert result.returns == analyzer.avg_return(trade_analysis)
+            assert result.days_per_return == analyzer.avg_days(trade_analysis)
+            assert result.winning_percentage == round(
+                len(analyzer.profitable_trades(trade_analysis)) / len(trade_analysis), 2
+            )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_high_low_analysis_matches_trade_by_trade(self, seed: int):
+        trades = FindHighLow(random_walk(seed, 800, spread=3), 20, 10).execute()
+        total = len(trades)
+
+        result = HighLowAnalyzer(FindHighLow(random_walk(seed, 800, spread=3), 20, 10).ledger()).analyze()
+
+        assert result == HighLowAnalyzer(trades).analyze()
+        assert result.total_trades == total
+        assert result.returns == round(sum(trade.returns() for trade in trades) / total, 2)
+        assert result.returns_on_risk == round(
+            sum(trade.returns_on_risk() for trade in trades) / total, 2
+        )
+        assert result.days == round(sum(trade.days() for trade in trades) / total, 2)
+        assert result.risk_on_investment == round(
+            sum(trade.risk_on_investment() for trade in trades) / total, 2
+        )
+        assert result.profitable_trades == round(
+            sum(trade.returns() > 0 for trade in trades) / total, 2
+        )
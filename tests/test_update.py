@@ -0,0 +1,95 @@
+from collections import Counter
+from datetime import date
+import threading
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from invest_assist.commands import market
+from invest_assist.commands.update import update
+from invest_assist.models.portfolio import Holding, Portfolio
+from invest_assist.strategies import FortyTwenty, MovingAverage
+from tests.helpers import make_holding
+
+
+def holding(id: int, symbol: str, strategy: str) -> Holding:
+    return make_holding(
+        id, symbol, strategy=strategy, current_price=100, buying_price=100, stop_loss=1
+    )
+
+
+def history(symbol: str) -> pd.DataFrame:
+    base = len(symbol) * 10
+    rows = [
+        [date(2024, 1, 1) + pd.Timedelta(days=i), base + i, base + i + 2, base + i - 2]
+        for i in range(150)
+    ]
+    df = pd.DataFrame(rows, columns=["DATE", "LTP", "HIGH", "LOW"])
+    df["OPEN"] = df["LTP"]
+    df["CLOSE"] = df["LTP"]
+    return df[::-1].reset_index(drop=True)
+
+
+@pytest.fixture()
+def calls(monkeypatch):
+    calls = Counter()
+    lock = threading.Lock()
+
+    def get_historical_data(symbol, days):
+        with lock:
+            calls[("history", symbol)] += 1
+        return history(symbol)
+
+    def get_current_price(symbol):
+        with lock:
+            calls[("quote", symbol)] += 1
+        if symbol == "GONE":
+            raise ConnectionError(symbol)
+        return len(symbol) * 100
+
+    monkeypatch.setattr(market, "get_historical_data", get_historical_data)
+    monkeypatch.setattr(market, "get_current_price", get_current_price)
+    return calls
+
+
+class TestUpdate:
+    def test_refreshes_each_symbol_once(self, calls, tmp_path, monkeypatch):
+        monkeypatch.setenv("PORTFOLIO_HOME", str(tmp_path))
+        portfolio = Portfolio(
+            current_id=4,
+            capital=3000,
+            risk_percent=0.1,
+            holdings=[
+                holding(1, "INFY", "FortyTwenty"),
+                holding(2, "INFY", "FortyTwenty"),
+                holding(3, "INFY", "MovingAverage"),
+                holding(4, "TCS", "FortyTwenty"),
+                holding(5, "GONE", "FortyTwenty"),
+            ],
+        )
+        path = tmp_path / "main.json"
+        path.write_text(portfolio.model_dump_json())
+
+        result = CliRunner(mix_stderr=False).invoke(
+            update, ["--portfolio", "main", "--workers", "4"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Couldn't update GONE" in result.stderr
+        assert all(count == 1 for count in calls.values())
+        assert sorted(symbol for kind, symbol in calls if kind == "history") == [
+            "GONE",
+            "INFY",
+            "TCS",
+        ]
+
+        updated = Portfolio.model_validate_json(path.read_text())
+        infy = history("INFY")
+        assert [h.stop_loss for h in updated.holdings] == [
+            FortyTwenty(infy).get_stop_loss(),
+            FortyTwenty(infy).get_stop_loss(),
+            MovingAverage(infy).get_stop_loss(),
+            FortyTwenty(history("TCS")).get_stop_loss(),
+            1,
+        ]
+        assert [h.current_price for h in updated.holdings] == [400, 400, 400, 300, 100]
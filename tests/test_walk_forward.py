@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from invest_assist.HighLowAnalyzer import HighLowAnalyzer
+from invest_assist.strategies import FindHighLow, HighLowIndex
+from invest_assist.walk_forward import WalkForward
+
+
+PAIRS = [(20, 10), (10, 20), (40, 5), (5, 40)]
+
+
+@pytest.fixture()
+def df():
+    rng = np.random.default_rng(8)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, 1200)))
+    return pd.DataFrame(
+        {
+            "DATE": pd.bdate_range("2015-01-01", periods=len(close)),
+            "HIGH": close * 1.01,
+            "LOW": close * 0.99,
+            "LTP": close,
+        }
+    )[::-1].reset_index(drop=True)
+
+
+@pytest.fixture()
+def walk_forward(df: pd.DataFrame):
+    return WalkForward(HighLowIndex(df), PAIRS, train_days=500, test_days=200)
+
+
+class TestWalkForward:
+    def test_folds_roll_by_the_test_window(self, walk_forward: WalkForward):
+        assert walk_forward.folds() == [
+            (slice(0, 500), slice(500, 700)),
+            (slice(200, 700), slice(700, 900)),
+            (slice(400, 900), slice(900, 1100)),
+        ]
+
+    def test_whole_history_matches_find_high_low(
+        self, df: pd.DataFrame, walk_forward: WalkForward
+    ):
+        for high, low in PAIRS:
+            current_high, current_low = walk_forward.indicators(high, low)
+            expected = HighLowAnalyzer(FindHighLow(df, high, low).execute()).analyze()
+
+            assert walk_forward.score(current_high, current_low, slice(0, len(df))) == expected
+
+    def test_picks_the_best_train_pair(self, walk_forward: WalkForward):
+        results = walk_forward.run("REL")
+
+        assert len(results) == 3
+        for result, (train, test) in zip(results, walk_forward.folds()):
+            scores = {
+                pair: walk_forward.score(*walk_forward.indicators(*pair), train)
+                for pair in PAIRS
+            }
+            best = max(
+                (pair for pair in PAIRS if scores[pair].total_trades >= 5),
+                key=lambda pair: scores[pair].returns,
+            )
+
+            assert (result.high, result.low) == best
+            assert result.in_sample == scores[best]
+            assert result.test_from == walk_forward.dates[test.start]
+            assert result.test_to == walk_forward.dates[test.stop - 1]
+
+    def test_out_of_sample_trades_stay_in_the_test_window(self, walk_forward: WalkForward):
+        current_high, current_low = walk_forward.indicators(20, 10)
+        test = slice(700, 900)
+
+        ledger = walk_forward.ledger(current_high, current_low, test)
+
+        assert len(ledger) > 0
+        assert ledger.start_date.min() >= walk_forward.dates[700]
+        assert ledger.selling_date.max() <= walk_forward.dates[899]
+
+    def test_short_history_has_no_folds(self, df: pd.DataFrame):
+        walk_forward = WalkForward(HighLowIndex(df[:600]), PAIRS, 500, 200)
+
+        assert walk_forward.run("REL") == []
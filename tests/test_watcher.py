@@ -0,0 +1,118 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from invest_assist.quotes import RecordedQuotes, ReplayQuotes, price_info, read_recorded_quotes
+from invest_assist.strategies.indicators import ChannelBreakoutState
+from invest_assist.watcher import Watcher
+
+
+QUOTES_PATH = Path(__file__).parent.parent / "quotes.json"
+
+
+def equity_quote(symbol: str, price: float, high: float, low: float) -> dict:
+    return {
+        "info": {"symbol": symbol},
+        "priceInfo": {
+            "lastPrice": price,
+            "open": price,
+            "intraDayHighLow": {"max": high, "min": low},
+        },
+    }
+
+
+def channel(high: float, low: float) -> ChannelBreakoutState:
+    state = ChannelBreakoutState(high_days=2, low_days=2)
+    state.add_bar({"HIGH": high, "LOW": low})
+    state.add_bar({"HIGH": high - 1, "LOW": low + 1})
+    return state
+
+
+@pytest.fixture()
+def recording(tmp_path: Path) -> Path:
+    path = tmp_path / "quotes.jsonl"
+    quotes = [
+        equity_quote("REL", 100, 101, 99),
+        equity_quote("TCS", 50, 51, 49),
+        equity_quote("REL", 104, 104, 100),
+        equity_quote("TCS", 50, 56, 49),
+        equity_quote("REL", 110, 110, 100),
+    ]
+    path.write_text("\n".join(json.dumps(quote) for quote in quotes))
+    return path
+
+
+class TestQuotes:
+    def test_fno_quote_uses_underlying_value(self):
+        symbol, info = price_info(read_recorded_quotes(QUOTES_PATH)[0])
+
+        assert symbol == "RELIANCE"
+        assert info == {
+            "lastPrice": 3034.4,
+            "open": 3034.4,
+            "intraDayHighLow": {"max": 3034.4, "min": 3034.4},
+        }
+
+    def test_replay_plays_each_symbol_in_order(self, recording: Path):
+        source = ReplayQuotes(recording)
+
+        quotes, _ = source.fetch(["REL"])
+        assert quotes["REL"]["priceInfo"]["lastPrice"] == 100
+        quotes, _ = source.fetch(["REL", "TCS"])
+        assert quotes["REL"]["priceInfo"]["lastPrice"] == 104
+        assert quotes["TCS"]["priceInfo"]["lastPrice"] == 50
+        assert not source.exhausted(["REL", "TCS"])
+        source.fetch(["REL", "TCS"])
+        assert source.exhausted(["REL", "TCS"])
+
+    def test_recorded_quotes_replay(self, recording: Path, tmp_path: Path):
+        copy = tmp_path / "copy.jsonl"
+        source = RecordedQuotes(ReplayQuotes(recording), copy)
+        while not source.exhausted(["REL", "TCS"]):
+            source.fetch(["REL", "TCS"])
+
+        assert sorted(map(json.dumps, read_recorded_quotes(copy))) == sorted(
+            map(json.dumps, read_recorded_quotes(recording))
+        )
+
+
+class TestWatcher:
+    def test_reports_breakouts_once(self, recording: Path):
+        states = {"REL": channel(105, 95), "TCS": channel(55, 45)}
+        watcher = Watcher(["REL", "TCS"], "FortyTwenty", ReplayQuotes(recording), states.get)
+        events = []
+
+        watcher.run(0, events.append)
+
+        assert [(event.symbol, event.price, event.high) for event in events] == [
+            ("TCS", 50, 56),
+            ("REL", 110, 110),
+        ]
+
+    def test_session_high_carries_over_polls(self, tmp_path: Path):
+        path = tmp_path / "quotes.jsonl"
+        quotes = [equity_quote("REL", 106, 106, 100), equity_quote("REL", 103, 103, 100)]
+        path.write_text("\n".join(json.dumps(quote) for quote in quotes))
+        state = channel(107, 95)
+        watcher = Watcher(["REL"], "FortyTwenty", ReplayQuotes(path), lambda _: state)
+
+        watcher.poll()
+
+        assert watcher.sessions["REL"]["intraDayHighLow"] == {"max": 106, "min": 100}
+        watcher.poll()
+        assert watcher.sessions["REL"]["intraDayHighLow"] == {"max": 106, "min": 100}
+        assert watcher.sessions["REL"]["lastPrice"] == 103
+
+    def test_state_errors_are_isolated(self, recording: Path):
+        def live_state(symbol):
+            if symbol == "TCS":
+                raise KeyError(symbol)
+            return channel(105, 95)
+
+        watcher = Watcher(["REL", "TCS"], "FortyTwenty", ReplayQuotes(recording), live_state)
+        events, errors = watcher.poll()
+
+        assert events == []
+        assert list(errors) == ["TCS"]
+        assert list(watcher.states) == ["REL"]